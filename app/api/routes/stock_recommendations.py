@@ -511,7 +511,8 @@ async def get_stock_recommendation_history(
 @router.get("/mongodb/recommendations/range", response_model=dict)
 async def get_recommended_stocks_by_date_range(
     start_date: str,
-    end_date: str = None
+    end_date: str = None,
+    top_n: int = Query(50, ge=1, description="가장 많이 추천된 종목 중 반환할 상위 종목 수")
 ):
     """
     📊 날짜 범위별 추천 종목 집계 (통계 분석용)
@@ -530,6 +531,7 @@ async def get_recommended_stocks_by_date_range(
     **Parameters:**
     - `start_date`: 시작 날짜 (YYYY-MM-DD 형식, 필수)
     - `end_date`: 종료 날짜 (YYYY-MM-DD 형식, 선택, 기본값: 오늘)
+    - `top_n`: `most_recommended_tickers`에 포함할 상위 종목 수 (선택, 기본값: 50)
     
     **Returns:**
     ```json
@@ -568,7 +570,8 @@ async def get_recommended_stocks_by_date_range(
         service = get_service()
         result = service.get_recommended_stocks_by_date_range_from_mongodb(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            top_n=top_n
         )
         return result
     except Exception as e:
@@ -578,7 +581,10 @@ async def get_recommended_stocks_by_date_range(
         raise HTTPException(status_code=500, detail=f"MongoDB 날짜 범위별 집계 중 오류 발생: {str(e)}")
 
 @router.get("/mongodb/sync/{date}", response_model=dict)
-async def verify_mongodb_sync(date: str):
+async def verify_mongodb_sync(
+    date: str,
+    verbose: bool = Query(True, description="True이면 티커 목록 포함, False이면 개수만 반환")
+):
     """
     🔄 MongoDB 컬렉션 동기화 상태 확인 (모니터링용)
     
@@ -594,6 +600,7 @@ async def verify_mongodb_sync(date: str):
     
     **Parameters:**
     - `date`: 확인할 날짜 (YYYY-MM-DD 형식)
+    - `verbose`: 티커 목록 포함 여부 (선택, 기본값: true). false이면 `details`에 개수만 반환
     
     **Returns:**
     ```json
@@ -622,11 +629,14 @@ async def verify_mongodb_sync(date: str):
     ```bash
     # 오늘 날짜 동기화 확인
     GET /stocks/mongodb/sync/2025-12-12
+    
+    # 개수만 확인
+    GET /stocks/mongodb/sync/2025-12-12?verbose=false
     ```
     """
     try:
         service = get_service()
-        result = service.verify_mongodb_sync(date)
+        result = service.verify_mongodb_sync(date, verbose=verbose)
         return result
     except Exception as e:
         logger.error(f"MongoDB 동기화 확인 중 오류 발생: {str(e)}")
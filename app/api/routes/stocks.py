@@ -4,6 +4,7 @@ from datetime import datetime
 from pymongo.errors import DuplicateKeyError
 from app.db.mongodb import get_db
 from app.schemas.stock import StockCreate, StockUpdate, StockResponse, StockPrediction
+from app.services.stock_service import invalidate_active_stocks_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -152,6 +153,7 @@ async def create_stock(stock: StockCreate):
                 {"ticker": ticker_upper},
                 update_operation
             )
+            invalidate_active_stocks_cache()
             
             if result.modified_count > 0:
                 logger.info(f"종목 업데이트 성공: {ticker_upper} ({stock.stock_name})")
@@ -194,6 +196,7 @@ async def create_stock(stock: StockCreate):
                 stock_doc["industry"] = stock.industry
             
             result = db.stocks.insert_one(stock_doc)
+            invalidate_active_stocks_cache()
             
             logger.info(f"종목 추가 성공: {ticker_upper} ({stock.stock_name})")
             return {
@@ -306,6 +309,7 @@ async def update_stock(ticker: str, stock_update: StockUpdate):
                 {"ticker": ticker.upper()},
                 {"$set": update_data}
             )
+        invalidate_active_stocks_cache()
         
         if result.modified_count > 0:
             logger.info(f"종목 수정 성공: {ticker}")
@@ -357,6 +361,7 @@ async def delete_stock(ticker: str):
                 }
             }
         )
+        invalidate_active_stocks_cache()
         
         if result.modified_count > 0:
             logger.info(f"종목 비활성화 성공: {ticker}")
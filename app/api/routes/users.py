@@ -5,7 +5,7 @@ from pymongo.errors import DuplicateKeyError
 from app.db.mongodb import get_db
 from app.models.mongodb_models import UserPreferences
 from app.schemas.user import UserCreate, UserUpdate, UserStockAdd, UserStockUpdate
-from app.utils.auth import verify_user_access, get_user_id_dependency, require_user_exists
+from app.utils.auth import verify_user_access, get_user_id_dependency, require_user_exists, invalidate_user_exists_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -283,6 +283,7 @@ async def delete_user(user_id: str):
         
         # 사용자 삭제
         result = db.users.delete_one({"user_id": user_id})
+        invalidate_user_exists_cache(user_id)
         
         if result.deleted_count > 0:
             logger.info(f"사용자 삭제 성공: {user_id}")
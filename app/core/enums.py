@@ -4,6 +4,7 @@
 애플리케이션 전반에서 사용되는 상수 및 상태값을 Enum으로 관리합니다.
 """
 from enum import Enum, IntEnum
+from functools import lru_cache
 from typing import Dict
 
 
@@ -49,6 +50,7 @@ EXCHANGE_CODE_MAP: Dict[ExchangeCode, ExchangeCode] = {
 }
 
 
+@lru_cache(maxsize=16)
 def get_exchange_code_for_api(exchange_code: str) -> str:
     """
     거래소 코드를 API 요청용 코드로 변환
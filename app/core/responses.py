@@ -0,0 +1,37 @@
+"""
+공통 응답 클래스 모듈
+
+추천/시계열 조회처럼 중첩된 dict/list를 반환하는 엔드포인트의 JSON 인코딩 비용을 줄이기 위해
+orjson 기반 응답 클래스를 제공합니다. orjson이 설치되어 있지 않으면 표준 json으로 동작합니다.
+"""
+from typing import Any
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson이 기본 지원하지 않는 타입 변환 (ObjectId 등)"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (ObjectId는 문자열로 변환)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -23,6 +23,7 @@ import asyncio
 from datetime import datetime
 from app.api.api import api_router
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
 from app.services.economic_service import update_economic_data_in_background
 from app.utils.scheduler import (
     start_scheduler, stop_scheduler, 
@@ -60,7 +61,11 @@ async def lifespan(app: FastAPI):
     stop_scheduler()  # 매수 스케줄러 종료
     stop_sell_scheduler()  # 매도 스케줄러 종료
 
-app = FastAPI(title="주식 분석 및 추천 API", lifespan=lifespan)
+app = FastAPI(
+    title="주식 분석 및 추천 API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # CORS 미들웨어 설정
 app.add_middleware(
@@ -8,9 +8,10 @@
 
 import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import List, Dict, Optional
 import logging
-from app.core.enums import OrderStatus, OrderType
+from app.core.enums import OrderStatus, OrderType, get_exchange_code_for_api
 from app.infrastructure.database.mongodb_client import get_mongodb_database
 from app.services.stock_recommendation_service import StockRecommendationService
 from app.services.balance_service import (
@@ -21,9 +22,13 @@ from app.services.balance_service import (
     get_overseas_order_possible_amount
 )
 from app.core.config import settings
+from app.utils.user_context import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
+# API 응답에 output이 없을 때 사용하는 읽기 전용 빈 매핑 (조회마다 빈 dict를 만들지 않음)
+_EMPTY_OUTPUT = MappingProxyType({})
+
 
 class AutoTradingService:
     """자동매매 서비스 클래스"""
@@ -61,7 +66,6 @@ class AutoTradingService:
             자동매매 설정 딕셔너리
         """
         try:
-            from app.utils.user_context import get_current_user_id
             if user_id is None:
                 user_id = get_current_user_id()
             
@@ -71,7 +75,7 @@ class AutoTradingService:
                 return self.default_config
             
             # users 컬렉션에서 사용자 정보 조회
-            user = db.users.find_one({"user_id": user_id})
+            user = db.users.find_one({"user_id": user_id}, {"_id": 0, "trading_config": 1})
             
             if user and user.get("trading_config"):
                 # trading_config가 있으면 반환 (ObjectId 제거)
@@ -97,7 +101,6 @@ class AutoTradingService:
             기본 설정 딕셔너리
         """
         try:
-            from app.utils.user_context import get_current_user_id
             if user_id is None:
                 user_id = get_current_user_id()
             
@@ -146,7 +149,6 @@ class AutoTradingService:
             업데이트 결과 딕셔너리
         """
         try:
-            from app.utils.user_context import get_current_user_id
             if user_id is None:
                 user_id = get_current_user_id()
             
@@ -209,12 +211,14 @@ class AutoTradingService:
                 user_leverage_map = {}
                 db = None
                 try:
-                    from app.infrastructure.database.mongodb_client import get_mongodb_database
                     db = get_mongodb_database()
                     if db is not None:
                         # TODO: 실제 사용자 ID를 문맥에서 가져와야 함. 현재는 기본값 'lian' 사용
                         user_id = 'lian'
-                        user = db.users.find_one({"user_id": user_id})
+                        user = db.users.find_one(
+                            {"user_id": user_id},
+                            {"_id": 0, "stocks.ticker": 1, "stocks.use_leverage": 1}
+                        )
                         if user and user.get("stocks"):
                             # embedded stocks에서 UserStockEmbedded 모델 구조에 맞게 ticker, use_leverage만 사용
                             for stock in user.get("stocks", []):
@@ -227,6 +231,22 @@ class AutoTradingService:
                 except Exception as e:
                     logger.error(f"레버리지 설정 조회 실패: {str(e)}")
 
+                # 레버리지를 사용하는 종목의 레버리지 티커를 한 번의 $in 쿼리로 조회
+                # (Stock.leverage_ticker 필드는 stocks 컬렉션에 있음)
+                leverage_tickers = {}  # 본주 티커 -> 레버리지 티커
+                leverage_enabled = [t for t, setting in user_leverage_map.items() if setting["use_leverage"]]
+                if leverage_enabled and db is not None:
+                    try:
+                        leverage_tickers = {
+                            doc["ticker"]: doc["leverage_ticker"]
+                            for doc in db.stocks.find(
+                                {"ticker": {"$in": leverage_enabled}, "leverage_ticker": {"$nin": [None, ""]}},
+                                {"_id": 0, "ticker": 1, "leverage_ticker": 1}
+                            )
+                        }
+                    except Exception as e:
+                        logger.error(f"레버리지 티커 조회 실패: {str(e)}")
+
                 # 중복 제거를 위한 set (티커 기준)
                 seen_tickers = set()
                 
@@ -245,13 +265,15 @@ class AutoTradingService:
                     if stock.get("composite_score", 0) < config.get("min_composite_score", 2.0):
                         continue
                     
-                    # use_leverage 필터링: use_leverage가 true인 종목만 매수
-                    if original_ticker not in user_leverage_map:
+                    # use_leverage 필터링: use_leverage가 true인 종목만 매수 (설정은 한 번만 조회)
+                    leverage_setting = user_leverage_map.get(original_ticker)
+                    if leverage_setting is None:
                         # 사용자 설정에 없는 종목은 매수하지 않음
                         logger.info(f"{original_ticker} ({stock.get('stock_name')}) - 사용자 설정에 없어 매수 제외")
                         continue
                     
-                    if not user_leverage_map[original_ticker]["use_leverage"]:
+                    use_leverage = leverage_setting["use_leverage"]
+                    if not use_leverage:
                         # use_leverage가 false인 종목은 매수하지 않음
                         logger.info(f"{original_ticker} ({stock.get('stock_name')}) - use_leverage가 false여서 매수 제외")
                         continue
@@ -262,15 +284,12 @@ class AutoTradingService:
                     actual_ticker = original_ticker
                     is_leverage = False
                     
-                    if user_leverage_map[original_ticker]["use_leverage"]:
-                        # Stock 모델의 leverage_ticker 필드를 stocks 컬렉션에서 조회
-                        if db is not None:
-                            stock_doc = db.stocks.find_one({"ticker": original_ticker})
-                            if stock_doc and stock_doc.get("leverage_ticker"):  # Stock.leverage_ticker
-                                actual_ticker = stock_doc["leverage_ticker"]
-                                is_leverage = True
-                                stock["original_ticker"] = original_ticker
-                                stock["note"] = "사용자 설정에 의해 레버리지 티커 적용됨"
+                    if use_leverage and original_ticker in leverage_tickers:
+                        # 루프 전에 일괄 조회한 Stock.leverage_ticker 사용
+                        actual_ticker = leverage_tickers[original_ticker]
+                        is_leverage = True
+                        stock["original_ticker"] = original_ticker
+                        stock["note"] = "사용자 설정에 의해 레버리지 티커 적용됨"
                     
                     stock["ticker"] = actual_ticker
                     stock["is_leverage"] = is_leverage
@@ -344,7 +363,6 @@ class AutoTradingService:
     def execute_auto_buy(self, dry_run: bool = False, user_id: Optional[str] = None) -> Dict:
         """자동 매수 실행"""
         try:
-            from app.utils.user_context import get_current_user_id
             if user_id is None:
                 user_id = get_current_user_id()
             
@@ -400,16 +418,16 @@ class AutoTradingService:
                 exchange_code = None
                 pure_ticker = ticker
                 try:
-                    from app.infrastructure.database.mongodb_client import get_mongodb_database
                     db = get_mongodb_database()
                     if db is not None:  # MongoDB Database 객체는 직접 boolean 평가 불가
                         # Stock 모델의 exchange 필드를 조회
                         # 레버리지 티커인 경우 레버리지 티커로 먼저 조회
-                        stock_doc = db.stocks.find_one({"ticker": ticker})
+                        # (문서 존재 여부로 원본 티커 재조회를 판단하므로 exchange가 없어도 빈 dict가 되지 않도록 _id 포함)
+                        stock_doc = db.stocks.find_one({"ticker": ticker}, {"_id": 1, "exchange": 1})
                         
                         # 레버리지 티커로 조회 실패하고 원본 티커가 있으면 원본 티커로 조회
                         if not stock_doc and original_ticker and original_ticker != ticker:
-                            stock_doc = db.stocks.find_one({"ticker": original_ticker})
+                            stock_doc = db.stocks.find_one({"ticker": original_ticker}, {"_id": 1, "exchange": 1})
                         
                         if stock_doc and stock_doc.get("exchange"):  # Stock.exchange
                             # stocks 컬렉션의 exchange 필드 사용 (예: "NASD", "NYSE", "AMEX")
@@ -447,7 +465,6 @@ class AutoTradingService:
                     exchange_code = "NASD"
                 
                 # 거래소 코드 변환 (API 요청에 맞게 변환)
-                from app.core.enums import get_exchange_code_for_api
                 api_exchange_code = get_exchange_code_for_api(exchange_code)
                 
                 if not api_exchange_code:
@@ -469,7 +486,7 @@ class AutoTradingService:
                     continue
                 
                 # 현재가 추출
-                last_price = price_result.get("output", {}).get("last", 0) or 0
+                last_price = (price_result.get("output") or _EMPTY_OUTPUT).get("last", 0) or 0
                 try:
                     current_price = float(last_price)
                 except (ValueError, TypeError) as e:
@@ -558,15 +575,12 @@ class AutoTradingService:
             }
         
         except Exception as e:
-            logger.error(f"자동 매수 실행 중 오류: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"자동 매수 실행 중 오류: {str(e)}")
             return {"success": False, "error": str(e)}
     
     def execute_auto_sell(self, dry_run: bool = False, user_id: Optional[str] = None) -> Dict:
         """자동 매도 실행 (손절/익절)"""
         try:
-            from app.utils.user_context import get_current_user_id
             if user_id is None:
                 user_id = get_current_user_id()
             
@@ -646,15 +660,12 @@ class AutoTradingService:
             }
         
         except Exception as e:
-            logger.error(f"자동 매도 실행 중 오류: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"자동 매도 실행 중 오류: {str(e)}")
             return {"success": False, "error": str(e)}
     
     def get_auto_trading_status(self, user_id: Optional[str] = None) -> Dict:
         """자동매매 상태 조회"""
         try:
-            from app.utils.user_context import get_current_user_id
             if user_id is None:
                 user_id = get_current_user_id()
             
@@ -1,5 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import random
 import time
 from datetime import datetime, timedelta
 import pytz
@@ -31,6 +33,12 @@ _last_refresh_time = {
 }
 _refresh_lock = Lock()  # 동시성 방지 락
 
+# 현재가 조회용 HTTP 세션 (keep-alive로 호출마다 TCP/TLS 핸드셰이크 반복 방지)
+# 매도 스케줄러가 거래소별 현재가를 여러 스레드에서 동시에 조회하므로 풀 크기를 넉넉히 설정
+_KIS_POOL_SIZE = 20
+_price_session = requests.Session()
+_price_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=_KIS_POOL_SIZE))
+
 def _get_token_cache_key():
     """현재 설정에 따른 토큰 캐시 키 반환"""
     return "mock" if settings.KIS_USE_MOCK else "real"
@@ -51,6 +59,37 @@ def _wait_for_api_rate_limit():
             time.sleep(wait_time)
         _last_api_call_time = time.time()
 
+KIS_RATE_LIMIT_MSG_CD = 'EGW00201'  # 초당 거래건수 초과
+
+def _request_with_retry(send, max_retries=3, base_delay=0.5):
+    """
+    일시적인 오류에 대해 지터를 더한 지수 백오프로 재시도하며 KIS API 호출
+    
+    네트워크 예외, 응답 파싱 실패, Rate limiting 에러(EGW00201)만 재시도하고
+    그 밖의 응답은 성공/실패와 관계없이 바로 반환합니다. (정상 응답은 추가 비용 없음)
+    
+    Args:
+        send: requests.Response를 반환하는 호출 함수
+        max_retries: 최대 시도 횟수
+        base_delay: 첫 재시도 전 대기 시간 (초), 시도마다 2배씩 증가
+    
+    Returns:
+        API 응답 (마지막 시도가 예외로 끝나면 예외 발생)
+    """
+    for attempt in range(max_retries):
+        is_last_attempt = attempt == max_retries - 1
+        try:
+            result = send().json()
+        except (requests.RequestException, ValueError) as e:
+            if is_last_attempt:
+                raise
+            logger.warning(f"KIS API 호출 실패 (시도 {attempt+1}/{max_retries}), 재시도합니다: {str(e)}")
+        else:
+            if result.get('msg_cd') != KIS_RATE_LIMIT_MSG_CD or is_last_attempt:
+                return result
+            logger.warning(f"Rate limiting 에러 감지 (시도 {attempt+1}/{max_retries}): {result.get('msg1', '')}. 재시도합니다.")
+        time.sleep(base_delay * (2 ** attempt) + random.uniform(0, 0.1))
+
 def _handle_rate_limit_error(result, attempt, max_retries):
     """Rate limiting 에러 처리"""
     if result.get('msg_cd') == 'EGW00201':
@@ -422,11 +461,12 @@ def get_overseas_order_possible_amount(exchange_code="NASD", ticker="AAPL"):
         "ITEM_CD": ticker  # 종목코드
     }
     
-    try:
+    def send():
         _wait_for_api_rate_limit()
-        response = requests.get(url, headers=headers, params=params)
-        result = response.json()
-        return result
+        return requests.get(url, headers=headers, params=params)
+    
+    try:
+        return _request_with_retry(send)
         
     except Exception as e:
         logger.error(f"주문가능금액 조회 중 오류: {str(e)}")
@@ -598,10 +638,7 @@ def get_current_price(params):
             "tr_id": "HHDFS00000300",
         }
         
-        response = requests.get(url, headers=headers, params=params)
-        result = response.json()
-        
-        return result
+        return _request_with_retry(lambda: _price_session.get(url, headers=headers, params=params))
     except Exception as e:
         print(f"현재체결가 조회 중 오류 발생: {str(e)}")
         raise
@@ -46,17 +46,12 @@ def fetch_economic_data(start_date: str = None, end_date: str = None):
     now_ny = datetime.now(pytz.timezone('America/New_York'))
     
     korea_time = now_korea.strftime('%H:%M')
-    ny_hour = now_ny.hour
-    ny_minute = now_ny.minute
+    ny_minute_of_day = now_ny.hour * 60 + now_ny.minute  # 자정 기준 경과 분
     ny_weekday = now_ny.weekday()  # 0=월요일, 6=일요일
     
     # 미국 주식 시장은 평일(월-금) 9:30 AM - 4:00 PM ET
     is_weekday = 0 <= ny_weekday <= 4  # 월요일에서 금요일까지
-    is_market_open_time = (
-        (ny_hour == 9 and ny_minute >= 30) or
-        (10 <= ny_hour < 16) or
-        (ny_hour == 16 and ny_minute == 0)
-    )
+    is_market_open_time = 9 * 60 + 30 <= ny_minute_of_day <= 16 * 60  # 9:30 ~ 16:00 (마감 시각 포함)
     
     is_market_hours = is_weekday and is_market_open_time
     
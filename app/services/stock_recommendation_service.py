@@ -2,11 +2,13 @@ import pandas as pd
 import requests
 import time
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from typing import Optional, Dict, List, Any
 from app.db.mongodb import get_db
 import numpy as np
 from app.core.config import settings
 from app.services.balance_service import get_overseas_balance
+from app.services.trailing_stop_service import TrailingStopService
 from app.utils.slack_notifier import slack_notifier
 from app.utils.user_context import get_current_user_id
 from app.services.stock_service import (
@@ -24,6 +26,8 @@ import logging
 
 logger = logging.getLogger('stock_recommendation_service')
 
+KST = ZoneInfo("Asia/Seoul")
+
 class StockRecommendationService:
     def __init__(self):
         """StockRecommendationService 초기화"""
@@ -103,9 +107,7 @@ class StockRecommendationService:
             logger.info(f"MongoDB stocks 컬렉션에서 {len(stock_columns)}개의 활성화된 주식을 조회했습니다.")
         except Exception as e:
             error_msg = f"MongoDB stocks 컬렉션 조회 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             return {"message": error_msg, "data": []}
         
         # 날짜 범위가 지정된 경우 사용, 아니면 최근 6개월 데이터
@@ -222,9 +224,7 @@ class StockRecommendationService:
             
         except Exception as e:
             error_msg = f"MongoDB daily_stock_data 조회 중 오류 발생: {str(e)}"
-            logger.error(error_msg)
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(error_msg)
             return {"message": error_msg, "data": []}
 
         # DataFrame이 비어있는지 다시 확인
@@ -317,7 +317,7 @@ class StockRecommendationService:
                 return {"message": "추천 데이터에 날짜가 없습니다", "data": []}
             
             # 하나의 상세한 로그로 통합
-            recommended_count = len([r for r in recommendations if r.get('추천_여부', False)])
+            recommended_count = sum(1 for r in recommendations if r.get('추천_여부'))
             logger.info(f"기술적 지표 분석 완료: {today_str} 기준 {len(recommendations)}개 종목 분석, 추천 종목 {recommended_count}개")
             
             # MongoDB에 저장
@@ -426,9 +426,7 @@ class StockRecommendationService:
                 else:
                     logger.warning(f"⚠️ MongoDB 연결 실패: {today_str}")
             except Exception as mongo_e:
-                logger.warning(f"⚠️ MongoDB 저장 실패: {str(mongo_e)}")
-                import traceback
-                logger.warning(traceback.format_exc())
+                logger.warning(f"⚠️ MongoDB 저장 실패: {str(mongo_e)}", exc_info=True)
         
         except Exception as e:
             print(f"오류 발생: {str(e)}")
@@ -549,9 +547,7 @@ class StockRecommendationService:
                 "recommendations": recommendations
             }
         except Exception as e:
-            logger.error(f"get_stock_recommendations 오류: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"get_stock_recommendations 오류: {str(e)}")
             return {"message": f"분석 결과 조회 중 오류 발생: {str(e)}", "recommendations": []}
 
     def get_recommendations_with_sentiment(self):
@@ -638,9 +634,7 @@ class StockRecommendationService:
         """
         # 날짜 범위 설정 (기본값: 오늘)
         if not start_date or not end_date:
-            import pytz
-            korea_tz = pytz.timezone('Asia/Seoul')
-            today = datetime.now(korea_tz).strftime('%Y-%m-%d')
+            today = datetime.now(KST).strftime('%Y-%m-%d')
             start_date = start_date or today
             end_date = end_date or today
         
@@ -817,9 +811,7 @@ class StockRecommendationService:
                     if start_date and end_date:
                         analysis_date = end_date
                     else:
-                        import pytz
-                        korea_tz = pytz.timezone('Asia/Seoul')
-                        analysis_date = datetime.now(korea_tz).strftime('%Y-%m-%d')
+                        analysis_date = datetime.now(KST).strftime('%Y-%m-%d')
                     
                     today_str = analysis_date
                     
@@ -904,9 +896,7 @@ class StockRecommendationService:
             else:
                 logger.warning(f"⚠️ MongoDB 연결 실패")
         except Exception as mongo_e:
-            logger.warning(f"⚠️ MongoDB 저장 실패: {str(mongo_e)}")
-            import traceback
-            logger.warning(traceback.format_exc())
+            logger.warning(f"⚠️ MongoDB 저장 실패: {str(mongo_e)}", exc_info=True)
 
         return {
             "message": f"{len(results)}개의 티커(추천 주식: {len(recommended_tickers)}개, 보유 주식: {len(holding_tickers)}개)를 분석했습니다",
@@ -951,9 +941,7 @@ class StockRecommendationService:
             return {"message": "MongoDB 연결 실패", "results": []}
 
         # 오늘 날짜 (YYYY-MM-DD 형식) - 루프 밖에서 정의
-        import pytz
-        korea_tz = pytz.timezone('Asia/Seoul')
-        today_str = datetime.now(korea_tz).strftime('%Y-%m-%d')
+        today_str = datetime.now(KST).strftime('%Y-%m-%d')
 
         results = []
         for ticker in all_tickers:
@@ -1089,9 +1077,7 @@ class StockRecommendationService:
                 else:
                     logger.info(f"ℹ️ MongoDB가 비활성화되어 있습니다. (USE_MONGODB=False)")
         except Exception as mongo_e:
-            logger.warning(f"⚠️ MongoDB daily_stock_data.sentiment 저장 실패: {str(mongo_e)}")
-            import traceback
-            logger.warning(traceback.format_exc())
+            logger.warning(f"⚠️ MongoDB daily_stock_data.sentiment 저장 실패: {str(mongo_e)}", exc_info=True)
 
         return {
             "message": f"{len(results)}개의 티커(활성화된 주식: {len(all_tickers)}개)를 분석했습니다",
@@ -1129,12 +1115,13 @@ class StockRecommendationService:
                 if mongo_tech_data:
                     # MongoDB 필드명을 API 응답 형식으로 변환
                     for doc in mongo_tech_data:
+                        ticker = doc.get("ticker")
                         tech_indicators = doc.get("technical_indicators", {})
                         tech_data.append({
                             "날짜": doc.get("date"),
                             "updated_at": doc.get("updated_at"),
-                            "종목": get_stock_name_from_ticker(doc.get("ticker")) or doc.get("ticker"),
-                            "ticker": doc.get("ticker"),
+                            "종목": get_stock_name_from_ticker(ticker) or ticker,
+                            "ticker": ticker,
                             "SMA20": tech_indicators.get("sma20"),
                             "SMA50": tech_indicators.get("sma50"),
                             "골든_크로스": tech_indicators.get("golden_cross", False),
@@ -1345,7 +1332,9 @@ class StockRecommendationService:
 
                 # 8. 종합 점수 계산 및 정렬
                 for item in final_results:
-                    sentiment_score = item["sentiment_score"] if item["sentiment_score"] is not None else 0.0
+                    sentiment_score = item["sentiment_score"]
+                    if sentiment_score is None:
+                        sentiment_score = 0.0
                     tech_conditions_count = (
                         1.5 * item["golden_cross"] +
                         1.0 * (item["rsi"] < 50) +
@@ -1359,61 +1348,58 @@ class StockRecommendationService:
                         0.3 * sentiment_score
                     )
                     
-                    item["composite_score"] = base_score + item.get("short_score", 0)
+                    # short_score는 7단계 필터링 루프에서 모든 항목에 설정됨
+                    item["composite_score"] = base_score + item["short_score"]
 
-                final_results.sort(key=lambda x: x["composite_score"], reverse=True)
-                
                 # 최종 결과에서도 티커 기준 중복 제거 (이중 안전장치)
-                seen_final_tickers = set()
-                deduplicated_final_results = []
+                # 정렬 전에 티커별 최고 점수 항목만 남겨 정렬 대상 자체를 줄임
+                best_by_ticker = {}
                 for item in final_results:
                     ticker = item.get("ticker")
-                    if ticker and ticker not in seen_final_tickers:
-                        deduplicated_final_results.append(item)
-                        seen_final_tickers.add(ticker)
-                    elif ticker:
+                    if not ticker:
+                        continue
+                    best = best_by_ticker.get(ticker)
+                    if best is None:
+                        best_by_ticker[ticker] = item
+                    else:
                         logger.warning(f"최종 결과에서 중복된 티커 발견 및 제외: {item.get('stock_name')} ({ticker})")
+                        if item["composite_score"] > best["composite_score"]:
+                            best_by_ticker[ticker] = item
                 
-                final_results = deduplicated_final_results
+                final_results = sorted(best_by_ticker.values(), key=lambda x: x["composite_score"], reverse=True)
                 logger.info(f"최종 추천 종목 수 (중복 제거 후): {len(final_results)}개")
 
             # 8. 슬랙 알림 - 통합 분석 완료 (4가지 분석 결과 포함)
             if send_slack_notification:
                 try:
-                    # 상위 5개 추천 종목 정보 준비 (중복 제거 확인)
-                    seen_tickers_for_slack = set()
-                    top_recommendations = []
-                    
-                    for item in final_results:
-                        ticker = item.get('ticker')
-                        if not ticker:
-                            continue
-                        
-                        # 티커 기준 중복 제거 (슬랙 알림용 이중 안전장치)
-                        if ticker in seen_tickers_for_slack:
-                            logger.warning(f"슬랙 알림 준비 중 중복된 티커 발견 및 제외: {item.get('stock_name')} ({ticker})")
-                            continue
-                        
-                        seen_tickers_for_slack.add(ticker)
-                        top_recommendations.append({
+                    # 상위 5개 추천 종목 정보 준비 (final_results는 이미 티커 기준 중복 제거됨)
+                    top_recommendations = [
+                        {
                             'stock_name': item['stock_name'],
                             'ticker': item['ticker'],
                             'recommendation_score': item['composite_score'],
                             'rise_probability': item['rise_probability'],
-                            'sentiment_score': item['sentiment_score'] if item['sentiment_score'] else 0,
+                            'sentiment_score': item['sentiment_score'] or 0,
                             'golden_cross': item['golden_cross'],
                             'rsi': item['rsi'],
                             'macd_buy_signal': item['macd_buy_signal']
-                        })
-                        
-                        # 최대 5개만
-                        if len(top_recommendations) >= 5:
-                            break
+                        }
+                        for item in final_results[:5]
+                    ]
                     
-                    # 각 분석 통계 계산
-                    technical_count = sum(1 for item in final_results if item['technical_recommended'])
-                    sentiment_count = sum(1 for item in final_results if item['sentiment_score'] and item['sentiment_score'] >= 0.15)
-                    ai_predictions = [item for item in final_results if item['rise_probability'] >= 3]
+                    # 각 분석 통계 계산 (한 번의 순회로 집계)
+                    technical_count = sentiment_count = ai_prediction_count = 0
+                    total_composite_score = total_rise_probability = 0.0
+                    for item in final_results:
+                        total_composite_score += item['composite_score']
+                        total_rise_probability += item['rise_probability']
+                        if item['technical_recommended']:
+                            technical_count += 1
+                        item_sentiment = item['sentiment_score']
+                        if item_sentiment and item_sentiment >= 0.15:
+                            sentiment_count += 1
+                        if item['rise_probability'] >= 3:
+                            ai_prediction_count += 1
                     
                     slack_notifier.send_combined_analysis_notification(
                         total_stocks=len(results),
@@ -1421,11 +1407,11 @@ class StockRecommendationService:
                         analysis_stats={
                             'total_analyzed': len(results),
                             'final_recommendations': len(final_results),
-                            'avg_composite_score': sum(item['composite_score'] for item in final_results) / len(final_results) if final_results else 0,
+                            'avg_composite_score': total_composite_score / len(final_results) if final_results else 0,
                             'technical_signals': technical_count,
                             'positive_sentiment': sentiment_count,
-                            'ai_predictions': len(ai_predictions),
-                            'avg_rise_probability': sum(item['rise_probability'] for item in final_results) / len(final_results) if final_results else 0
+                            'ai_predictions': ai_prediction_count,
+                            'avg_rise_probability': total_rise_probability / len(final_results) if final_results else 0
                         },
                         success=True
                     )
@@ -1500,7 +1486,6 @@ class StockRecommendationService:
         if db is None:
             return None
         
-        from app.utils.user_context import get_current_user_id
         user_id = get_current_user_id()
         
         # 부분 익절 히스토리 조회
@@ -1619,52 +1604,53 @@ class StockRecommendationService:
                     korean_to_ticker[name] = ticker
             
             # 3. 기술적 지표 데이터 가져오기 (MongoDB 우선)
-            tech_list = []
+            # 종목명 -> 최신 기술적 지표 레코드 (DataFrame 없이 dict로 바로 조회)
+            tech_by_name = {}
             db = get_db()
 
             if db is not None:
-                # MongoDB stock_recommendations에서 조회 (updated_at 우선, date 보조)
-                cursor = db.stock_recommendations.find({}).sort([
-                    ("updated_at", -1),
-                    ("date", -1)
-                ])
-                mongo_tech_data = list(cursor)
+                # MongoDB stock_recommendations에서 종목별 최신 문서만 조회 (updated_at 우선, date 보조)
+                # 중복 제거와 필드 선택을 서버에서 처리하여 전체 이력을 메모리로 가져오지 않음
+                pipeline = [
+                    {"$sort": {"updated_at": -1, "date": -1}},
+                    {"$project": {
+                        "_id": 0,
+                        "ticker": 1,
+                        "date": 1,
+                        "updated_at": 1,
+                        "technical_indicators.golden_cross": 1,
+                        "technical_indicators.rsi": 1,
+                        "technical_indicators.macd_buy_signal": 1
+                    }},
+                    {"$group": {"_id": "$ticker", "doc": {"$first": "$$ROOT"}}},
+                    {"$replaceRoot": {"newRoot": "$doc"}}
+                ]
+                mongo_tech_data = list(
+                    db.stock_recommendations.aggregate(pipeline, allowDiskUse=True)
+                )
 
                 if mongo_tech_data:
+                    # 종목명은 문서별 find_one 대신 한 번에 매핑 조회
+                    ticker_to_name = get_ticker_to_stock_mapping()
                     for doc in mongo_tech_data:
+                        ticker = doc.get("ticker")
+                        stock_name = ticker_to_name.get(ticker) or ticker
                         tech_indicators = doc.get("technical_indicators", {})
-                        tech_list.append({
+                        rsi = tech_indicators.get("rsi")
+                        tech_by_name[stock_name] = {
                             "날짜": doc.get("date"),
                             "updated_at": doc.get("updated_at"),
-                            "종목": get_stock_name_from_ticker(doc.get("ticker")) or doc.get("ticker"),
-                            "ticker": doc.get("ticker"),
-                            "골든_크로스": tech_indicators.get("golden_cross", False),
-                            "RSI": tech_indicators.get("rsi"),
-                            "MACD_매수_신호": tech_indicators.get("macd_buy_signal", False),
-                        })
+                            "종목": stock_name,
+                            "ticker": ticker,
+                            "골든_크로스": bool(tech_indicators.get("golden_cross", False)),
+                            "RSI": float(rsi) if rsi is not None else None,
+                            "MACD_매수_신호": bool(tech_indicators.get("macd_buy_signal", False)),
+                        }
 
-            # MongoDB에 데이터가 없으면 빈 리스트
-            if not tech_list:
+            # MongoDB에 데이터가 없으면 빈 딕셔너리
+            if not tech_by_name:
                 logger.info("get_stocks_to_sell: MongoDB stock_recommendations가 비어있음")
 
-            tech_data = pd.DataFrame(tech_list) if tech_list else pd.DataFrame()
-
-            if not tech_data.empty:
-                # 데이터 타입 변환
-                tech_data["골든_크로스"] = tech_data["골든_크로스"].astype(bool)
-                tech_data["MACD_매수_신호"] = tech_data["MACD_매수_신호"].astype(bool)
-                tech_data["RSI"] = pd.to_numeric(tech_data["RSI"])
-
-                # 최신 데이터만 필터링 (updated_at 우선, 없으면 날짜로 폴백)
-                tech_data["최신기준"] = pd.to_datetime(
-                    tech_data["updated_at"],
-                    errors="coerce"
-                )
-                date_as_dt = pd.to_datetime(tech_data["날짜"], errors="coerce")
-                tech_data["최신기준"] = tech_data["최신기준"].fillna(date_as_dt)
-                tech_data = tech_data.sort_values("최신기준", ascending=False)
-                tech_data = tech_data.drop_duplicates(subset=["종목"], keep="first")
-
             # 4. 감성 분석 데이터 가져오기 (MongoDB 우선)
             sentiment_data = {}
             if db is not None:
@@ -1677,7 +1663,19 @@ class StockRecommendationService:
             if not sentiment_data:
                 logger.info("get_stocks_to_sell: MongoDB sentiment_analysis가 비어있음")
 
-            # 5. 매도 대상 종목 식별
+            # 5. 트레일링 스톱 조건 확인 (보유 종목 전체를 한 번에 조회, 최고가 갱신은 스케줄러에서만 수행)
+            trailing_stop_results = {}
+            try:
+                current_prices = {}
+                for item in holdings:
+                    holding_price = float(item.get("now_pric2", 0))
+                    if item.get("ovrs_pdno") and holding_price > 0:
+                        current_prices[item.get("ovrs_pdno")] = holding_price
+                trailing_stop_results = TrailingStopService().bulk_check_triggered(current_prices)
+            except Exception as e:
+                logger.warning(f"get_stocks_to_sell: 트레일링 스톱 일괄 확인 중 오류 (계속 진행): {str(e)}")
+            
+            # 6. 매도 대상 종목 식별
             sell_candidates = []
             
             for item in holdings:
@@ -1746,26 +1744,17 @@ class StockRecommendationService:
                 
                 # Priority 2: 트레일링 스톱 체크 (손절 조건이 없을 때만 체크)
                 if priority == 3:
-                    try:
-                        from app.services.trailing_stop_service import TrailingStopService
-                        trailing_stop_service = TrailingStopService()
-                        
-                        # 트레일링 스톱 조건 충족 여부 확인
-                        if trailing_stop_service.check_trailing_stop_triggered(ticker, current_price):
-                            priority = 2
-                            sell_type = "trailing_stop"
-                            trailing_info = trailing_stop_service.get_trailing_stop_info(ticker)
-                            if trailing_info:
-                                highest_price = trailing_info.get("highest_price", 0)
-                                dynamic_stop_price = trailing_info.get("dynamic_stop_price", 0)
-                                sell_reasons.append(
-                                    f"트레일링 스톱 도달: 최고가 ${highest_price:.2f} 기준, "
-                                    f"동적 익절가 ${dynamic_stop_price:.2f} 하회 (현재가: ${current_price:.2f})"
-                                )
-                            else:
-                                sell_reasons.append(f"트레일링 스톱 도달: 현재가 ${current_price:.2f}")
-                    except Exception as e:
-                        logger.warning(f"get_stocks_to_sell: {stock_name}({ticker}) 트레일링 스톱 체크 중 오류 (계속 진행): {str(e)}")
+                    # 트레일링 스톱 조건 충족 여부 확인 (위에서 일괄 조회한 결과 사용)
+                    trailing_info = trailing_stop_results.get(ticker)
+                    if trailing_info and trailing_info["triggered"]:
+                        priority = 2
+                        sell_type = "trailing_stop"
+                        highest_price = trailing_info.get("highest_price", 0)
+                        dynamic_stop_price = trailing_info.get("dynamic_stop_price", 0)
+                        sell_reasons.append(
+                            f"트레일링 스톱 도달: 최고가 ${highest_price:.2f} 기준, "
+                            f"동적 익절가 ${dynamic_stop_price:.2f} 하회 (현재가: ${current_price:.2f})"
+                        )
                 
                 # Priority 3: 부분 익절 전략 체크 (손절/트레일링 스톱 조건이 없을 때만)
                 if priority == 3:
@@ -1794,11 +1783,7 @@ class StockRecommendationService:
                         sell_reasons.append(f"익절 조건 충족({'레버리지' if is_leveraged else '일반'}): 구매가 대비 {price_change_percent:.2f}% 상승 (목표: {target_profit_percent}%)")
                 
                 # 기술적 지표 확인
-                tech_record = None
-                if not tech_data.empty:
-                    tech_filtered = tech_data[tech_data["종목"] == stock_name]
-                    if not tech_filtered.empty:
-                        tech_record = tech_filtered.iloc[0].to_dict()
+                tech_record = tech_by_name.get(stock_name)
                 
                 tech_sell_signals_details = []
                 if tech_record:
@@ -1807,7 +1792,7 @@ class StockRecommendationService:
                         technical_sell_signals += 1
                         tech_sell_signals_details.append("데드 크로스")
                     
-                    if tech_record["RSI"] > 70:  # RSI 70 이상은 과매수 구간(매도 신호)
+                    if tech_record["RSI"] is not None and tech_record["RSI"] > 70:  # RSI 70 이상은 과매수 구간(매도 신호)
                         technical_sell_signals += 1
                         tech_sell_signals_details.append(f"RSI 과매수({tech_record['RSI']:.2f})")
                     
@@ -1908,8 +1893,6 @@ class StockRecommendationService:
             }
         """
         try:
-            from app.core.config import settings
-            
             # MongoDB 사용 여부 확인
             use_mongodb = settings.is_mongodb_enabled()
             if not use_mongodb:
@@ -1963,9 +1946,7 @@ class StockRecommendationService:
                 }
             }
         except Exception as e:
-            logger.error(f"날짜별 통합 조회 중 오류 발생: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"날짜별 통합 조회 중 오류 발생: {str(e)}")
             return {"message": f"조회 중 오류 발생: {str(e)}", "data": None}
     
     def get_stock_recommendation_history_from_mongodb(
@@ -1993,8 +1974,6 @@ class StockRecommendationService:
             }
         """
         try:
-            from app.core.config import settings
-            
             # MongoDB 사용 여부 확인
             use_mongodb = settings.is_mongodb_enabled()
             if not use_mongodb:
@@ -2029,21 +2008,30 @@ class StockRecommendationService:
             if only_recommended:
                 query["is_recommended"] = True
             
-            # stock_recommendations에서 조회 (인덱스 활용)
-            cursor = db.stock_recommendations.find(query).sort("date", 1)
+            # stock_recommendations에서 조회 (인덱스 활용, 응답에 필요한 필드만 조회)
+            cursor = db.stock_recommendations.find(
+                query,
+                {
+                    "_id": 0,  # 응답에서 사용하지 않으므로 ObjectId 변환 없이 제외
+                    "date": 1,
+                    "ticker": 1,
+                    "technical_indicators": 1,
+                    "recommendation_score": 1,
+                    "is_recommended": 1
+                }
+            ).sort("date", 1).batch_size(1000)
             
             history = []
+            recommended_count = 0
             for doc in cursor:
-                # ObjectId를 문자열로 변환
-                doc["_id"] = str(doc["_id"])
-                # date를 문자열로 변환
-                if isinstance(doc.get("date"), datetime):
-                    doc["date"] = doc["date"].strftime('%Y-%m-%d')
+                # date를 문자열로 변환 (strftime 대신 정수 포맷팅으로 YYYY-MM-DD 생성)
+                doc_date = doc.get("date")
+                if isinstance(doc_date, datetime):
+                    doc["date"] = f"{doc_date.year:04d}-{doc_date.month:02d}-{doc_date.day:02d}"
+                if doc.get("is_recommended", False):
+                    recommended_count += 1
                 history.append(doc)
             
-            # 통계 계산
-            recommended_count = sum(1 for h in history if h.get("is_recommended", False))
-            
             return {
                 "message": f"{ticker} 종목의 추천 이력 조회 성공",
                 "ticker": ticker,
@@ -2054,15 +2042,14 @@ class StockRecommendationService:
                 "recommended_count": recommended_count
             }
         except Exception as e:
-            logger.error(f"종목별 시계열 조회 중 오류 발생: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"종목별 시계열 조회 중 오류 발생: {str(e)}")
             return {"message": f"조회 중 오류 발생: {str(e)}", "history": []}
     
     def get_recommended_stocks_by_date_range_from_mongodb(
         self,
         start_date: str,
-        end_date: str = None
+        end_date: str = None,
+        top_n: int = 50
     ):
         """
         날짜 범위별 추천 종목 집계: daily_stock_data에서 날짜 범위의 추천 종목 조회
@@ -2070,6 +2057,7 @@ class StockRecommendationService:
         Args:
             start_date: 시작 날짜 (YYYY-MM-DD 형식)
             end_date: 종료 날짜 (YYYY-MM-DD 형식). None이면 오늘
+            top_n: most_recommended_tickers에 포함할 상위 종목 수 (기본값: 50)
         
         Returns:
             dict: {
@@ -2079,12 +2067,11 @@ class StockRecommendationService:
                     ...
                 ],
                 "total_recommended_days": int,
-                "most_recommended_tickers": {...}  # 종목별 추천 횟수
+                "most_recommended_tickers": {...},  # 상위 top_n 종목별 추천 횟수
+                "total_unique_tickers": int
             }
         """
         try:
-            from app.core.config import settings
-            
             # MongoDB 사용 여부 확인
             use_mongodb = settings.is_mongodb_enabled()
             if not use_mongodb:
@@ -2100,45 +2087,70 @@ class StockRecommendationService:
             if end_date is None:
                 end_date = datetime.now().strftime('%Y-%m-%d')
             
-            # daily_stock_data에서 날짜 범위 조회
-            cursor = db.daily_stock_data.find({
-                "date": {
-                    "$gte": start_date,
-                    "$lte": end_date
-                },
-                "recommendations": {"$exists": True}  # recommendations 필드가 있는 문서만
-            }).sort("date", 1)
-            
-            daily_recommendations = []
-            ticker_count = {}  # 종목별 추천 횟수 집계
+            # daily_stock_data에서 날짜 범위 조회 후 서버에서 날짜별/종목별 집계
+            # (date_unique 인덱스로 $match 후 추천된 티커 이름만 남겨 펼친 뒤 그룹화)
+            pipeline = [
+                {"$match": {
+                    "date": {
+                        "$gte": start_date,
+                        "$lte": end_date
+                    },
+                    "recommendations": {"$exists": True}  # recommendations 필드가 있는 문서만
+                }},
+                {"$project": {
+                    "_id": 0,
+                    "date": 1,
+                    # is_recommended=True인 항목의 티커 이름만 추출 (추천 상세 정보는 전달하지 않음)
+                    "recommended_tickers": {
+                        "$map": {
+                            "input": {
+                                "$filter": {
+                                    "input": {"$objectToArray": "$recommendations"},
+                                    "as": "r",
+                                    "cond": {"$eq": ["$$r.v.is_recommended", True]}
+                                }
+                            },
+                            "as": "r",
+                            "in": "$$r.k"
+                        }
+                    }
+                }},
+                {"$unwind": "$recommended_tickers"},
+                {"$facet": {
+                    "daily": [
+                        {"$group": {"_id": "$date", "tickers": {"$push": "$recommended_tickers"}}},
+                        {"$sort": {"_id": 1}}
+                    ],
+                    "by_ticker": [
+                        {"$group": {"_id": "$recommended_tickers", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1, "_id": 1}},
+                        {"$limit": top_n}
+                    ],
+                    "unique_tickers": [
+                        {"$group": {"_id": "$recommended_tickers"}},
+                        {"$count": "total"}
+                    ]
+                }}
+            ]
+            facets = next(
+                db.daily_stock_data.aggregate(pipeline, allowDiskUse=True),
+                {"daily": [], "by_ticker": [], "unique_tickers": []}
+            )
             
-            for doc in cursor:
-                date_str = doc.get("date")
-                recommendations = doc.get("recommendations", {})
-                
-                # 추천 종목만 필터링
-                recommended_tickers = [
-                    ticker for ticker, rec in recommendations.items()
-                    if rec.get("is_recommended", False)
-                ]
-                
-                if recommended_tickers:
-                    daily_recommendations.append({
-                        "date": date_str,
-                        "tickers": recommended_tickers,
-                        "count": len(recommended_tickers)
-                    })
-                    
-                    # 종목별 추천 횟수 집계
-                    for ticker in recommended_tickers:
-                        ticker_count[ticker] = ticker_count.get(ticker, 0) + 1
+            daily_recommendations = [
+                {
+                    "date": day["_id"],
+                    "tickers": day["tickers"],
+                    "count": len(day["tickers"])
+                }
+                for day in facets["daily"]
+            ]
             
-            # 가장 많이 추천된 종목 정렬
-            most_recommended = dict(sorted(
-                ticker_count.items(),
-                key=lambda x: x[1],
-                reverse=True
-            ))
+            # 가장 많이 추천된 상위 top_n 종목 (추천 횟수 내림차순)
+            most_recommended = {
+                entry["_id"]: entry["count"] for entry in facets["by_ticker"]
+            }
+            total_unique_tickers = facets["unique_tickers"][0]["total"] if facets["unique_tickers"] else 0
             
             return {
                 "message": f"{start_date} ~ {end_date} 기간의 추천 종목 집계 완료",
@@ -2149,20 +2161,19 @@ class StockRecommendationService:
                 "daily_recommendations": daily_recommendations,
                 "total_recommended_days": len(daily_recommendations),
                 "most_recommended_tickers": most_recommended,
-                "total_unique_tickers": len(ticker_count)
+                "total_unique_tickers": total_unique_tickers
             }
         except Exception as e:
-            logger.error(f"날짜 범위별 추천 종목 집계 중 오류 발생: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"날짜 범위별 추천 종목 집계 중 오류 발생: {str(e)}")
             return {"message": f"집계 중 오류 발생: {str(e)}", "data": None}
     
-    def verify_mongodb_sync(self, date_str: str = None):
+    def verify_mongodb_sync(self, date_str: str = None, verbose: bool = True):
         """
         두 컬렉션(daily_stock_data.recommendations와 stock_recommendations)의 동기화 상태 확인
         
         Args:
             date_str: 확인할 날짜 (YYYY-MM-DD 형식). None이면 오늘 날짜 사용
+            verbose: True이면 details에 티커 목록 포함, False이면 개수만 반환
         
         Returns:
             dict: {
@@ -2170,12 +2181,10 @@ class StockRecommendationService:
                 "daily_stock_data_count": int,
                 "stock_recommendations_count": int,
                 "sync_status": str,  # "synced" | "mismatch" | "missing"
-                "details": {...}
+                "details": {...}  # verbose=False이면 티커 목록 대신 개수
             }
         """
         try:
-            from app.core.config import settings
-            
             # MongoDB 사용 여부 확인
             use_mongodb = settings.is_mongodb_enabled()
             if not use_mongodb:
@@ -2192,19 +2201,23 @@ class StockRecommendationService:
             # daily_stock_data에서 recommendations 조회
             daily_doc = db.daily_stock_data.find_one(
                 {"date": date_str},
-                {"recommendations": 1}
+                {"recommendations": 1, "_id": 0}
             )
             
-            # stock_recommendations에서 해당 날짜의 데이터 조회
+            # stock_recommendations에서 해당 날짜의 ticker만 조회
+            # (user_date_ticker_idx 인덱스로 문서 로드 없이 처리)
             rec_date = datetime.strptime(date_str, '%Y-%m-%d')
-            stock_recs = list(db.stock_recommendations.find({
-                "date": rec_date,
-                "user_id": get_current_user_id()  # 현재 사용자 ID로 필터링
-            }))
+            stock_rec_cursor = db.stock_recommendations.find(
+                {
+                    "date": rec_date,
+                    "user_id": get_current_user_id()  # 현재 사용자 ID로 필터링
+                },
+                {"ticker": 1, "_id": 0}
+            ).batch_size(500)
             
             # 비교
             daily_tickers = set(daily_doc.get("recommendations", {}).keys()) if daily_doc else set()
-            stock_rec_tickers = {rec["ticker"] for rec in stock_recs}
+            stock_rec_tickers = {rec["ticker"] for rec in stock_rec_cursor}
             
             # 동기화 상태 확인
             if daily_tickers == stock_rec_tickers:
@@ -2217,9 +2230,31 @@ class StockRecommendationService:
                 sync_status = "mismatch"
                 message = "두 컬렉션 간 불일치가 있습니다"
             
-            # 차이점 상세 정보
-            only_in_daily = daily_tickers - stock_rec_tickers
-            only_in_stock_rec = stock_rec_tickers - daily_tickers
+            # 차이점 상세 정보 (동기화된 경우 차집합은 비어 있고 교집합은 전체와 같음)
+            if sync_status == "synced":
+                only_in_daily = set()
+                only_in_stock_rec = set()
+                common_tickers = daily_tickers
+            else:
+                only_in_daily = daily_tickers - stock_rec_tickers
+                only_in_stock_rec = stock_rec_tickers - daily_tickers
+                common_tickers = daily_tickers & stock_rec_tickers
+            
+            if verbose:
+                sorted_daily = sorted(daily_tickers)
+                details = {
+                    "daily_tickers": sorted_daily,
+                    "stock_rec_tickers": sorted_daily if sync_status == "synced" else sorted(stock_rec_tickers),
+                    "only_in_daily": sorted(only_in_daily),
+                    "only_in_stock_rec": sorted(only_in_stock_rec),
+                    "common_tickers": sorted_daily if sync_status == "synced" else sorted(common_tickers)
+                }
+            else:
+                details = {
+                    "only_in_daily_count": len(only_in_daily),
+                    "only_in_stock_rec_count": len(only_in_stock_rec),
+                    "common_count": len(common_tickers)
+                }
             
             return {
                 "message": message,
@@ -2227,16 +2262,8 @@ class StockRecommendationService:
                 "sync_status": sync_status,
                 "daily_stock_data_count": len(daily_tickers),
                 "stock_recommendations_count": len(stock_rec_tickers),
-                "details": {
-                    "daily_tickers": sorted(list(daily_tickers)),
-                    "stock_rec_tickers": sorted(list(stock_rec_tickers)),
-                    "only_in_daily": sorted(list(only_in_daily)),
-                    "only_in_stock_rec": sorted(list(only_in_stock_rec)),
-                    "common_tickers": sorted(list(daily_tickers & stock_rec_tickers))
-                }
+                "details": details
             }
         except Exception as e:
-            logger.error(f"동기화 확인 중 오류 발생: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"동기화 확인 중 오류 발생: {str(e)}")
             return {"message": f"확인 중 오류 발생: {str(e)}", "sync_status": "error"}
\ No newline at end of file
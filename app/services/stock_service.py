@@ -2,13 +2,68 @@
 MongoDB stocks 컬렉션 조회 공용 유틸리티 서비스
 모든 주식 관련 조회 로직을 통합하여 재사용 가능하도록 제공
 """
-from typing import Optional, List, Dict
+import time
+from typing import Optional, List, Dict, Tuple
 from app.db.mongodb import get_db
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 활성 종목 캐시 - exclude_etf 여부별로 분리
+# stocks 컬렉션은 거의 변하지 않는 참조 데이터이므로 짧은 TTL 동안 재사용
+# {exclude_etf: {"loaded_at": float, "pairs": ((ticker, stock_name), ...),
+#                "ticker_to_name": {...}, "name_to_ticker": {...}}}
+_ACTIVE_STOCKS_CACHE_TTL = 60  # 초
+_active_stocks_cache: Dict[bool, Dict] = {}
+
+
+def invalidate_active_stocks_cache():
+    """stocks 컬렉션 변경 시 활성 종목 캐시를 비웁니다."""
+    _active_stocks_cache.clear()
+
+
+def _get_active_stocks_cache(exclude_etf: bool = False) -> Optional[Dict]:
+    """
+    활성 종목 캐시 항목을 반환합니다.
+    캐시가 없거나 TTL이 지난 경우에만 필요한 필드만 조회하여 다시 채웁니다.
+    
+    Args:
+        exclude_etf: True이면 ETF 제외 (기본값: False)
+    
+    Returns:
+        캐시 항목 딕셔너리 또는 None (MongoDB 연결 실패 시)
+    """
+    now = time.monotonic()
+    cached = _active_stocks_cache.get(exclude_etf)
+    if cached and now - cached["loaded_at"] < _ACTIVE_STOCKS_CACHE_TTL:
+        return cached
+    
+    db = get_db()
+    if db is None:
+        return None
+    
+    query = {"is_active": True}
+    if exclude_etf:
+        query["is_etf"] = {"$ne": True}
+    
+    cursor = db.stocks.find(query, {"ticker": 1, "stock_name": 1, "_id": 0}).batch_size(500)
+    pairs = tuple((stock.get("ticker"), stock.get("stock_name")) for stock in cursor)
+    cached = {
+        "loaded_at": now,
+        "pairs": pairs,
+        "ticker_to_name": {ticker: stock_name for ticker, stock_name in pairs if ticker},
+        "name_to_ticker": {stock_name: ticker for ticker, stock_name in pairs if stock_name}
+    }
+    _active_stocks_cache[exclude_etf] = cached
+    return cached
+
+
+def _get_active_stock_pairs(exclude_etf: bool = False) -> Tuple[Tuple[Optional[str], Optional[str]], ...]:
+    """활성화된 주식의 (ticker, stock_name) 목록을 캐시에서 반환합니다."""
+    cached = _get_active_stocks_cache(exclude_etf)
+    return cached["pairs"] if cached else ()
+
 
 def get_ticker_from_stock_name(stock_name: str) -> Optional[str]:
     """
@@ -21,14 +76,11 @@ def get_ticker_from_stock_name(stock_name: str) -> Optional[str]:
         ticker 또는 None
     """
     try:
-        db = get_db()
-        if db is None:
+        cached = _get_active_stocks_cache()
+        if cached is None:
             return None
         
-        stock = db.stocks.find_one({"stock_name": stock_name, "is_active": True})
-        if stock:
-            return stock.get("ticker")
-        return None
+        return cached["name_to_ticker"].get(stock_name)
     except Exception as e:
         logger.error(f"주식명으로 ticker 조회 중 오류 발생: {str(e)}")
         return None
@@ -45,14 +97,11 @@ def get_stock_name_from_ticker(ticker: str) -> Optional[str]:
         stock_name 또는 None
     """
     try:
-        db = get_db()
-        if db is None:
+        cached = _get_active_stocks_cache()
+        if cached is None:
             return None
         
-        stock = db.stocks.find_one({"ticker": ticker, "is_active": True})
-        if stock:
-            return stock.get("stock_name")
-        return None
+        return cached["ticker_to_name"].get(ticker)
     except Exception as e:
         logger.error(f"ticker로 주식명 조회 중 오류 발생: {str(e)}")
         return None
@@ -94,8 +143,11 @@ def get_active_stock_names(exclude_etf: bool = False) -> List[str]:
     Returns:
         활성화된 주식명 목록
     """
-    stocks = get_active_stocks(exclude_etf=exclude_etf)
-    return [stock.get("stock_name") for stock in stocks if stock.get("stock_name")]
+    try:
+        return [stock_name for _, stock_name in _get_active_stock_pairs(exclude_etf) if stock_name]
+    except Exception as e:
+        logger.error(f"활성화된 주식명 목록 조회 중 오류 발생: {str(e)}")
+        return []
 
 
 def get_active_tickers(exclude_etf: bool = False) -> List[str]:
@@ -108,8 +160,11 @@ def get_active_tickers(exclude_etf: bool = False) -> List[str]:
     Returns:
         활성화된 ticker 목록
     """
-    stocks = get_active_stocks(exclude_etf=exclude_etf)
-    return [stock.get("ticker") for stock in stocks if stock.get("ticker")]
+    try:
+        return [ticker for ticker, _ in _get_active_stock_pairs(exclude_etf) if ticker]
+    except Exception as e:
+        logger.error(f"활성화된 ticker 목록 조회 중 오류 발생: {str(e)}")
+        return []
 
 
 def get_ticker_to_stock_mapping(exclude_etf: bool = False) -> Dict[str, str]:
@@ -123,23 +178,11 @@ def get_ticker_to_stock_mapping(exclude_etf: bool = False) -> Dict[str, str]:
         {ticker: stock_name} 형태의 딕셔너리
     """
     try:
-        db = get_db()
-        if db is None:
-            return {}
-        
-        query = {"is_active": True}
-        if exclude_etf:
-            query["is_etf"] = {"$ne": True}
-        
-        stocks = db.stocks.find(query)
-        mapping = {}
-        for stock in stocks:
-            ticker = stock.get("ticker")
-            stock_name = stock.get("stock_name")
-            if ticker and stock_name:
-                mapping[ticker] = stock_name
-        
-        return mapping
+        return {
+            ticker: stock_name
+            for ticker, stock_name in _get_active_stock_pairs(exclude_etf)
+            if ticker and stock_name
+        }
     except Exception as e:
         logger.error(f"ticker_to_stock 매핑 생성 중 오류 발생: {str(e)}")
         return {}
@@ -156,23 +199,11 @@ def get_stock_to_ticker_mapping(exclude_etf: bool = False) -> Dict[str, str]:
         {stock_name: ticker} 형태의 딕셔너리
     """
     try:
-        db = get_db()
-        if db is None:
-            return {}
-        
-        query = {"is_active": True}
-        if exclude_etf:
-            query["is_etf"] = {"$ne": True}
-        
-        stocks = db.stocks.find(query)
-        mapping = {}
-        for stock in stocks:
-            ticker = stock.get("ticker")
-            stock_name = stock.get("stock_name")
-            if ticker and stock_name:
-                mapping[stock_name] = ticker
-        
-        return mapping
+        return {
+            stock_name: ticker
+            for ticker, stock_name in _get_active_stock_pairs(exclude_etf)
+            if ticker and stock_name
+        }
     except Exception as e:
         logger.error(f"stock_to_ticker 매핑 생성 중 오류 발생: {str(e)}")
         return {}
@@ -189,12 +220,11 @@ def is_ticker_active(ticker: str) -> bool:
         활성화 여부
     """
     try:
-        db = get_db()
-        if db is None:
+        cached = _get_active_stocks_cache()
+        if cached is None:
             return False
         
-        stock = db.stocks.find_one({"ticker": ticker, "is_active": True})
-        return stock is not None
+        return ticker in cached["ticker_to_name"]
     except Exception as e:
         logger.error(f"ticker 활성화 여부 확인 중 오류 발생: {str(e)}")
         return False
@@ -211,12 +241,11 @@ def is_stock_name_active(stock_name: str) -> bool:
         활성화 여부
     """
     try:
-        db = get_db()
-        if db is None:
+        cached = _get_active_stocks_cache()
+        if cached is None:
             return False
         
-        stock = db.stocks.find_one({"stock_name": stock_name, "is_active": True})
-        return stock is not None
+        return stock_name in cached["name_to_ticker"]
     except Exception as e:
         logger.error(f"주식명 활성화 여부 확인 중 오류 발생: {str(e)}")
         return False
@@ -6,13 +6,19 @@
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
 from app.db.mongodb import get_db
+from app.utils.user_context import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
+# 자동매매 설정 캐시 유효 시간 (초) - 스캔 루프 중 반복 조회 방지
+_CONFIG_CACHE_TTL = 5.0
+
 class TrailingStopService:
     """트레일링 스톱 서비스 클래스"""
     
@@ -23,9 +29,9 @@ class TrailingStopService:
         Args:
             user_id: 사용자 ID. None이면 기본 사용자 ID 사용
         """
-        from app.utils.user_context import get_current_user_id
         self.user_id = user_id or get_current_user_id()
         self._auto_trading_service = None
+        self._config_cache = (None, 0.0)  # (설정, 조회 시각)
 
     @property
     def auto_trading_service(self):
@@ -33,6 +39,16 @@ class TrailingStopService:
             from app.services.auto_trading_service import AutoTradingService
             self._auto_trading_service = AutoTradingService()
         return self._auto_trading_service
+
+    def _get_config(self) -> Dict:
+        """자동매매 설정 조회 (짧은 TTL 동안 인스턴스에 캐시)"""
+        config, loaded_at = self._config_cache
+        now = time.monotonic()
+        if config is not None and now - loaded_at < _CONFIG_CACHE_TTL:
+            return config
+        config = self.auto_trading_service.get_auto_trading_config(user_id=self.user_id)
+        self._config_cache = (config, now)
+        return config
     
     def initialize_trailing_stop(
         self, 
@@ -63,7 +79,7 @@ class TrailingStopService:
             return {}
         
         # 설정에서 트레일링 거리 가져오기 (레버리지 여부에 따라 다름)
-        config = self.auto_trading_service.get_auto_trading_config(user_id=self.user_id)
+        config = self._get_config()
         
         if trailing_distance_percent is None:
             if is_leveraged:
@@ -75,6 +91,7 @@ class TrailingStopService:
             
         initial_highest_price = purchase_price
         initial_stop_price = purchase_price * (1 - trailing_distance_percent / 100)
+        now = datetime.utcnow()
         
         trailing_stop = {
             "user_id": self.user_id,
@@ -88,8 +105,8 @@ class TrailingStopService:
             "dynamic_stop_price": initial_stop_price,
             "is_leveraged": is_leveraged,
             "is_active": True,
-            "last_updated": datetime.utcnow(),
-            "created_at": datetime.utcnow()
+            "last_updated": now,
+            "created_at": now
         }
         
         # upsert로 처리 (이미 존재하면 업데이트, 없으면 생성)
@@ -102,6 +119,38 @@ class TrailingStopService:
         logger.info(f"트레일링 스톱 초기화: {ticker}, 구매가: ${purchase_price:.2f}, 동적 익절가: ${initial_stop_price:.2f}")
         return trailing_stop
 
+    def _build_highest_price_update(self, ticker: str, current_price: float):
+        """
+        최고가 갱신용 조건부 필터와 파이프라인 업데이트 생성
+        
+        현재가가 최고가보다 높고, 새 동적 익절가가 기존보다 높을 때만 갱신되도록
+        조건을 서버에서 검사합니다. (동적 익절가는 절대 하향 조정하지 않음)
+        갱신 시각은 서버의 $$NOW로 기록하여 작업마다 날짜 값을 전송하지 않습니다.
+        """
+        # 새 동적 익절가 = 현재가 * (1 - 트레일링 거리 / 100)
+        new_stop_price_expr = {
+            "$multiply": [
+                current_price,
+                {"$subtract": [1, {"$divide": ["$trailing_distance_percent", 100]}]}
+            ]
+        }
+        update_filter = {
+            "user_id": self.user_id,
+            "ticker": ticker,
+            "is_active": True,
+            "highest_price": {"$lt": current_price},
+            "$expr": {"$gt": [new_stop_price_expr, "$dynamic_stop_price"]}
+        }
+        update_pipeline = [{
+            "$set": {
+                "highest_price": current_price,
+                "highest_price_date": "$$NOW",
+                "dynamic_stop_price": new_stop_price_expr,
+                "last_updated": "$$NOW"
+            }
+        }]
+        return update_filter, update_pipeline
+
     def update_highest_price(self, ticker: str, current_price: float) -> Optional[Dict]:
         """
         최고가 갱신 및 동적 익절가 재계산
@@ -111,52 +160,38 @@ class TrailingStopService:
             current_price: 현재가
         
         Returns:
-            갱신된 TrailingStop 정보
+            갱신된 TrailingStop 정보. 갱신되지 않았으면 None
         """
         db = get_db()
         if db is None:
             return None
-            
-        # 트레일링 스톱 레코드 조회
-        trailing_stop = db.trailing_stops.find_one({
-            "user_id": self.user_id,
-            "ticker": ticker,
-            "is_active": True
-        })
-        
-        if not trailing_stop:
-            return None
         
-        current_highest = trailing_stop["highest_price"]
+        update_filter, update_pipeline = self._build_highest_price_update(ticker, current_price)
+        previous = db.trailing_stops.find_one_and_update(
+            update_filter,
+            update_pipeline,
+            return_document=ReturnDocument.BEFORE
+        )
         
-        # 현재가가 최고가보다 높으면 갱신
-        if current_price > current_highest:
-            new_highest = current_price
-            new_stop_price = new_highest * (1 - trailing_stop["trailing_distance_percent"] / 100)
-            
-            # 동적 익절가는 절대 하향 조정하지 않음
-            # (현재 동적 익절가보다 낮으면 갱신하지 않음)
-            if new_stop_price > trailing_stop["dynamic_stop_price"]:
-                db.trailing_stops.update_one(
-                    {"_id": trailing_stop["_id"]},
-                    {
-                        "$set": {
-                            "highest_price": new_highest,
-                            "highest_price_date": datetime.utcnow(),
-                            "dynamic_stop_price": new_stop_price,
-                            "last_updated": datetime.utcnow()
-                        }
-                    }
-                )
-                
-                logger.info(
-                    f"트레일링 스톱 최고가 갱신: {ticker} "
-                    f"최고가: ${current_highest:.2f} → ${new_highest:.2f}, "
-                    f"동적 익절가: ${trailing_stop['dynamic_stop_price']:.2f} → ${new_stop_price:.2f}"
-                )
-                return db.trailing_stops.find_one({"_id": trailing_stop["_id"]})
+        if previous is None:
+            # 갱신 조건 미충족 또는 레코드 없음 (현재 정보는 get_trailing_stop_info로 조회)
+            return None
         
-        return trailing_stop
+        new_stop_price = current_price * (1 - previous["trailing_distance_percent"] / 100)
+        logger.info(
+            f"트레일링 스톱 최고가 갱신: {ticker} "
+            f"최고가: ${previous['highest_price']:.2f} → ${current_price:.2f}, "
+            f"동적 익절가: ${previous['dynamic_stop_price']:.2f} → ${new_stop_price:.2f}"
+        )
+        # 서버에 기록된 $$NOW와 거의 같은 시각 (추가 조회 없이 반환값 구성)
+        now = datetime.utcnow()
+        return {
+            **previous,
+            "highest_price": current_price,
+            "highest_price_date": now,
+            "dynamic_stop_price": new_stop_price,
+            "last_updated": now
+        }
 
     def check_trailing_stop_triggered(self, ticker: str, current_price: float) -> bool:
         """
@@ -183,10 +218,14 @@ class TrailingStopService:
             return False
         
         # 설정 확인
-        config = self.auto_trading_service.get_auto_trading_config(user_id=self.user_id)
+        config = self._get_config()
         if not config.get("trailing_stop_enabled", False):
             return False
-            
+        
+        return self._is_triggered(trailing_stop, current_price, config)
+
+    def _is_triggered(self, trailing_stop: Dict, current_price: float, config: Dict) -> bool:
+        """트레일링 스톱 레코드와 현재가로 트리거 여부 판단 (설정 활성화 여부는 호출 측에서 확인)"""
         # 레버리지 여부에 따라 다른 최소 수익률 적용
         is_leveraged = trailing_stop.get("is_leveraged", False)
         if is_leveraged:
@@ -206,6 +245,78 @@ class TrailingStopService:
         
         return current_price <= dynamic_stop_price
 
+    def bulk_update_highest_prices(self, prices: Dict[str, float]) -> int:
+        """
+        여러 종목의 최고가를 한 번의 bulk_write로 갱신
+        
+        필터에 is_active 조건이 포함되어 있으므로 활성 트레일링 스톱이 없는 종목은
+        서버에서 무시됩니다. (활성 종목 목록을 미리 조회할 필요 없음)
+        
+        Args:
+            prices: {ticker: 현재가} 딕셔너리
+        
+        Returns:
+            갱신된 종목 수
+        """
+        if not prices:
+            return 0
+        
+        db = get_db()
+        if db is None:
+            return 0
+        
+        operations = [
+            UpdateOne(*self._build_highest_price_update(ticker, current_price))
+            for ticker, current_price in prices.items()
+        ]
+        result = db.trailing_stops.bulk_write(operations, ordered=False)
+        if result.modified_count:
+            logger.info(f"트레일링 스톱 최고가 일괄 갱신: {result.modified_count}개 종목")
+        return result.modified_count
+
+    def bulk_check_triggered(self, prices: Dict[str, float]) -> Dict[str, Dict]:
+        """
+        여러 종목의 트레일링 스톱 조건을 한 번에 확인 (조회 전용, 최고가는 갱신하지 않음)
+        
+        설정 조회 1회, $in 조회 1회로 종목 수와 무관하게 일정한 왕복 횟수로 처리합니다.
+        최고가 갱신은 bulk_update_highest_prices로 호출 측(스케줄러)에서 먼저 수행합니다.
+        
+        Args:
+            prices: {ticker: 현재가} 딕셔너리
+        
+        Returns:
+            {ticker: {"triggered": bool, "highest_price": float, "dynamic_stop_price": float, ...}}
+            활성 트레일링 스톱이 있는 종목만 포함. 트레일링 스톱이 비활성화되어 있으면 빈 딕셔너리
+        """
+        if not prices:
+            return {}
+        
+        db = get_db()
+        if db is None:
+            return {}
+        
+        config = self._get_config()
+        if not config.get("trailing_stop_enabled", False):
+            return {}
+        
+        cursor = db.trailing_stops.find(
+            {"user_id": self.user_id, "ticker": {"$in": list(prices)}, "is_active": True},
+            {
+                "_id": 0,
+                "ticker": 1,
+                "purchase_price": 1,
+                "highest_price": 1,
+                "dynamic_stop_price": 1,
+                "is_leveraged": 1
+            }
+        )
+        results = {}
+        for trailing_stop in cursor:
+            ticker = trailing_stop["ticker"]
+            trailing_stop["triggered"] = self._is_triggered(trailing_stop, prices[ticker], config)
+            results[ticker] = trailing_stop
+        return results
+
     def deactivate_trailing_stop(self, ticker: str):
         """
         매도 시 트레일링 스톱 비활성화
@@ -247,8 +358,9 @@ class TrailingStopService:
         if db is None:
             return []
             
+        # user_active_ticker_idx 인덱스만으로 응답 (_id 제외)
         cursor = db.trailing_stops.find(
             {"user_id": self.user_id, "is_active": True},
-            {"ticker": 1}
+            {"ticker": 1, "_id": 0}
         )
         return [doc["ticker"] for doc in cursor]
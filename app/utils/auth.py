@@ -5,13 +5,32 @@
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Optional, Dict
 from fastapi import HTTPException, status, Depends, Query
 from app.utils.user_context import get_current_user_id, get_default_user_id
 from app.db.mongodb import get_db
 
 logger = logging.getLogger(__name__)
 
+# 사용자 존재 확인 캐시 (존재하는 사용자만 저장, user_id -> 확인 시각)
+_USER_EXISTS_CACHE_TTL = 60  # 초
+_USER_EXISTS_CACHE_MAX_SIZE = 10000
+_user_exists_cache: Dict[str, float] = {}
+
+
+def invalidate_user_exists_cache(user_id: Optional[str] = None):
+    """
+    사용자 존재 확인 캐시 초기화
+    
+    Args:
+        user_id: 초기화할 사용자 ID (None이면 전체 초기화)
+    """
+    if user_id is None:
+        _user_exists_cache.clear()
+    else:
+        _user_exists_cache.pop(user_id, None)
+
 
 def verify_user_access(user_id: Optional[str] = None) -> str:
     """
@@ -43,6 +62,10 @@ def verify_user_access(user_id: Optional[str] = None) -> str:
     if user_id is None:
         return current_user_id
     
+    # 동일 객체(intern된 user_id)이면 문자열 비교 없이 통과
+    if user_id is current_user_id:
+        return user_id
+    
     # 요청한 user_id가 현재 사용자 ID와 일치하는지 확인
     if user_id != current_user_id:
         logger.warning(
@@ -87,6 +110,7 @@ def verify_user_exists(user_id: str) -> bool:
     사용자 존재 여부 확인
     
     MongoDB의 users 컬렉션에서 사용자가 존재하는지 확인합니다.
+    존재하는 사용자는 TTL 동안 캐시하여 반복 요청 시 DB 조회를 생략합니다.
     
     Args:
         user_id: 확인할 사용자 ID
@@ -94,14 +118,27 @@ def verify_user_exists(user_id: str) -> bool:
     Returns:
         사용자가 존재하면 True, 없으면 False
     """
+    now = time.monotonic()
+    verified_at = _user_exists_cache.get(user_id)
+    if verified_at is not None and now - verified_at < _USER_EXISTS_CACHE_TTL:
+        return True
+    
     try:
         db = get_db()
         if db is None:
             logger.warning("MongoDB 연결 실패 - 사용자 존재 여부 확인 불가")
             return False
         
-        user = db.users.find_one({"user_id": user_id})
-        return user is not None
+        # user_id_unique 인덱스만으로 처리되도록 user_id만 조회
+        user = db.users.find_one({"user_id": user_id}, {"_id": 0, "user_id": 1})
+        if user is None:
+            _user_exists_cache.pop(user_id, None)
+            return False
+        
+        if len(_user_exists_cache) >= _USER_EXISTS_CACHE_MAX_SIZE:
+            _user_exists_cache.clear()
+        _user_exists_cache[user_id] = now
+        return True
     except Exception as e:
         logger.error(f"사용자 존재 여부 확인 중 오류 발생: {str(e)}")
         return False
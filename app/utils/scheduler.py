@@ -1,11 +1,18 @@
 import asyncio
-import schedule
+import concurrent.futures
+import heapq
+import math
+import os
+import subprocess
+import sys
 import time
-import pytz
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from pathlib import Path
+from types import MappingProxyType
 import threading
-from typing import Callable
+from collections import defaultdict, deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from app.core.enums import (
     OrderStatus, 
     OrderType, 
@@ -15,16 +22,54 @@ from app.core.enums import (
     get_exchange_code_for_api
 )
 from app.services.stock_recommendation_service import StockRecommendationService
-from app.services.balance_service import get_current_price, order_overseas_stock, order_overseas_stock_daytime, get_all_overseas_balances, get_overseas_balance, get_overseas_order_possible_amount, get_overseas_present_balance, check_order_execution, calculate_portfolio_profit, update_ticker_realized_profit, calculate_total_return, calculate_cumulative_profit
+from app.services.balance_service import KIS_RATE_LIMIT_MSG_CD, get_current_price, order_overseas_stock, order_overseas_stock_daytime, get_all_overseas_balances, get_overseas_balance, get_overseas_order_possible_amount, get_overseas_present_balance, check_order_execution, calculate_portfolio_profit, update_ticker_realized_profit, calculate_total_return, calculate_cumulative_profit
 from app.services.auto_trading_service import AutoTradingService
 from app.core.config import settings
 import logging
 from app.services.economic_service import update_economic_data_in_background
 from app.utils.slack_notifier import slack_notifier
 from app.db.mongodb import get_db
+from pymongo import ReturnDocument
+from app.services.trailing_stop_service import TrailingStopService
+from app.utils.user_context import get_active_users, get_current_user_id, set_global_user_context
 import httpx
 
 # ============= 상수 정의 =============
+KST = ZoneInfo("Asia/Seoul")
+NEW_YORK_TZ = ZoneInfo("America/New_York")
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+_BANNER = "=" * 60
+_SUMMARY_BANNER = "=" * 80
+# API 응답에 output이 없을 때 사용하는 읽기 전용 빈 매핑 (조회마다 빈 dict를 만들지 않음)
+_EMPTY_OUTPUT = MappingProxyType({})
+# 현재가 조회 거래소 순서 (기본 거래소를 맨 앞으로, 나머지는 NAS → AMS → NYS 순)
+_PRICE_EXCHANGES = ("NAS", "AMS", "NYS")
+_EXCHANGES_BY_DEFAULT = {
+    code: (code,) + tuple(e for e in _PRICE_EXCHANGES if e != code) for code in _PRICE_EXCHANGES
+}
+
+# 매도 우선순위별 이름 (처리 및 요약 순서 = 우선순위 값 순서)
+SELL_PRIORITY_NAMES = {
+    SellPriority.STOP_LOSS: "손절 (Priority 1)",
+    SellPriority.TRAILING_STOP: "트레일링 스톱 (Priority 2)",
+    SellPriority.TAKE_PROFIT: "익절 (Priority 3)",
+    SellPriority.TECHNICAL: "기술적 매도 (Priority 4)",
+}
+
+# ============= Slack 메시지 템플릿 =============
+_SLACK_ELAPSED = "시작: {start} (KST)\n완료: {end} (KST)\n소요 시간: {elapsed:.1f}초"
+SLACK_TASK_ERROR = "❌ *{title} 오류*\n오류 발생: {error}"
+SLACK_ECONOMIC_START = "📈 *경제 데이터 업데이트 시작*\n경제 데이터 수집을 시작합니다.\n실행 시간: {start} (KST)"
+SLACK_ECONOMIC_DONE = "✅ *경제 데이터 업데이트 완료*\n경제 데이터 수집이 완료되었습니다.\n" + _SLACK_ELAPSED
+SLACK_23_00_START = "🚀 *23:00 작업 시작*\n경제 데이터 업데이트와 Vertex AI 예측을 병렬로 실행합니다.\n실행 시간: {start} (KST)"
+SLACK_23_00_DONE = "✅ *23:00 작업 완료*\n경제 데이터 업데이트: {economic}\nVertex AI 예측: {prediction}\n" + _SLACK_ELAPSED
+SLACK_VERTEX_START = "🚀 *Vertex AI 주가 예측 시작*\nrun_predict_vertex_ai.py 실행을 시작합니다.\n실행 시간: {start} (KST)"
+SLACK_VERTEX_DONE = "✅ *Vertex AI 주가 예측 완료*\nrun_predict_vertex_ai.py 실행이 성공적으로 완료되었습니다.\n\n출력:\n```\n{output}\n```"
+SLACK_VERTEX_FAILED = "❌ *Vertex AI 주가 예측 실패*\nExit Code: {returncode}\n\n오류:\n```\n{output}\n```"
+SLACK_PARALLEL_START = "🚀 *병렬 분석 작업 시작*\n기술적 지표와 감정 분석을 병렬로 실행합니다.\n실행 시간: {start} (KST)"
+SLACK_PARALLEL_DONE = "✅ *병렬 분석 작업 완료*\n" + _SLACK_ELAPSED
+SLACK_TECHNICAL_DONE = "📊 *기술적 지표 분석 완료*\n날짜: {date}\n분석 종목: {total}개\n추천 종목: {recommended}개"
+
 class SchedulerConfig:
     """스케줄러 설정 상수"""
     # 현재가 조회 실패 관련
@@ -34,11 +79,21 @@ class SchedulerConfig:
     
     # 주문 실패 관련
     ORDER_FAILURE_EXCLUDE_MINUTES = 60  # 주문 실패 후 제외 시간 (분)
+    BALANCE_CACHE_TTL_SECONDS = 3.0  # 해외 잔고 조회 결과 재사용 시간 (초)
+    PRICE_CACHE_TTL_SECONDS = 2.0  # 매수/재주문 현재가 조회 결과 재사용 시간 (초)
+    MAX_CONCURRENT_SELL = 3  # 같은 우선순위 매도 종목 동시 처리 수 (KIS API 초당 호출 제한 고려)
+    MAX_CONCURRENT_PRICE_FETCHES = 4  # 매수 후보 현재가 선조회 동시 호출 수 (KIS API 초당 호출 제한 고려)
+    BUY_ORDERS_PER_SECOND = 2  # 매수 주문 초당 최대 전송 수 (토큰 버킷, 한도 안에서는 대기 없이 전송)
+    ORDER_RATE_LIMIT_MAX_RETRIES = 3  # 주문이 Rate limiting 에러로 거부된 경우 재시도 횟수
+    ORDER_RATE_LIMIT_BACKOFF_SECONDS = 1.0  # Rate limiting 재시도 첫 대기 시간 (초, 재시도마다 2배)
+    FAILURE_TRACKING_MAX_SIZE = 1024  # 실패 추적 dict 크기가 이를 넘으면 만료 항목 정리
     
     # API 요청 간 지연
     ORDER_DELAY_SECONDS = 2  # 주문 간 지연 시간 (초)
     EXECUTION_CHECK_DELAY_SECONDS = 5  # 체결 확인 대기 시간 (초)
-    EXECUTION_CHECK_TIMEOUT_SECONDS = 60  # 체결 확인 타임아웃 (초)
+    EXECUTION_CHECK_TIMEOUT_SECONDS = 60  # 주문별 체결 확인 타임아웃 (초)
+    EXECUTION_FALLBACK_WAIT_SECONDS = 10  # 주문 조회 실패 시 잔고로 체결 여부를 확인하기 전 대기 시간 (초)
+    EXECUTION_FALLBACK_SHARE_SECONDS = 1.0  # 동시 체결 확인이 잔고 스냅샷을 공유할 때 허용하는 대기 시간 단축 폭 (초)
     
     
     # 스케줄 시간
@@ -50,6 +105,10 @@ class SchedulerConfig:
     SCHEDULE_AUTO_BUY = "23:50"
     SCHEDULE_CLEANUP_ORDERS = "06:30"
     SCHEDULE_PORTFOLIO_PROFIT_REPORT = "07:00"
+    AUTO_SELL_INTERVAL_SECONDS = 300  # 매도 작업 실행 주기 (5분)
+    SCHEDULER_MAX_SLEEP_SECONDS = 600  # 다음 실행 시각 재계산 주기 (시스템 시계 보정 대비)
+    SUBPROCESS_OUTPUT_TAIL_LINES = 50  # 예측 스크립트 출력 중 보관할 마지막 줄 수
+    SLACK_OUTPUT_PREVIEW_CHARS = 1000  # Slack 알림에 포함할 출력 최대 길이
     
     # 시장 시간
     MARKET_OPEN_HOUR = 9
@@ -59,26 +118,303 @@ class SchedulerConfig:
     DAYTIME_TRADING_START_HOUR = 10  # 한국시간 기준 주간거래 시작 시간
     DAYTIME_TRADING_END_HOUR = 18  # 한국시간 기준 주간거래 종료 시간
 
+
+def _next_daily_run_timestamp(time_str: str, now: datetime) -> float:
+    """
+    now 이후 처음 도래하는 HH:MM 실행 시각을 epoch 초로 반환
+    
+    Args:
+        time_str: 실행 시각 (HH:MM, now와 같은 시간대 기준)
+        now: 기준 시각 (timezone 포함)
+    """
+    hour, minute = map(int, time_str.split(":"))
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return run_at.timestamp()
+
+
+def _output_preview(output: str) -> str:
+    """Slack 알림용 출력 미리보기 (길 때만 뒷부분을 잘라 새 문자열 생성)"""
+    if len(output) > SchedulerConfig.SLACK_OUTPUT_PREVIEW_CHARS:
+        return output[-SchedulerConfig.SLACK_OUTPUT_PREVIEW_CHARS:]
+    return output
+
+
+def _technical_done_message(tech_result: dict) -> str:
+    """기술적 지표 분석 완료 Slack 메시지 생성"""
+    tech_data = tech_result.get('data', [])
+    recommended_count = sum(1 for r in tech_data if r.get('추천_여부'))
+    # 날짜 정보는 recommendations의 첫 번째 항목에서 가져오거나, 없으면 현재 날짜 사용
+    date_str = tech_data[0].get('날짜') if tech_data else None
+    if not date_str:
+        date_str = datetime.now().strftime("%Y-%m-%d")
+    return SLACK_TECHNICAL_DONE.format(date=date_str, total=len(tech_data), recommended=recommended_count)
+
+
+def _korea_now_str() -> str:
+    """현재 한국 시간 문자열"""
+    return datetime.now(KST).strftime(_TIME_FORMAT)
+
+
+def _time_diagnostics(korea_time_str: str = None) -> str:
+    """시간 진단 로그용 문자열 (시스템 로컬 시간 + 한국 시간)"""
+    return f"시스템 시간: {datetime.now().strftime(_TIME_FORMAT)}, 한국 시간: {korea_time_str or _korea_now_str()} KST"
+
+
+async def _fetch_price_results(ticker: str, exchanges: Sequence[str], probes: dict = None) -> list:
+    """
+    여러 거래소의 현재가를 동시에 조회 (exchanges 순서대로 결과 또는 예외 반환)
+    
+    Args:
+        probes: 한 번의 매도 실행 동안 공유하는 {(거래소, 티커): 조회 태스크} 딕셔너리.
+            레버리지 종목의 본주와 본주 자체가 모두 매도 대상일 때처럼 같은 조회가
+            겹치면 진행 중이거나 완료된 조회 결과를 재사용합니다.
+    """
+    if probes is None:
+        probes = {}
+    tasks = []
+    for exchange in exchanges:
+        task = probes.get((exchange, ticker))
+        if task is None:
+            task = asyncio.ensure_future(
+                asyncio.to_thread(get_current_price, {"AUTH": "", "EXCD": exchange, "SYMB": ticker})
+            )
+            probes[(exchange, ticker)] = task
+        tasks.append(task)
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _index_holdings(holdings: list) -> Dict[str, dict]:
+    """잔고 조회 output1 목록을 {티커(ovrs_pdno): 보유 종목} 딕셔너리로 변환"""
+    return {item["ovrs_pdno"]: item for item in holdings if item.get("ovrs_pdno")}
+
+
+def _load_leverage_map(tickers: List[str]) -> Dict[str, str]:
+    """레버리지 티커 -> 본주 티커 매핑을 한 번의 쿼리로 조회 (leverage_ticker 필드로 역매핑)"""
+    db = get_db()
+    if db is None:
+        return {}
+    return {
+        doc["leverage_ticker"]: doc.get("ticker")
+        for doc in db.stocks.find(
+            {"leverage_ticker": {"$in": tickers}},
+            {"_id": 0, "ticker": 1, "leverage_ticker": 1}
+        )
+    }
+
+
+def _parse_price(value) -> Optional[float]:
+    """API 응답의 가격 문자열을 양수 float로 변환 (비어있거나 유효하지 않으면 None)"""
+    if not value:
+        return None
+    try:
+        price = float(value)
+    except (ValueError, TypeError):
+        return None
+    return price if price > 0 else None
+
+
+def _buy_order_target(actual_ticker: str) -> Tuple[str, str, str]:
+    """
+    매수 주문 티커에서 (거래소 코드, 순수 티커, 현재가 조회용 거래소 코드) 결정 (미국 주식 기준)
+    
+    거래소 구분이 티커에 포함된 경우(.N: NYSE, .X: NASDAQ) 이를 사용하고, 없으면 NASDAQ으로 간주
+    """
+    if actual_ticker.endswith(".X") or actual_ticker.endswith(".N"):
+        exchange_code = "NYSE" if actual_ticker.endswith(".N") else "NASD"
+        pure_ticker = actual_ticker.split(".")[0]
+    else:
+        exchange_code = "NASD"
+        pure_ticker = actual_ticker
+    return exchange_code, pure_ticker, "NYS" if exchange_code == "NYSE" else "NAS"
+
+
+def _select_price_result(exchanges: Sequence[str], results: list) -> Tuple[str, dict]:
+    """
+    거래소 우선순위 순서로 가격 데이터(last 또는 base)가 있는 첫 응답 선택
+    
+    Returns:
+        (거래소 코드, 응답). 유효한 응답이 없으면 (None, 마지막 거래소 응답 - 에러 메시지 확인용)
+    """
+    for exchange, result in zip(exchanges, results):
+        if isinstance(result, BaseException):
+            continue
+        output = result.get("output") or {}
+        if result.get("rt_cd") == "0" and (output.get("last") or output.get("base")):
+            return exchange, result
+    last_result = results[-1] if results else None
+    return None, None if isinstance(last_result, BaseException) else last_result
+
+
+def _log_banner(message: str):
+    """구분선으로 감싼 메시지를 한 번의 로그 호출로 기록"""
+    logger.info("%s\n%s\n%s", _BANNER, message, _BANNER)
+
+
+async def _read_stream_tail(stream: asyncio.StreamReader, tail: deque):
+    """서브프로세스 출력을 줄 단위로 읽으며 마지막 줄만 보관 (출력 크기와 무관하게 메모리 일정)"""
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            # 한 줄이 버퍼 한도를 넘으면 해당 줄은 버리고 계속 읽음
+            continue
+        if not line:
+            break
+        tail.append(line)
+
+
+class _TTLDict(dict):
+    """
+    크기가 max_size를 넘으면 ttl_seconds보다 오래된 항목을 정리하는 dict
+    
+    값에 저장된 time.monotonic() 타임스탬프를 timestamp_of로 꺼내 만료 여부를 판단합니다.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_size: int, timestamp_of: Callable = lambda value: value):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._timestamp_of = timestamp_of
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if len(self) > self.max_size:
+            self.evict_expired()
+    
+    def evict_expired(self):
+        """만료된 항목 제거"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [key for key, value in self.items() if self._timestamp_of(value) < cutoff]
+        for key in expired:
+            del self[key]
+
+
+class _AsyncRateLimiter:
+    """
+    토큰 버킷 방식의 비동기 호출 속도 제한 (async with로 사용)
+    
+    초당 rate개까지는 대기 없이 통과시키고, 토큰이 없으면 다음 토큰이 채워질 때까지만 대기합니다.
+    대기 중인 호출은 진입 순서대로 통과합니다. asyncio.Lock을 사용하므로 한 이벤트 루프 안에서만 사용합니다.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                await asyncio.sleep(-self._tokens / self.rate)
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _FillCheckHoldings:
+    """
+    한 번의 매수 실행에서 체결 확인 fallback이 공유하는 전체 해외 잔고 스냅샷
+    
+    매수 실행마다 새로 만들어 해당 실행의 체결 확인 태스크에만 전달합니다.
+    asyncio.Lock을 사용하므로 한 이벤트 루프 안에서만 사용합니다.
+    """
+    
+    def __init__(self):
+        self._holdings = None  # type: Optional[Dict[str, dict]]
+        self._loaded_at = 0.0  # 조회 시작 시각 (monotonic)
+        self._lock = asyncio.Lock()
+    
+    async def get(self, not_before: float) -> Optional[Dict[str, dict]]:
+        """
+        티커별 보유 종목 반환 (동시에 진행 중인 체결 확인이 한 번의 조회를 공유)
+        
+        not_before(monotonic) 이후에 조회를 시작한 스냅샷만 재사용하므로, 주문별 체결 대기 시간보다
+        이른 잔고로 체결 여부를 판단하지 않습니다. 조회 실패 시 None을 반환하며 실패 결과는 공유하지 않습니다.
+        """
+        async with self._lock:
+            if self._holdings is not None and self._loaded_at >= not_before:
+                return self._holdings
+            loaded_at = time.monotonic()
+            balance_result = await asyncio.to_thread(get_all_overseas_balances)
+            if balance_result.get("rt_cd") != "0":
+                return None
+            self._holdings = _index_holdings(balance_result.get("output1", []))
+            self._loaded_at = loaded_at
+            return self._holdings
+
+
 class StockScheduler:
     """주식 자동매매 스케줄러 클래스"""
     
+    # 한국 시간 기준 일일 작업 (실행 시각, 메서드 이름, 설명)
+    DAILY_JOBS = (
+        # 새벽 6시 5분에 경제 데이터 업데이트 작업 실행
+        (SchedulerConfig.SCHEDULE_ECONOMIC_DATA_UPDATE_1, "_run_economic_data_update", "경제 데이터"),
+        # 밤 11시에 경제 데이터 재수집 및 Vertex AI 예측 작업을 병렬로 실행
+        (SchedulerConfig.SCHEDULE_ECONOMIC_DATA_UPDATE_2, "_run_23_00_tasks", "23:00 작업 (경제 데이터 업데이트 + Vertex AI 예측 병렬 실행)"),
+        # 밤 11시 5분에 병렬 분석 작업 실행 (충분한 시간 확보)
+        (SchedulerConfig.SCHEDULE_PARALLEL_ANALYSIS, "_run_parallel_analysis", "병렬 분석 (기술적 지표 + 감정 분석)"),
+        # 밤 11시 45분에 통합 분석 작업 실행
+        (SchedulerConfig.SCHEDULE_COMBINED_ANALYSIS, "_run_combined_analysis", "통합 분석 (AI 예측 + 기술적 지표 + 감정 분석)"),
+        # 밤 11시 50분(23:50)에 매수 작업 실행 (장 시작 20분 후)
+        (SchedulerConfig.SCHEDULE_AUTO_BUY, "_run_auto_buy", "매수"),
+        # 새벽 6시 30분에 장 마감 후 미체결 주문 정리 (16:00 ET 이후)
+        (SchedulerConfig.SCHEDULE_CLEANUP_ORDERS, "_cleanup_pending_orders", "미체결 주문 정리 (장 마감 후)"),
+        # 오전 7시에 계좌 수익율 리포트 전송
+        (SchedulerConfig.SCHEDULE_PORTFOLIO_PROFIT_REPORT, "_run_portfolio_profit_report", "계좌 수익율 리포트"),
+    )
+    
     def __init__(self):
         self.recommendation_service = StockRecommendationService()
         self.auto_trading_service = AutoTradingService()
         self.running = False
         self.sell_running = False  # 매도 스케줄러 실행 상태
         self.analysis_running = False  # 분석 스케줄러 실행 상태
-        self.scheduler_thread = None
-        self.buy_executing = False  # 매수 작업 실행 중 플래그 (중복 실행 방지)
-        self.analysis_executing = False  # 분석 작업 실행 중 플래그 (중복 실행 방지)
-        self.prediction_executing = False  # Vertex AI 예측 작업 실행 중 플래그 (중복 실행 방지)
-        self.economic_executing = False  # 경제 데이터 업데이트 작업 실행 중 플래그 (중복 실행 방지)
-        self.tasks_23_00_executing = False  # 23:00 작업 실행 중 플래그 (중복 실행 방지)
-        self.stopping = False  # 중지 중 플래그 (중복 중지 방지)
-        # 현재가 조회 실패한 종목 추적 (ticker -> (실패 횟수, 마지막 실패 시간))
-        self.price_fetch_failures = {}  # type: dict[str, tuple[int, datetime]]
-        # 주문 실패한 종목 추적 (ticker -> 마지막 실패 시간)
-        self.order_failures = {}  # type: dict[str, datetime]
+        self.scheduler_thread = None  # 스케줄러 전용 이벤트 루프 스레드
+        self._loop = None  # 스케줄러 전용 이벤트 루프
+        self._daily_future = None  # 일일 작업 실행 태스크
+        self._sell_future = None  # 매도 작업 실행 태스크
+        # 예측 스크립트 경로 (프로세스 수명 동안 변하지 않으므로 1회만 계산)
+        self._project_root = Path(__file__).resolve().parents[2]
+        self._vertex_script = self._project_root / "scripts" / "run" / "run_predict_vertex_ai.py"
+        self._predict_script = self._project_root / "scripts" / "utils" / "predict.py"
+        self._vertex_env = None  # Vertex AI 예측 스크립트용 환경변수 (최초 실행 시 생성)
+        # 작업별 중복 실행 방지 락 (확인과 획득을 acquire(blocking=False) 한 번에 처리)
+        # 작업이 이벤트 루프, 워커 스레드, API 요청 스레드에서 모두 호출되므로 threading.Lock 사용
+        self._locks = {
+            name: threading.Lock()
+            for name in ("buy", "analysis", "prediction", "economic", "tasks_23_00", "stop")
+        }
+        # 실패 추적 항목 만료 시간 (두 제외 시간 중 긴 쪽 기준)
+        failure_ttl_seconds = max(SchedulerConfig.PRICE_FETCH_EXCLUDE_MINUTES, SchedulerConfig.ORDER_FAILURE_EXCLUDE_MINUTES) * 60
+        # 현재가 조회 실패한 종목 추적 (ticker -> (실패 횟수, 마지막 실패 시각 monotonic))
+        self.price_fetch_failures = _TTLDict(failure_ttl_seconds, SchedulerConfig.FAILURE_TRACKING_MAX_SIZE, timestamp_of=lambda value: value[1])  # type: dict[str, tuple[int, float]]
+        # 주문 실패한 종목 추적 (ticker -> 마지막 실패 시각 monotonic)
+        self.order_failures = _TTLDict(failure_ttl_seconds, SchedulerConfig.FAILURE_TRACKING_MAX_SIZE)  # type: dict[str, float]
+        self._holdings_cache = (None, 0.0)  # (티커별 보유 종목, 조회 시각 monotonic)
+        # 매수/재주문 현재가 조회 캐시 ((거래소, 티커) -> (조회 시각 monotonic, 응답))
+        self._price_cache = _TTLDict(SchedulerConfig.PRICE_CACHE_TTL_SECONDS, SchedulerConfig.FAILURE_TRACKING_MAX_SIZE, timestamp_of=lambda value: value[0])
+        # 사용자별 트레일링 스톱 서비스 (user_id -> TrailingStopService, 설정 캐시를 실행 간 공유)
+        self._trailing_stop_services = {}  # type: dict[str, TrailingStopService]
+        # 매도 주문 데이터의 고정 필드 (계좌 정보와 주문 구분은 프로세스 수명 동안 변하지 않음)
+        self._sell_order_template = {
+            "CANO": settings.KIS_CANO,
+            "ACNT_PRDT_CD": settings.KIS_ACNT_PRDT_CD,
+            "ORD_DVSN": OrderType.LIMIT.value,  # 지정가
+            "is_buy": False,  # 매도
+        }
+    
+    @property
+    def prediction_executing(self) -> bool:
+        """Vertex AI 예측 작업 실행 중 여부"""
+        return self._locks["prediction"].locked()
     
     def start(self):
         """매수 스케줄러 시작"""
@@ -86,71 +422,30 @@ class StockScheduler:
             logger.warning("매수 스케줄러가 이미 실행 중입니다.")
             return False
         
-        # 기존 작업이 있다면 먼저 취소 (중복 등록 방지)
-        job_names = [
-            '_run_auto_buy',
-            '_run_analysis',
-            '_run_parallel_analysis',
-            '_run_combined_analysis',
-            '_run_vertex_ai_prediction',
-            '_run_economic_data_update',
-            '_run_23_00_tasks',
-            '_run_portfolio_profit_report'
-        ]
-        
-        for job in schedule.jobs:
-            if job.job_func.__name__ in job_names:
-                schedule.cancel_job(job)
-        
-        # 한국 시간 기준 새벽 6시 5분에 경제 데이터 업데이트 작업 실행
-        schedule.every().day.at(SchedulerConfig.SCHEDULE_ECONOMIC_DATA_UPDATE_1).do(self._run_economic_data_update)
-        
-        # 한국 시간 기준 밤 11시에 경제 데이터 재수집 및 Vertex AI 예측 작업을 병렬로 실행
-        schedule.every().day.at(SchedulerConfig.SCHEDULE_ECONOMIC_DATA_UPDATE_2).do(self._run_23_00_tasks)
-        
-        # 한국 시간 기준 밤 11시 5분에 병렬 분석 작업 실행 (충분한 시간 확보)
-        parallel_job = schedule.every().day.at(SchedulerConfig.SCHEDULE_PARALLEL_ANALYSIS).do(self._run_parallel_analysis)
-        logger.info(f"병렬 분석 작업 등록 완료: 매일 {SchedulerConfig.SCHEDULE_PARALLEL_ANALYSIS} (KST)")
-
-        # 한국 시간 기준 밤 11시 45분에 통합 분석 작업 실행
-        combined_job = schedule.every().day.at(SchedulerConfig.SCHEDULE_COMBINED_ANALYSIS).do(self._run_combined_analysis)
-        logger.info(f"통합 분석 작업 등록 완료: 매일 {SchedulerConfig.SCHEDULE_COMBINED_ANALYSIS} (KST)")
-        
-        # 한국 시간 기준 밤 11시 50분(23:50)에 매수 작업 실행 (장 시작 20분 후)
-        schedule.every().day.at(SchedulerConfig.SCHEDULE_AUTO_BUY).do(self._run_auto_buy)
-        
-        # 한국 시간 기준 새벽 6시 30분에 장 마감 후 미체결 주문 정리 (16:00 ET 이후)
-        schedule.every().day.at(SchedulerConfig.SCHEDULE_CLEANUP_ORDERS).do(self._cleanup_pending_orders)
+        # 한국 시간 기준 일일 작업 목록 (실행 시각, 실행 함수)
+        daily_jobs = [(time_str, getattr(self, method_name)) for time_str, method_name, _ in self.DAILY_JOBS]
         
-        # 한국 시간 기준 오전 7시에 계좌 수익율 리포트 전송
-        schedule.every().day.at(SchedulerConfig.SCHEDULE_PORTFOLIO_PROFIT_REPORT).do(self._run_portfolio_profit_report)
-        
-        # 별도 스레드에서 스케줄러 실행
+        # 스케줄러 전용 이벤트 루프에서 일일 작업 실행
         self.running = True
         self.analysis_running = True
-        self.scheduler_thread = threading.Thread(target=self._run_scheduler)
-        self.scheduler_thread.daemon = True
-        self.scheduler_thread.start()
+        self._ensure_scheduler_loop()
+        self._daily_future = asyncio.run_coroutine_threadsafe(self._run_daily_jobs(daily_jobs), self._loop)
         
-        # 하나의 상세한 로그로 통합
-        logger.info("=" * 60)
-        logger.info("주식 자동매매 스케줄러가 시작되었습니다.")
-        logger.info("=" * 60)
-        logger.info("등록된 스케줄:")
-        logger.info("  - 경제 데이터: 매일 06:05")
-        logger.info("  - 23:00 작업: 매일 23:00 (경제 데이터 업데이트 + Vertex AI 예측 병렬 실행)")
-        logger.info(f"  - 병렬 분석: 매일 {SchedulerConfig.SCHEDULE_PARALLEL_ANALYSIS} (기술적 지표 + 감정 분석)")
-        logger.info(f"  - 통합 분석: 매일 {SchedulerConfig.SCHEDULE_COMBINED_ANALYSIS} (AI 예측 + 기술적 지표 + 감정 분석)")
-        logger.info("  - 매수: 매일 00:00")
-        logger.info("  - 미체결 주문 정리: 매일 06:30 (장 마감 후)")
-        logger.info("  - 계좌 수익율 리포트: 매일 07:00")
+        # 하나의 상세한 로그로 통합 (등록 목록도 같은 작업 테이블에서 생성)
+        schedule_lines = "\n".join(
+            f"  - {description}: 매일 {time_str}" for time_str, _, description in self.DAILY_JOBS
+        )
+        logger.info(
+            "%s\n주식 자동매매 스케줄러가 시작되었습니다.\n%s\n등록된 스케줄:\n%s",
+            _BANNER, _BANNER, schedule_lines
+        )
         
         # Slack 알림 설정 확인
         if settings.SLACK_WEBHOOK_URL_SCHEDULER:
-            logger.info(f"Slack 스케줄러 알림: 활성화됨")
+            logger.info("Slack 스케줄러 알림: 활성화됨\n%s", _BANNER)
         else:
             logger.warning("⚠️  Slack 스케줄러 알림: SLACK_WEBHOOK_URL_SCHEDULER 환경변수가 설정되지 않아 알림이 전송되지 않습니다.")
-        logger.info("=" * 60)
+            logger.info(_BANNER)
         return True
     
     def stop(self):
@@ -158,70 +453,51 @@ class StockScheduler:
         if not self.running:
             return False
         
-        if self.stopping:
+        if not self._locks["stop"].acquire(blocking=False):
             return False  # 이미 중지 중이면 중복 로그 방지
         
-        self.stopping = True
-        self.running = False
-        self.analysis_running = False
-        if self.scheduler_thread:
-            self.scheduler_thread.join(timeout=5)
-        
-        # 매수 및 분석 관련 작업 취소 (sell 스케줄러는 유지)
-        job_names = [
-            '_run_auto_buy',
-            '_run_analysis',
-            '_run_parallel_analysis',
-            '_run_combined_analysis',
-            '_run_vertex_ai_prediction',
-            '_run_economic_data_update',
-            '_run_23_00_tasks',
-            '_cleanup_pending_orders',
-            '_run_portfolio_profit_report'
-        ]
-        
-        for job in schedule.jobs:
-            if job.job_func.__name__ in job_names:
-                schedule.cancel_job(job)
-        
-        logger.info("매수 및 분석 스케줄러가 중지되었습니다.")
-        self.stopping = False
-        return True
+        try:
+            self.running = False
+            self.analysis_running = False
+            
+            # 매수 및 분석 관련 작업 취소 (sell 스케줄러는 유지)
+            if self._daily_future:
+                self._daily_future.cancel()
+                self._daily_future = None
+            self._stop_scheduler_loop_if_idle()
+            
+            logger.info("매수 및 분석 스케줄러가 중지되었습니다.")
+            return True
+        finally:
+            self._locks["stop"].release()
 
-    def _run_economic_data_update(self, send_slack_notification: bool = True):
+    async def _run_economic_data_update(self, send_slack_notification: bool = True):
         """경제 데이터 업데이트 실행 함수"""
         function_name = "_run_economic_data_update"
         
         # 중복 실행 방지
-        if self.economic_executing:
+        if not self._locks["economic"].acquire(blocking=False):
             logger.warning(f"[{function_name}] 경제 데이터 업데이트가 이미 실행 중입니다. 중복 실행을 건너뜁니다.")
             return False
         
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        start_time_str = now_korea.strftime('%Y-%m-%d %H:%M:%S')
-        logger.info(f"[{function_name}] 함수 실행 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {start_time_str} KST)")
-        
-        self.economic_executing = True
+        started = time.monotonic()
+        start_time_str = _korea_now_str()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[{function_name}] 함수 실행 시작 ({_time_diagnostics(start_time_str)})")
         
         if send_slack_notification:
-            send_scheduler_slack_notification(f"📈 *경제 데이터 업데이트 시작*\n경제 데이터 수집을 시작합니다.\n실행 시간: {start_time_str} (KST)")
+            await _notify_slack(SLACK_ECONOMIC_START.format(start=start_time_str))
         
         try:
-            asyncio.run(update_economic_data_in_background())
-            end_time_korea = datetime.now(korea_tz)
-            end_time_str = end_time_korea.strftime('%Y-%m-%d %H:%M:%S')
-            elapsed_time = (end_time_korea - now_korea).total_seconds()
+            # update_economic_data_in_background는 내부적으로 블로킹 호출만 수행하므로
+            # 워커 스레드에서 실행하여 스케줄러 이벤트 루프(병렬 실행 중인 작업)를 막지 않음
+            await asyncio.to_thread(asyncio.run, update_economic_data_in_background())
+            elapsed_time = time.monotonic() - started
             logger.info(f"[{function_name}] 함수 실행 완료 (소요 시간: {elapsed_time:.1f}초)")
             if send_slack_notification:
-                success = send_scheduler_slack_notification(
-                    f"✅ *경제 데이터 업데이트 완료*\n"
-                    f"경제 데이터 수집이 완료되었습니다.\n"
-                    f"시작: {start_time_str} (KST)\n"
-                    f"완료: {end_time_str} (KST)\n"
-                    f"소요 시간: {elapsed_time:.1f}초"
+                success = await _notify_slack(
+                    SLACK_ECONOMIC_DONE.format(start=start_time_str, end=_korea_now_str(), elapsed=elapsed_time)
                 )
                 if not success:
                     logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (경제 데이터 업데이트 완료)")
@@ -230,15 +506,15 @@ class StockScheduler:
             logger.error(f"[{function_name}] 함수 실행 중 오류 발생: {str(e)}", exc_info=True)
             logger.info(f"[{function_name}] 함수 실행 완료 (오류)")
             if send_slack_notification:
-                success = send_scheduler_slack_notification(f"❌ *경제 데이터 업데이트 오류*\n오류 발생: {str(e)}")
+                success = await _notify_slack(SLACK_TASK_ERROR.format(title="경제 데이터 업데이트", error=e))
                 if not success:
                     logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (경제 데이터 업데이트 오류)")
             return False
         finally:
-            # 실행 완료 후 플래그 해제
-            self.economic_executing = False
+            # 실행 완료 후 락 해제
+            self._locks["economic"].release()
 
-    def _run_23_00_tasks(self, send_slack_notification: bool = True):
+    async def _run_23_00_tasks(self, send_slack_notification: bool = True):
         """
         23:00에 실행되어야 하는 작업들을 병렬로 실행
         - 경제 데이터 업데이트
@@ -247,205 +523,176 @@ class StockScheduler:
         function_name = "_run_23_00_tasks"
         
         # 중복 실행 방지
-        if self.tasks_23_00_executing:
+        if not self._locks["tasks_23_00"].acquire(blocking=False):
             logger.warning(f"[{function_name}] 23:00 작업이 이미 실행 중입니다. 중복 실행을 건너뜁니다.")
             return False
         
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        start_time_str = now_korea.strftime('%Y-%m-%d %H:%M:%S')
-        
-        self.tasks_23_00_executing = True
+        started = time.monotonic()
+        start_time_str = _korea_now_str()
         
-        logger.info("=" * 60)
-        logger.info(f"[{function_name}] 23:00 작업 시작 (한국 시간: {start_time_str} KST)")
-        logger.info("=" * 60)
+        _log_banner(f"[{function_name}] 23:00 작업 시작 (한국 시간: {start_time_str} KST)")
         
         if send_slack_notification:
-            send_scheduler_slack_notification(
-                f"🚀 *23:00 작업 시작*\n"
-                f"경제 데이터 업데이트와 Vertex AI 예측을 병렬로 실행합니다.\n"
-                f"실행 시간: {start_time_str} (KST)"
-            )
+            await _notify_slack(SLACK_23_00_START.format(start=start_time_str))
         
         try:
-            import concurrent.futures
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                # 1. 경제 데이터 업데이트
-                logger.info(f"[{function_name}] 경제 데이터 업데이트 시작...")
-                economic_future = executor.submit(
-                    self._run_economic_data_update,
-                    send_slack_notification=False  # 개별 알림은 비활성화 (통합 알림만)
-                )
-                
-                # 2. Vertex AI 예측
-                logger.info(f"[{function_name}] Vertex AI 예측 시작...")
-                prediction_future = executor.submit(
-                    self._run_vertex_ai_prediction,
-                    send_slack_notification=False  # 개별 알림은 비활성화 (통합 알림만)
-                )
-                
-                # 두 작업 완료 대기
-                economic_result = economic_future.result()
-                prediction_result = prediction_future.result()
-                
-                end_time_korea = datetime.now(korea_tz)
-                end_time_str = end_time_korea.strftime('%Y-%m-%d %H:%M:%S')
-                elapsed_time = (end_time_korea - now_korea).total_seconds()
-                
-                logger.info(f"[{function_name}] ✅ 경제 데이터 업데이트 완료: {economic_result}")
-                logger.info(f"[{function_name}] ✅ Vertex AI 예측 완료: {prediction_result}")
-                logger.info("=" * 60)
-                logger.info(f"[{function_name}] 23:00 작업 완료 (소요 시간: {elapsed_time:.1f}초)")
-                logger.info("=" * 60)
-                
-                if send_slack_notification:
-                    send_scheduler_slack_notification(
-                        f"✅ *23:00 작업 완료*\n"
-                        f"경제 데이터 업데이트: {'성공' if economic_result else '실패'}\n"
-                        f"Vertex AI 예측: {'성공' if prediction_result else '실패'}\n"
-                        f"시작: {start_time_str} (KST)\n"
-                        f"완료: {end_time_str} (KST)\n"
-                        f"소요 시간: {elapsed_time:.1f}초"
-                    )
-                
-                return economic_result and prediction_result
+            # 경제 데이터 업데이트와 Vertex AI 예측을 같은 이벤트 루프에서 동시에 실행
+            # (개별 알림은 비활성화하고 통합 알림만 전송)
+            logger.info(f"[{function_name}] 경제 데이터 업데이트 시작...")
+            logger.info(f"[{function_name}] Vertex AI 예측 시작...")
+            economic_result, prediction_result = await asyncio.gather(
+                self._run_economic_data_update(send_slack_notification=False),
+                self._run_vertex_ai_prediction(send_slack_notification=False),
+                return_exceptions=True
+            )
+            for task_name, result in (("경제 데이터 업데이트", economic_result), ("Vertex AI 예측", prediction_result)):
+                if isinstance(result, BaseException):
+                    logger.error(f"[{function_name}] ❌ {task_name} 중 오류 발생: {str(result)}", exc_info=result)
+            economic_result = economic_result is True
+            prediction_result = prediction_result is True
+            
+            elapsed_time = time.monotonic() - started
+            
+            logger.info(f"[{function_name}] ✅ 경제 데이터 업데이트 완료: {economic_result}")
+            logger.info(f"[{function_name}] ✅ Vertex AI 예측 완료: {prediction_result}")
+            _log_banner(f"[{function_name}] 23:00 작업 완료 (소요 시간: {elapsed_time:.1f}초)")
+            
+            if send_slack_notification:
+                await _notify_slack(SLACK_23_00_DONE.format(
+                    economic='성공' if economic_result else '실패',
+                    prediction='성공' if prediction_result else '실패',
+                    start=start_time_str, end=_korea_now_str(), elapsed=elapsed_time
+                ))
+            
+            return economic_result and prediction_result
                 
         except Exception as e:
             logger.error(f"[{function_name}] ❌ 23:00 작업 중 오류 발생: {str(e)}", exc_info=True)
             if send_slack_notification:
-                send_scheduler_slack_notification(f"❌ *23:00 작업 오류*\n오류 발생: {str(e)}")
+                await _notify_slack(SLACK_TASK_ERROR.format(title="23:00 작업", error=e))
             return False
         finally:
-            # 실행 완료 후 플래그 해제
-            self.tasks_23_00_executing = False
+            # 실행 완료 후 락 해제
+            self._locks["tasks_23_00"].release()
 
-    def _run_vertex_ai_prediction(self, send_slack_notification: bool = True):
+    async def _run_vertex_ai_prediction(self, send_slack_notification: bool = True):
         """Vertex AI를 사용한 주가 예측 작업 실행 (run_predict_vertex_ai.py)"""
         function_name = "_run_vertex_ai_prediction"
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        start_time_str = now_korea.strftime('%Y-%m-%d %H:%M:%S')
-        logger.info("=" * 60)
-        logger.info(f"[{function_name}] Vertex AI 주가 예측 작업 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {start_time_str} KST)")
-        logger.info("=" * 60)
-        
-        if self.prediction_executing:
+        start_time_str = _korea_now_str()
+        if logger.isEnabledFor(logging.INFO):
+            _log_banner(f"[{function_name}] Vertex AI 주가 예측 작업 시작 ({_time_diagnostics(start_time_str)})")
+        
+        if not self._locks["prediction"].acquire(blocking=False):
             logger.warning(f"[{function_name}] 이미 실행 중입니다. 중복 실행을 방지합니다.")
             return False
         
-        self.prediction_executing = True
-        
         try:
             if send_slack_notification:
-                send_scheduler_slack_notification(f"🚀 *Vertex AI 주가 예측 시작*\nrun_predict_vertex_ai.py 실행을 시작합니다.\n실행 시간: {start_time_str} (KST)")
-            
-            import subprocess
-            import sys
-            import os
-            from pathlib import Path
+                await _notify_slack(SLACK_VERTEX_START.format(start=start_time_str))
             
             # run_predict_vertex_ai.py 파일 경로 확인
-            project_root = Path(__file__).parent.parent.parent
-            script_path = project_root / "scripts" / "run" / "run_predict_vertex_ai.py"
+            script_path = self._vertex_script
             
             if not script_path.exists():
                 logger.error(f"[{function_name}] ❌ run_predict_vertex_ai.py 파일을 찾을 수 없습니다: {script_path}")
                 if send_slack_notification:
-                    send_scheduler_slack_notification(f"❌ *Vertex AI 주가 예측 실패*\nrun_predict_vertex_ai.py 파일을 찾을 수 없습니다.")
+                    await _notify_slack(f"❌ *Vertex AI 주가 예측 실패*\nrun_predict_vertex_ai.py 파일을 찾을 수 없습니다.")
                 return False
             
             logger.info(f"[{function_name}] 예측 스크립트 경로: {script_path}")
             
-            # 환경변수 설정
-            env = os.environ.copy()
-            if hasattr(settings, 'GCP_PROJECT_ID') and settings.GCP_PROJECT_ID:
-                env['GCP_PROJECT_ID'] = settings.GCP_PROJECT_ID
-            if hasattr(settings, 'GCP_REGION') and settings.GCP_REGION:
-                env['GCP_REGION'] = settings.GCP_REGION
-            if hasattr(settings, 'GCP_BUCKET_NAME') and settings.GCP_BUCKET_NAME:
-                env['GCP_BUCKET_NAME'] = settings.GCP_BUCKET_NAME
-            if hasattr(settings, 'GCP_STAGING_BUCKET') and settings.GCP_STAGING_BUCKET:
-                env['GCP_STAGING_BUCKET'] = settings.GCP_STAGING_BUCKET
-            
-            # GOOGLE_APPLICATION_CREDENTIALS 환경 변수 확인
-            if not env.get('GOOGLE_APPLICATION_CREDENTIALS'):
-                # 컨테이너 내부 경로 확인
-                container_creds_path = Path("/app/credentials/vertex-ai-key.json")
-                if container_creds_path.exists():
-                    env['GOOGLE_APPLICATION_CREDENTIALS'] = str(container_creds_path)
-                    logger.info(f"[{function_name}] 인증 파일 경로 설정: {container_creds_path}")
-            
             try:
-                # run_predict_vertex_ai.py 실행
+                # run_predict_vertex_ai.py 실행 (대기 중에도 이벤트 루프를 막지 않도록 비동기 서브프로세스 사용)
                 logger.info(f"[{function_name}] Vertex AI 주가 예측 작업 실행 중...")
-                result = subprocess.run(
-                    [sys.executable, str(script_path)],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(project_root),
-                    env=env,
-                    timeout=7200  # 2시간 타임아웃
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, str(script_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(self._project_root),
+                    env=self._get_vertex_env(),
+                    limit=1024 * 1024  # 한 줄 최대 길이 (기본 64KB)
                 )
+                # 전체 출력을 메모리에 쌓지 않고 마지막 줄만 보관
+                stdout_tail = deque(maxlen=SchedulerConfig.SUBPROCESS_OUTPUT_TAIL_LINES)
+                stderr_tail = deque(maxlen=SchedulerConfig.SUBPROCESS_OUTPUT_TAIL_LINES)
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(
+                            _read_stream_tail(proc.stdout, stdout_tail),
+                            _read_stream_tail(proc.stderr, stderr_tail),
+                            proc.wait()
+                        ),
+                        timeout=7200  # 2시간 타임아웃
+                    )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+                stdout = b''.join(stdout_tail).decode(errors='replace')
+                stderr = b''.join(stderr_tail).decode(errors='replace')
                 
-                if result.returncode == 0:
+                if proc.returncode == 0:
                     logger.info(f"[{function_name}] ✅ Vertex AI 주가 예측 작업 완료")
-                    logger.info(result.stdout)
+                    logger.info(f"출력 (마지막 {SchedulerConfig.SUBPROCESS_OUTPUT_TAIL_LINES}줄):\n{stdout}")
                     if send_slack_notification:
                         # 출력의 마지막 부분만 전송 (너무 길면 잘림)
-                        output_preview = result.stdout[-1000:] if len(result.stdout) > 1000 else result.stdout
-                        send_scheduler_slack_notification(
-                            f"✅ *Vertex AI 주가 예측 완료*\n"
-                            f"run_predict_vertex_ai.py 실행이 성공적으로 완료되었습니다.\n\n"
-                            f"출력:\n```\n{output_preview}\n```"
-                        )
+                        await _notify_slack(SLACK_VERTEX_DONE.format(output=_output_preview(stdout)))
                     return True
                 else:
-                    logger.error(f"[{function_name}] ❌ Vertex AI 주가 예측 작업 실패 (Exit Code: {result.returncode})")
-                    logger.error(result.stderr)
+                    logger.error(f"[{function_name}] ❌ Vertex AI 주가 예측 작업 실패 (Exit Code: {proc.returncode})")
+                    logger.error(f"에러 출력 (마지막 {SchedulerConfig.SUBPROCESS_OUTPUT_TAIL_LINES}줄):\n{stderr}")
                     if send_slack_notification:
-                        error_preview = result.stderr[-1000:] if len(result.stderr) > 1000 else result.stderr
-                        send_scheduler_slack_notification(
-                            f"❌ *Vertex AI 주가 예측 실패*\n"
-                            f"Exit Code: {result.returncode}\n\n"
-                            f"오류:\n```\n{error_preview}\n```"
+                        await _notify_slack(
+                            SLACK_VERTEX_FAILED.format(returncode=proc.returncode, output=_output_preview(stderr))
                         )
                     return False
                     
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 logger.error(f"[{function_name}] ❌ Vertex AI 주가 예측 작업 타임아웃 (2시간 초과)")
                 if send_slack_notification:
-                    send_scheduler_slack_notification(f"❌ *Vertex AI 주가 예측 타임아웃*\n실행 시간이 2시간을 초과했습니다.")
+                    await _notify_slack(f"❌ *Vertex AI 주가 예측 타임아웃*\n실행 시간이 2시간을 초과했습니다.")
                 return False
             except Exception as e:
                 logger.error(f"[{function_name}] 실행 중 오류 발생: {str(e)}", exc_info=True)
                 if send_slack_notification:
-                    send_scheduler_slack_notification(f"❌ *Vertex AI 주가 예측 오류*\n오류 발생: {str(e)}")
+                    await _notify_slack(SLACK_TASK_ERROR.format(title="Vertex AI 주가 예측", error=e))
                 return False
                 
         finally:
-            self.prediction_executing = False
-            logger.info(f"[{function_name}] 함수 실행 완료")
-            logger.info("=" * 60)
+            self._locks["prediction"].release()
+            logger.info("[%s] 함수 실행 완료\n%s", function_name, _BANNER)
+
+    def _get_vertex_env(self) -> Dict[str, str]:
+        """Vertex AI 예측 스크립트용 환경변수 (최초 1회 생성 후 재사용)"""
+        if self._vertex_env is not None:
+            return self._vertex_env
+        
+        env = os.environ.copy()
+        for key in ('GCP_PROJECT_ID', 'GCP_REGION', 'GCP_BUCKET_NAME', 'GCP_STAGING_BUCKET'):
+            value = getattr(settings, key, None)
+            if value:
+                env[key] = value
+        
+        # GOOGLE_APPLICATION_CREDENTIALS 환경 변수 확인
+        if not env.get('GOOGLE_APPLICATION_CREDENTIALS'):
+            # 컨테이너 내부 경로 확인
+            container_creds_path = Path("/app/credentials/vertex-ai-key.json")
+            if container_creds_path.exists():
+                env['GOOGLE_APPLICATION_CREDENTIALS'] = str(container_creds_path)
+                logger.info(f"[_run_vertex_ai_prediction] 인증 파일 경로 설정: {container_creds_path}")
+        
+        self._vertex_env = env
+        return env
 
     def _run_predict_model(self):
         """AI 예측 모델 학습 및 예측 실행 (predict.py)"""
         function_name = "_run_predict_model"
-        logger.info("=" * 60)
-        logger.info(f"[{function_name}] 함수 실행 시작")
-        logger.info("=" * 60)
+        _log_banner(f"[{function_name}] 함수 실행 시작")
         send_scheduler_slack_notification(f"🤖 *AI 예측 모델 학습 시작*\npredict.py 실행을 시작합니다.")
         
-        import subprocess
-        import sys
-        import os
-        
         # predict.py 파일 경로 확인
-        project_root = Path(__file__).parent.parent.parent
-        predict_path = project_root / "scripts" / "utils" / "predict.py"
+        predict_path = self._predict_script
 
         if not predict_path.exists():
             logger.error(f"[{function_name}] ❌ predict.py 파일을 찾을 수 없습니다: {predict_path}")
@@ -453,34 +700,26 @@ class StockScheduler:
             return False
         
         try:
-            # 환경변수 설정
-            env = os.environ.copy()
-            
-            # predict.py 실행 (최대 2시간 타임아웃)
+            # predict.py 실행 (최대 2시간 타임아웃, 환경변수는 현재 프로세스에서 상속)
             logger.info(f"predict.py 실행 중... (경로: {predict_path})")
             result = subprocess.run(
                 [sys.executable, str(predict_path)],
                 capture_output=True,
                 text=True,
                 timeout=7200,  # 2시간 타임아웃
-                env=env,
                 cwd=str(predict_path.parent)  # 작업 디렉토리를 predict.py가 있는 디렉토리로 설정
             )
             
             if result.returncode == 0:
-                logger.info("✅ AI 예측 모델 학습 완료")
-                logger.info("=" * 60)
                 # 출력이 너무 길면 마지막 50줄만 출력
                 output_lines = result.stdout.split('\n')
                 if len(output_lines) > 50:
-                    logger.info("출력 (마지막 50줄):")
-                    for line in output_lines[-50:]:
-                        if line.strip():
-                            logger.info(line)
+                    output_title = "출력 (마지막 50줄):"
+                    output_text = "\n".join(line for line in output_lines[-50:] if line.strip())
                 else:
-                    logger.info("출력:")
-                    logger.info(result.stdout)
-                logger.info("=" * 60)
+                    output_title = "출력:"
+                    output_text = result.stdout
+                logger.info("✅ AI 예측 모델 학습 완료\n%s\n%s\n%s\n%s", _BANNER, output_title, output_text, _BANNER)
                 
                 # Slack 알림 전송
                 try:
@@ -520,22 +759,11 @@ class StockScheduler:
             logger.warning("매도 스케줄러가 이미 실행 중입니다.")
             return False
         
-        # 기존 매도 작업이 있다면 먼저 취소 (중복 등록 방지)
-        sell_jobs = [job for job in schedule.jobs if job.job_func.__name__ == '_run_auto_sell']
-        for job in sell_jobs:
-            schedule.cancel_job(job)
-            logger.debug(f"기존 매도 작업 취소: {job.job_func.__name__}")
-        
         # 5분마다 매도 작업 실행
-        schedule.every(5).minutes.do(self._run_auto_sell)
-        
-        # 스케줄러 스레드가 없으면 시작
-        if not self.running and not self.scheduler_thread:
-            self.scheduler_thread = threading.Thread(target=self._run_scheduler)
-            self.scheduler_thread.daemon = True
-            self.scheduler_thread.start()
-        
         self.sell_running = True
+        self._ensure_scheduler_loop()
+        self._sell_future = asyncio.run_coroutine_threadsafe(self._run_sell_jobs(), self._loop)
+        
         logger.info("매도 스케줄러가 시작되었습니다.")
         logger.info("  - 실행 주기: 5분마다 매도 대상 확인")
         return True
@@ -545,59 +773,142 @@ class StockScheduler:
         if not self.sell_running:
             return False
         
-        if self.stopping:
+        if not self._locks["stop"].acquire(blocking=False):
             return False  # 이미 중지 중이면 중복 로그 방지
         
-        self.stopping = True
-        # 매도 관련 작업만 취소
-        sell_jobs = [job for job in schedule.jobs if job.job_func.__name__ == '_run_auto_sell']
-        for job in sell_jobs:
-            schedule.cancel_job(job)
+        try:
+            # 매도 관련 작업만 취소
+            if self._sell_future:
+                self._sell_future.cancel()
+                self._sell_future = None
+            
+            self.sell_running = False
+            
+            # 매수, 매도 모두 중지된 경우 이벤트 루프 스레드 종료
+            self._stop_scheduler_loop_if_idle()
+                
+            logger.info("매도 스케줄러가 중지되었습니다.")
+            return True
+        finally:
+            self._locks["stop"].release()
+    
+    def _ensure_scheduler_loop(self):
+        """스케줄러 전용 이벤트 루프 스레드 시작 (이미 실행 중이면 재사용)"""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self.scheduler_thread = threading.Thread(target=self._run_scheduler, args=(self._loop,))
+        self.scheduler_thread.daemon = True
+        self.scheduler_thread.start()
+    
+    def _stop_scheduler_loop_if_idle(self):
+        """매수/매도 스케줄러가 모두 중지된 경우 이벤트 루프 스레드 종료"""
+        if self.running or self.sell_running or self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self.scheduler_thread:
+            self.scheduler_thread.join(timeout=5)
+        self.scheduler_thread = None
+        self._loop = None
+    
+    def _run_scheduler(self, loop: asyncio.AbstractEventLoop):
+        """
+        스케줄러 백그라운드 실행 함수
+        
+        API 서버의 이벤트 루프와 분리된 전용 이벤트 루프를 실행합니다.
+        작업은 다음 실행 시각까지 sleep하며 대기하므로 주기적인 폴링이 없습니다.
+        """
+        # 시간대 확인 로깅 (최초 1회)
+        logger.info(f"[스케줄러 시작] {_time_diagnostics()}")
         
-        self.sell_running = False
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            # 남은 작업 정리 후 루프 종료
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+    
+    def _run_coroutine_sync(self, coro):
+        """
+        동기 코드(API 백그라운드 작업 등)에서 스케줄러 코루틴을 실행하고 결과 반환
         
-        # 매수, 매도 모두 중지된 경우 스레드 종료
-        if not self.running and self.scheduler_thread:
-            self.scheduler_thread.join(timeout=5)
-            self.scheduler_thread = None
+        스케줄러 이벤트 루프가 실행 중이면 해당 루프에서 실행하여 작업 상태를 공유하고,
+        아니면 임시 이벤트 루프에서 실행합니다.
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # 현재 스레드에서 이벤트 루프가 실행 중이면(async API 핸들러 등) asyncio.run을 쓸 수 없으므로 별도 스레드에서 실행
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    async def _run_job(self, job: Callable):
+        """스케줄 작업 실행 (동기 함수는 워커 스레드에서 실행하여 이벤트 루프를 막지 않음)"""
+        try:
+            if asyncio.iscoroutinefunction(job):
+                await job()
+            else:
+                await asyncio.to_thread(job)
+        except Exception as e:
+            logger.error(f"[{job.__name__}] 스케줄 작업 실행 중 오류 발생: {str(e)}", exc_info=True)
+    
+    async def _run_daily_jobs(self, daily_jobs: List[Tuple[str, Callable]]):
+        """
+        일일 작업을 다음 실행 시각까지 대기한 뒤 순서대로 실행
+        
+        실행 시각 순으로 정렬된 힙에서 가장 가까운 작업까지 sleep합니다.
+        작업은 하나씩 순서대로 실행되며, 이전 작업이 길어져 실행 시각이 지난 작업은
+        이전 작업이 끝나는 즉시 실행됩니다. (예: 23:00 예측 완료 후 통합 분석/매수)
+        
+        Args:
+            daily_jobs: (실행 시각 HH:MM (KST), 실행 함수) 목록
+        """
+        now_korea = datetime.now(KST)
+        # (다음 실행 epoch, 등록 순서, 실행 시각, 실행 함수) - 등록 순서로 동시각 작업 순서 유지
+        heap = [
+            (_next_daily_run_timestamp(time_str, now_korea), order, time_str, job)
+            for order, (time_str, job) in enumerate(daily_jobs)
+        ]
+        heapq.heapify(heap)
+        
+        while heap:
+            run_at, order, time_str, job = heap[0]
+            delay = run_at - time.time()
+            if delay > 0:
+                # 시스템 시계 보정에 대비해 최대 대기 시간마다 다시 계산
+                await asyncio.sleep(min(delay, SchedulerConfig.SCHEDULER_MAX_SLEEP_SECONDS))
+                continue
             
-        logger.info("매도 스케줄러가 중지되었습니다.")
-        self.stopping = False
-        return True
+            heapq.heappop(heap)
+            await self._run_job(job)
+            next_run_at = _next_daily_run_timestamp(time_str, datetime.now(KST))
+            heapq.heappush(heap, (next_run_at, order, time_str, job))
+            logger.debug(f"[스케줄러] 다음 실행 예정: {heap[0][3].__name__} ({heap[0][2]} KST)")
     
-    def _run_scheduler(self):
-        """스케줄러 백그라운드 실행 함수"""
-        # 시간대 확인 로깅 (최초 1회)
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        logger.info(f"[스케줄러 시작] 시스템 로컬 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} (KST)")
-        
-        last_log_time = None
-        while self.running or self.sell_running or self.analysis_running:
-            schedule.run_pending()
-            time.sleep(1)
-            
-            # 1시간마다 시간대 확인 로깅 (디버깅용)
-            current_time = datetime.now()
-            if last_log_time is None or (current_time - last_log_time).total_seconds() >= 3600:
-                now_korea = datetime.now(korea_tz)
-                logger.debug(f"[스케줄러 동작 중] 시스템 로컬 시간: {current_time.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} (KST)")
-                last_log_time = current_time
+    async def _run_sell_jobs(self):
+        """매도 작업 주기 실행 (이전 실행 완료 후 AUTO_SELL_INTERVAL_SECONDS만큼 대기)"""
+        while True:
+            await asyncio.sleep(SchedulerConfig.AUTO_SELL_INTERVAL_SECONDS)
+            await self._run_job(self._run_auto_sell)
     
     def _run_analysis(self, send_slack_notification: bool = True):
         """통합 분석 실행 (기술적 지표 + 감정 분석)"""
         function_name = "_run_analysis"
         
         # 중복 실행 방지: 이미 실행 중이면 건너뜀
-        if self.analysis_executing:
+        if not self._locks["analysis"].acquire(blocking=False):
             logger.warning(f"[{function_name}] 분석 작업이 이미 실행 중입니다. 중복 실행을 건너뜁니다.")
             return False
         
-        self.analysis_executing = True
-        logger.info("=" * 50)
-        logger.info(f"[{function_name}] 함수 실행 시작")
-        logger.info("=" * 50)
+        _log_banner(f"[{function_name}] 함수 실행 시작")
         if send_slack_notification:
             send_scheduler_slack_notification(f"📊 *통합 분석 작업 시작*\n기술적 지표 + 감정 분석을 시작합니다.")
         
@@ -610,17 +921,7 @@ class StockScheduler:
             
             # 기술적 지표 분석 완료 슬랙 알림 (스케줄러에서 관리)
             if send_slack_notification:
-                tech_data = tech_result.get('data', [])
-                recommended_count = len([r for r in tech_data if r.get('추천_여부', False)])
-                total_count = len(tech_data)
-                # 날짜 정보는 recommendations의 첫 번째 항목에서 가져오거나, 없으면 현재 날짜 사용
-                date_str = tech_data[0].get('날짜', datetime.now().strftime("%Y-%m-%d")) if tech_data else datetime.now().strftime("%Y-%m-%d")
-                send_scheduler_slack_notification(
-                    f"📊 *기술적 지표 분석 완료*\n"
-                    f"날짜: {date_str}\n"
-                    f"분석 종목: {total_count}개\n"
-                    f"추천 종목: {recommended_count}개"
-                )
+                send_scheduler_slack_notification(_technical_done_message(tech_result))
             
             # 2단계: 뉴스 감정 분석 수행
             logger.info(f"[{function_name}] 2단계: 뉴스 감정 분석 시작...")
@@ -638,23 +939,21 @@ class StockScheduler:
             logger.info(f"[{function_name}] ✅ 통합 분석 완료: {final_count}개 종목 추천")
             logger.info(f"[{function_name}]    매수 대상: {combined_result.get('message', '')}")
             
-            logger.info("=" * 50)
-            logger.info(f"[{function_name}] 함수 실행 완료")
-            logger.info("=" * 50)
+            _log_banner(f"[{function_name}] 함수 실행 완료")
             # get_combined_recommendations_with_technical_and_sentiment 내부에서 이미 Slack 알림을 전송하므로 중복 전송 제거
             
         except Exception as e:
             logger.error(f"[{function_name}] ❌ 통합 분석 중 오류 발생: {str(e)}", exc_info=True)
             logger.info(f"[{function_name}] 함수 실행 완료 (오류)")
             if send_slack_notification:
-                success = send_scheduler_slack_notification(f"❌ *통합 분석 작업 오류*\n오류 발생: {str(e)}")
+                success = send_scheduler_slack_notification(SLACK_TASK_ERROR.format(title="통합 분석 작업", error=e))
                 if not success:
                     logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (통합 분석 작업 오류)")
         finally:
-            # 실행 완료 후 플래그 해제
-            self.analysis_executing = False
+            # 실행 완료 후 락 해제
+            self._locks["analysis"].release()
     
-    def _run_parallel_analysis(self, send_slack_notification: bool = True):
+    async def _run_parallel_analysis(self, send_slack_notification: bool = True):
         """
         두 가지 분석 작업을 병렬로 실행
         - 기술적 지표 분석 (~5분)
@@ -664,97 +963,77 @@ class StockScheduler:
         """
         function_name = "_run_parallel_analysis"
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        start_time_str = now_korea.strftime('%Y-%m-%d %H:%M:%S')
-        logger.info(f"[{function_name}] 함수 실행 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {start_time_str} KST)")
+        started = time.monotonic()
+        start_time_str = _korea_now_str()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[{function_name}] 함수 실행 시작 ({_time_diagnostics(start_time_str)})")
         
         # 중복 실행 방지
-        if self.analysis_executing:
+        if not self._locks["analysis"].acquire(blocking=False):
             logger.warning(f"[{function_name}] 분석 작업이 이미 실행 중입니다. 중복 실행을 건너뜁니다.")
             return False
         
-        self.analysis_executing = True
-        logger.info("=" * 60)
-        logger.info(f"[{function_name}] 병렬 분석 작업 시작")
-        logger.info("=" * 60)
+        _log_banner(f"[{function_name}] 병렬 분석 작업 시작")
         if send_slack_notification:
-            send_scheduler_slack_notification(f"🚀 *병렬 분석 작업 시작*\n기술적 지표와 감정 분석을 병렬로 실행합니다.\n실행 시간: {start_time_str} (KST)")
+            await _notify_slack(SLACK_PARALLEL_START.format(start=start_time_str))
         
         try:
-            import concurrent.futures
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                # 1. 기술적 지표 분석
-                logger.info(f"[{function_name}] 기술적 지표 분석 시작...")
-                tech_future = executor.submit(
-                    self.recommendation_service.generate_technical_recommendations,
-                    send_slack_notification=False  # 개별 알림은 비활성화
-                )
-                
-                # 2. 감정 분석 (독립적)
-                logger.info(f"[{function_name}] 감정 분석 시작...")
-                sentiment_future = executor.submit(
-                    self.recommendation_service.fetch_and_store_sentiment_independent
-                )
-                
-                # 기술적 지표와 감정 분석 결과 대기
-                tech_result = tech_future.result()
-                sentiment_result = sentiment_future.result()
-                
-                logger.info(f"[{function_name}] ✅ 기술적 지표 분석 완료: {tech_result.get('message', '')}")
-                logger.info(f"[{function_name}] ✅ 감정 분석 완료: {sentiment_result.get('message', '')}")
-                
-                # 기술적 지표 분석 완료 슬랙 알림
-                if send_slack_notification:
-                    tech_data = tech_result.get('data', [])
-                    recommended_count = len([r for r in tech_data if r.get('추천_여부', False)])
-                    total_count = len(tech_data)
-                    date_str = tech_data[0].get('날짜', datetime.now().strftime("%Y-%m-%d")) if tech_data else datetime.now().strftime("%Y-%m-%d")
-                    success = send_scheduler_slack_notification(
-                        f"📊 *기술적 지표 분석 완료*\n"
-                        f"날짜: {date_str}\n"
-                        f"분석 종목: {total_count}개\n"
-                        f"추천 종목: {recommended_count}개"
-                    )
-                    if not success:
-                        logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (기술적 지표 분석 완료)")
-                    
-                    # 감정 분석 완료 슬랙 알림
-                    sentiment_results = sentiment_result.get('results', [])
-                    success = send_scheduler_slack_notification(
-                        f"💬 *감정 분석 완료*\n"
-                        f"{sentiment_result.get('message', '')}"
-                    )
-                    if not success:
-                        logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (감정 분석 완료)")
-                
-            end_time_korea = datetime.now(korea_tz)
-            end_time_str = end_time_korea.strftime('%Y-%m-%d %H:%M:%S')
-            elapsed_time = (end_time_korea - now_korea).total_seconds()
-            logger.info("=" * 60)
-            logger.info(f"[{function_name}] 병렬 분석 작업 완료 (소요 시간: {elapsed_time:.1f}초)")
-            logger.info("=" * 60)
+            # 두 분석은 블로킹 서비스 호출이므로 워커 스레드에서 동시에 실행
+            # 1. 기술적 지표 분석 (~5분, 개별 알림은 비활성화)
+            # 2. 감정 분석 (독립적, ~20분)
+            # 먼저 끝난 분석의 결과 처리(로그/슬랙 알림)는 느린 분석이 끝나기를 기다리지 않고 바로 수행
+            logger.info(f"[{function_name}] 기술적 지표 분석 시작...")
+            logger.info(f"[{function_name}] 감정 분석 시작...")
+            tech_task = asyncio.create_task(asyncio.to_thread(
+                self.recommendation_service.generate_technical_recommendations,
+                send_slack_notification=False
+            ))
+            sentiment_task = asyncio.create_task(asyncio.to_thread(
+                self.recommendation_service.fetch_and_store_sentiment_independent
+            ))
+            
+            pending = {tech_task, sentiment_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is tech_task:
+                        tech_result = task.result()
+                        logger.info(f"[{function_name}] ✅ 기술적 지표 분석 완료: {tech_result.get('message', '')}")
+                        # 기술적 지표 분석 완료 슬랙 알림
+                        if send_slack_notification:
+                            success = await _notify_slack(_technical_done_message(tech_result))
+                            if not success:
+                                logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (기술적 지표 분석 완료)")
+                    else:
+                        sentiment_result = task.result()
+                        logger.info(f"[{function_name}] ✅ 감정 분석 완료: {sentiment_result.get('message', '')}")
+                        # 감정 분석 완료 슬랙 알림
+                        if send_slack_notification:
+                            success = await _notify_slack(
+                                f"💬 *감정 분석 완료*\n"
+                                f"{sentiment_result.get('message', '')}"
+                            )
+                            if not success:
+                                logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (감정 분석 완료)")
+            
+            elapsed_time = time.monotonic() - started
+            _log_banner(f"[{function_name}] 병렬 분석 작업 완료 (소요 시간: {elapsed_time:.1f}초)")
             if send_slack_notification:
-                send_scheduler_slack_notification(
-                    f"✅ *병렬 분석 작업 완료*\n"
-                    f"시작: {start_time_str} (KST)\n"
-                    f"완료: {end_time_str} (KST)\n"
-                    f"소요 시간: {elapsed_time:.1f}초"
+                await _notify_slack(
+                    SLACK_PARALLEL_DONE.format(start=start_time_str, end=_korea_now_str(), elapsed=elapsed_time)
                 )
             return True
             
         except Exception as e:
             logger.error(f"[{function_name}] ❌ 병렬 분석 중 오류 발생: {str(e)}", exc_info=True)
             if send_slack_notification:
-                success = send_scheduler_slack_notification(f"❌ *병렬 분석 작업 오류*\n오류 발생: {str(e)}")
+                success = await _notify_slack(SLACK_TASK_ERROR.format(title="병렬 분석 작업", error=e))
                 if not success:
                     logger.warning(f"[{function_name}] 슬랙 알림 전송 실패 (병렬 분석 작업 오류)")
             return False
         finally:
-            # 실행 완료 후 플래그 해제
-            self.analysis_executing = False
+            # 실행 완료 후 락 해제
+            self._locks["analysis"].release()
     
     def _run_combined_analysis(self, send_slack_notification: bool = True):
         """
@@ -765,12 +1044,8 @@ class StockScheduler:
         """
         function_name = "_run_combined_analysis"
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        logger.info("=" * 60)
-        logger.info(f"[{function_name}] 통합 분석 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} KST)")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            _log_banner(f"[{function_name}] 통합 분석 시작 ({_time_diagnostics()})")
         if send_slack_notification:
             send_scheduler_slack_notification(f"🔗 *통합 분석 시작*\n세 가지 분석 결과를 통합합니다.")
         
@@ -784,38 +1059,33 @@ class StockScheduler:
             logger.info(f"[{function_name}] ✅ 통합 분석 완료: {final_count}개 종목 추천")
             logger.info(f"[{function_name}]    매수 대상: {combined_result.get('message', '')}")
             
-            logger.info("=" * 60)
-            logger.info(f"[{function_name}] 통합 분석 완료")
-            logger.info("=" * 60)
+            _log_banner(f"[{function_name}] 통합 분석 완료")
             return True
             
         except Exception as e:
             logger.error(f"[{function_name}] ❌ 통합 분석 중 오류 발생: {str(e)}", exc_info=True)
             if send_slack_notification:
-                send_scheduler_slack_notification(f"❌ *통합 분석 오류*\n오류 발생: {str(e)}")
+                send_scheduler_slack_notification(SLACK_TASK_ERROR.format(title="통합 분석", error=e))
             return False
 
-    def _run_auto_buy(self, send_slack_notification: bool = True):
+    async def _run_auto_buy(self, send_slack_notification: bool = True):
         """자동 매수 실행 함수 - 스케줄링된 시간에 실행됨"""
         function_name = "_run_auto_buy"
         
         # 중복 실행 방지: 이미 실행 중이면 건너뜀
-        if self.buy_executing:
+        if not self._locks["buy"].acquire(blocking=False):
             logger.warning(f"[{function_name}] 매수 작업이 이미 실행 중입니다. 중복 실행을 건너뜁니다.")
             return False
         
-        self.buy_executing = True
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        logger.info(f"[{function_name}] 함수 실행 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} KST)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[{function_name}] 함수 실행 시작 ({_time_diagnostics()})")
         if send_slack_notification:
-            send_scheduler_slack_notification(f"💰 *자동 매수 작업 시작*\n매수 작업을 시작합니다.")
+            await _notify_slack(f"💰 *자동 매수 작업 시작*\n매수 작업을 시작합니다.")
         
         try:
             # 주말 체크 (뉴욕 시간 기준)
-            now_ny = datetime.now(pytz.timezone('America/New_York'))
+            now_ny = datetime.now(NEW_YORK_TZ)
             ny_weekday = now_ny.weekday()  # 0=월요일, 6=일요일
             
             # 주말(토요일=5, 일요일=6)이면 실행하지 않음
@@ -826,19 +1096,8 @@ class StockScheduler:
                 logger.info(f"[{function_name}] 함수 실행 완료 (주말로 인한 건너뜀)")
                 return False
             
-            # 새 스레드에서 비동기 함수 실행
-            import threading
-            def run_in_thread():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    new_loop.run_until_complete(self._execute_auto_buy(send_slack_notification=send_slack_notification))
-                finally:
-                    new_loop.close()
-            
-            thread = threading.Thread(target=run_in_thread)
-            thread.start()
-            thread.join()
+            # 스케줄러 이벤트 루프에서 직접 실행 (매 실행마다 스레드/이벤트 루프를 새로 만들지 않음)
+            await self._execute_auto_buy(send_slack_notification=send_slack_notification)
             
             logger.info(f"[{function_name}] 함수 실행 완료")
             return True
@@ -847,35 +1106,24 @@ class StockScheduler:
             logger.info(f"[{function_name}] 함수 실행 완료 (오류)")
             return False
         finally:
-            # 실행 완료 후 플래그 해제
-            self.buy_executing = False
+            # 실행 완료 후 락 해제
+            self._locks["buy"].release()
     
-    def _run_auto_sell(self):
+    async def _run_auto_sell(self):
         """자동 매도 실행 함수 - 1분마다 실행됨"""
         function_name = "_run_auto_sell"
         
         try:
             # 주말 체크 (뉴욕 시간 기준)
-            now_ny = datetime.now(pytz.timezone('America/New_York'))
+            now_ny = datetime.now(NEW_YORK_TZ)
             ny_weekday = now_ny.weekday()  # 0=월요일, 6=일요일
             
             # 주말(토요일=5, 일요일=6)이면 실행하지 않음
             if ny_weekday >= 5:
                 return False
         
-            # 새 스레드에서 비동기 함수 실행
-            import threading
-            def run_in_thread():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    new_loop.run_until_complete(self._execute_auto_sell())
-                finally:
-                    new_loop.close()
-            
-            thread = threading.Thread(target=run_in_thread)
-            thread.start()
-            thread.join()
+            # 스케줄러 이벤트 루프에서 직접 실행 (매 실행마다 스레드/이벤트 루프를 새로 만들지 않음)
+            await self._execute_auto_sell()
             
             return True
         except Exception as e:
@@ -889,9 +1137,8 @@ class StockScheduler:
         활성 사용자 목록을 조회하고, 각 사용자별로 매도 작업을 실행합니다.
         """
         function_name = "_execute_auto_sell"
-        # 활성 사용자 목록 조회
-        from app.utils.user_context import get_active_users
-        active_users = get_active_users()
+        # 활성 사용자 목록 조회 (스케줄러 루프를 막지 않도록 MongoDB 조회는 워커 스레드에서 실행)
+        active_users = await asyncio.to_thread(get_active_users)
         
         # 각 사용자별로 매도 작업 실행
         for user_id in active_users:
@@ -906,11 +1153,12 @@ class StockScheduler:
         """특정 사용자에 대한 자동 매도 실행 로직"""
         function_name = "_execute_auto_sell_for_user"
         # 사용자별 컨텍스트 설정
-        from app.utils.user_context import set_global_user_context
         set_global_user_context(user_id)
         
         # 사용자별 설정 조회
-        trading_config = self.auto_trading_service.get_auto_trading_config(user_id=user_id)
+        # 매도 작업은 스케줄러 공용 루프에서 실행되므로 MongoDB/KIS 동기 호출은 워커 스레드에서 실행
+        # (ContextVar 사용자 컨텍스트는 asyncio.to_thread가 워커 스레드로 복사)
+        trading_config = await asyncio.to_thread(self.auto_trading_service.get_auto_trading_config, user_id=user_id)
         
         # 자동매매가 비활성화된 사용자는 건너뜀
         if not trading_config.get("auto_trading_enabled", False):
@@ -919,32 +1167,29 @@ class StockScheduler:
         
         # 트레일링 스톱 활성화된 종목의 최고가 갱신 (매도 조건 체크 전에 실행)
         try:
-            from app.services.trailing_stop_service import TrailingStopService
-            trailing_stop_service = TrailingStopService(user_id=user_id)
+            trailing_stop_service = self._get_trailing_stop_service(user_id)
             
             # 설정 확인 (trading_config는 이미 위에서 조회했으므로 재사용)
             if trading_config.get("trailing_stop_enabled", False):
-                # 보유 종목 조회
-                balance_result = get_overseas_balance()
-                if balance_result.get("rt_cd") == "0":
-                    holdings = balance_result.get("output1", [])
-                    active_trailing_stops = trailing_stop_service.get_active_trailing_stops()
-                    
-                    # 활성화된 트레일링 스톱 종목만 최고가 갱신
-                    for item in holdings:
-                        ticker = item.get("ovrs_pdno")
-                        if ticker in active_trailing_stops:
-                            try:
-                                current_price = float(item.get("now_pric2", 0))
-                                if current_price > 0:
-                                    trailing_stop_service.update_highest_price(ticker, current_price)
-                            except (ValueError, TypeError) as e:
-                                logger.debug(f"[{function_name}] {ticker} 최고가 갱신 중 오류 (무시): {str(e)}")
+                # 보유 종목 조회 (같은 실행의 부분 익절 처리와 조회 결과 공유)
+                holdings = await asyncio.to_thread(self._get_holdings_cached)
+                if holdings:
+                    # 보유 종목 최고가를 한 번의 bulk_write로 갱신
+                    # (활성 트레일링 스톱이 없는 종목은 업데이트 필터의 is_active 조건으로 서버에서 제외)
+                    current_prices = {}
+                    for ticker, item in holdings.items():
+                        try:
+                            current_price = float(item.get("now_pric2", 0))
+                            if current_price > 0:
+                                current_prices[ticker] = current_price
+                        except (ValueError, TypeError) as e:
+                            logger.debug(f"[{function_name}] {ticker} 최고가 갱신 중 오류 (무시): {str(e)}")
+                    await asyncio.to_thread(trailing_stop_service.bulk_update_highest_prices, current_prices)
         except Exception as e:
             logger.warning(f"[{function_name}] 트레일링 스톱 최고가 갱신 중 오류 (계속 진행): {str(e)}")
         
         # 매도 대상 종목 조회
-        sell_candidates_result = self.recommendation_service.get_stocks_to_sell()
+        sell_candidates_result = await asyncio.to_thread(self.recommendation_service.get_stocks_to_sell)
         
         if not sell_candidates_result or not sell_candidates_result.get("sell_candidates"):
             return
@@ -956,527 +1201,487 @@ class StockScheduler:
         
         # 우선순위별 통계 추적
         priority_stats = {
-            SellPriority.STOP_LOSS: {"count": 0, "success": 0, "failed": 0, "name": "손절 (Priority 1)"},
-            SellPriority.TRAILING_STOP: {"count": 0, "success": 0, "failed": 0, "name": "트레일링 스톱 (Priority 2)"},
-            SellPriority.TAKE_PROFIT: {"count": 0, "success": 0, "failed": 0, "name": "익절 (Priority 3)"},
-            SellPriority.TECHNICAL: {"count": 0, "success": 0, "failed": 0, "name": "기술적 매도 (Priority 4)"}
+            priority: {"count": 0, "success": 0, "failed": 0, "name": name, "sold": []}
+            for priority, name in SELL_PRIORITY_NAMES.items()
         }
         
-        # 우선순위별로 그룹화하여 로깅
-        priority_groups = {
-            SellPriority.STOP_LOSS: [],
-            SellPriority.TRAILING_STOP: [],
-            SellPriority.TAKE_PROFIT: [],
-            SellPriority.TECHNICAL: []
-        }
+        # 우선순위별로 그룹화하여 로깅 (한 번의 순회로 분류, 알 수 없는 우선순위는 제외)
+        priority_groups = defaultdict(list)
         for candidate in sell_candidates:
             priority = candidate.get("priority", SellPriority.TECHNICAL)  # 기본값 4
-            if priority in priority_groups:
+            if priority in priority_stats:
                 priority_groups[priority].append(candidate)
         
         logger.info(f"[{function_name}] 매도 대상 종목 {len(sell_candidates)}개 발견")
-        logger.info(f"[{function_name}] 우선순위별 분류: Priority 1 (손절) {len(priority_groups[1])}개, Priority 2 (트레일링 스톱) {len(priority_groups[2])}개, Priority 3 (익절) {len(priority_groups[3])}개, Priority 4 (기술적 매도) {len(priority_groups[4])}개")
+        logger.info(f"[{function_name}] 우선순위별 분류: " + ", ".join(
+            f"{name} {len(priority_groups[priority])}개" for priority, name in SELL_PRIORITY_NAMES.items()
+        ))
+        
+        # 레버리지 티커 -> 본주 티커 매핑을 한 번의 쿼리로 조회 (leverage_ticker 필드로 역매핑)
+        leverage_map = {}
+        try:
+            leverage_map = await asyncio.to_thread(_load_leverage_map, [c["ticker"] for c in sell_candidates])
+        except Exception as e:
+            logger.warning(f"[{function_name}] 레버리지 티커 확인 중 오류 (계속 진행): {str(e)}")
+        
+        # 주간거래 시간 체크 (10:00 ~ 18:00 한국시간) - 매도 작업은 수 초 내에 끝나므로 실행당 1회만 확인
+        korea_hour = datetime.now(KST).hour
+        is_daytime_trading = SchedulerConfig.DAYTIME_TRADING_START_HOUR <= korea_hour < SchedulerConfig.DAYTIME_TRADING_END_HOUR
         
+        semaphore = asyncio.Semaphore(SchedulerConfig.MAX_CONCURRENT_SELL)
+        # 거래소별 현재가 조회 결과 공유 (같은 실행 내 중복 조회 방지, 실행이 끝나면 폐기)
+        price_probes = {}
+        notification_tasks = []  # 우선순위별 매도 알림 전송 작업
+
         # 우선순위 순서대로 처리 (Priority 1 → 2 → 3 → 4)
-        for priority in [SellPriority.STOP_LOSS, SellPriority.TRAILING_STOP, SellPriority.TAKE_PROFIT, SellPriority.TECHNICAL]:
-            if not priority_groups[priority]:
-                continue
-            
+        for priority, group in sorted(priority_groups.items()):
             priority_name = priority_stats[priority]["name"]
-            logger.info(f"[{function_name}] ========== {priority_name} 처리 시작 ({len(priority_groups[priority])}개) ==========")
+            logger.info(f"[{function_name}] ========== {priority_name} 처리 시작 ({len(group)}개) ==========")
             
-            # 각 종목에 대해 매도 주문 실행
-            for candidate in priority_groups[priority]:
-                try:
-                    ticker = candidate["ticker"]
-                    stock_name = candidate["stock_name"]
-                    exchange_code = candidate["exchange_code"]
-                    quantity = candidate["quantity"]
-                    
-                    # 매도 근거
-                    sell_reasons = candidate.get("sell_reasons", [])
-                    
-                    # 거래소 코드 변환 (API 요청에 맞게 변환)
-                    api_exchange_code = get_exchange_code_for_api(exchange_code)
-                    
-                    # 현재가 조회 실패 추적: 일정 횟수 이상 실패한 종목은 일정 시간 동안 제외
-                    MAX_PRICE_FETCH_FAILURES = SchedulerConfig.MAX_PRICE_FETCH_FAILURES
-                    PRICE_FETCH_EXCLUDE_MINUTES = SchedulerConfig.PRICE_FETCH_EXCLUDE_MINUTES
-                    
-                    now = datetime.now()
-                    
-                    # 이전에 실패한 적이 있는 종목인지 확인
-                    if ticker in self.price_fetch_failures:
-                        failure_count, last_failure_time = self.price_fetch_failures[ticker]
-                        time_since_last_failure = now - last_failure_time
-                        
-                        # 실패 횟수가 최대치를 초과하고, 제외 시간이 지나지 않았으면 스킵
-                        if failure_count >= MAX_PRICE_FETCH_FAILURES:
-                            if time_since_last_failure < timedelta(minutes=PRICE_FETCH_EXCLUDE_MINUTES):
-                                logger.debug(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 실패로 인해 일시적으로 제외됨 (실패 {failure_count}회, {int((PRICE_FETCH_EXCLUDE_MINUTES * 60 - time_since_last_failure.total_seconds()) / 60)}분 후 재시도 가능)")
-                                continue
-                            else:
-                                # 제외 시간이 지났으면 카운터 리셋
-                                logger.info(f"[{function_name}] {stock_name}({ticker}) 제외 시간이 경과하여 다시 시도합니다.")
-                                del self.price_fetch_failures[ticker]
-                    
-                    # 레버리지 티커인지 확인하고, 본주 티커 가격으로 매도 조건 체크
-                    base_ticker = None  # 본주 티커 (레버리지 티커인 경우)
-                    is_leverage = False
-                    
-                    # MongoDB에서 레버리지 티커인지 확인 (leverage_ticker 필드로 역매핑)
-                    try:
-                        from app.db.mongodb import get_db
-                        db = get_db()
-                        if db is not None:
-                            # stocks 컬렉션에서 leverage_ticker가 현재 티커인 문서 찾기
-                            base_stock = db.stocks.find_one({"leverage_ticker": ticker})
-                            if base_stock:
-                                base_ticker = base_stock.get("ticker")
-                                is_leverage = True
-                                logger.info(f"[{function_name}] {stock_name}({ticker})는 레버리지 티커입니다. 본주 {base_ticker}의 가격으로 매도 조건을 확인합니다.")
-                    except Exception as e:
-                        logger.warning(f"[{function_name}] 레버리지 티커 확인 중 오류 (계속 진행): {str(e)}")
-                    
-                    # 매도 조건 체크용 가격 조회 (레버리지 티커인 경우 본주 가격, 아니면 원래 티커)
-                    price_check_ticker = base_ticker if is_leverage else ticker
-                    
-                    # 현재가 조회 (매도 조건 체크용)
-                    exchanges = ["NAS", "AMS", "NYS"]
-                    price_result = None
-                    
-                    # 기본 거래소를 맨 앞으로
-                    if api_exchange_code in exchanges:
-                        exchanges.remove(api_exchange_code)
-                        exchanges.insert(0, api_exchange_code)
-                    
-                    # 여러 거래소에서 현재가 조회 시도 (본주 티커로 - 레버리지인 경우)
-                    for exchange in exchanges:
-                        price_params = {
-                            "AUTH": "",
-                            "EXCD": exchange,
-                            "SYMB": price_check_ticker
-                        }
-                        
-                        temp_result = get_current_price(price_params)
-                        
-                        # 데이터가 있는지 확인 (last나 base가 있어야 함)
-                        output = temp_result.get("output", {})
-                        if temp_result.get("rt_cd") == "0" and (output.get("last") or output.get("base")):
-                            price_result = temp_result
-                            if exchange != api_exchange_code:
-                                logger.info(f"[{function_name}] {stock_name}({ticker}) 거래소 변경 발견: {api_exchange_code} -> {exchange}")
-                            break
-                        
-                        # 마지막 시도였으면 결과 저장 (에러 메시지 확인용)
-                        if exchange == exchanges[-1]:
-                            price_result = temp_result
+            # 같은 우선순위 종목은 동시에 처리 (세마포어로 KIS API 동시 호출 수 제한)
+            # 다음 우선순위는 현재 우선순위 처리가 모두 끝난 뒤 시작 (gather 완료 시 모든 작업 완료 보장)
+            await asyncio.gather(*(
+                self._process_sell_candidate(
+                    candidate, priority, priority_stats, semaphore, leverage_map, is_daytime_trading, price_probes
+                )
+                for candidate in group
+            ))
+            
+            # 우선순위별 처리 완료 로깅
+            stats = priority_stats[priority]
+            if stats["count"] > 0:
+                logger.info(f"[{function_name}] {priority_name} 처리 완료: 총 {stats['count']}개, 성공 {stats['success']}개, 실패 {stats['failed']}개")
+            
+            # 우선순위별 매도 성공 건을 Slack 메시지 하나로 전송 (다음 우선순위 처리와 겹쳐 실행)
+            if stats["sold"]:
+                notification_tasks.append(asyncio.create_task(
+                    asyncio.to_thread(slack_notifier.send_sell_batch_notification, stats["sold"])
+                ))
+        
+        if notification_tasks:
+            await asyncio.gather(*notification_tasks, return_exceptions=True)
+        
+        # 전체 매도 작업 요약 로깅 (합계와 우선순위별 상세를 한 번의 순회로 계산)
+        total_count = total_success = total_failed = 0
+        detail_lines = []
+        for stats in priority_stats.values():
+            total_count += stats["count"]
+            total_success += stats["success"]
+            total_failed += stats["failed"]
+            if stats["count"] > 0:
+                detail_lines.append(f"    {stats['name']}: {stats['count']}개 (성공: {stats['success']}개, 실패: {stats['failed']}개)")
+        
+        summary_lines = [
+            _SUMMARY_BANNER,
+            f"[{function_name}] 📊 매도 작업 요약",
+            f"  총 매도 대상: {total_count}개",
+            f"  ✅ 주문 성공: {total_success}개",
+            f"  ❌ 주문 실패: {total_failed}개",
+            "",
+            "  우선순위별 상세:",
+            *detail_lines,
+            _SUMMARY_BANNER,
+        ]
+        logger.info("\n".join(summary_lines))
+
+    async def _process_sell_candidate(self, candidate: dict, priority: int, priority_stats: dict, semaphore: asyncio.Semaphore, leverage_map: Dict[str, str], is_daytime_trading: bool, price_probes: dict):
+        """매도 대상 종목 1개에 대한 현재가 조회 및 매도 주문 실행 (KIS API 호출은 워커 스레드에서 실행)"""
+        function_name = "_process_sell_candidate"
+        # 자주 참조하는 설정값을 지역 변수로 바인딩
+        # 현재가 조회 실패 추적: 일정 횟수 이상 실패한 종목은 일정 시간 동안 제외
+        MAX_PRICE_FETCH_FAILURES = SchedulerConfig.MAX_PRICE_FETCH_FAILURES
+        PRICE_FETCH_EXCLUDE_MINUTES = SchedulerConfig.PRICE_FETCH_EXCLUDE_MINUTES
+        price_fetch_exclude_seconds = PRICE_FETCH_EXCLUDE_MINUTES * 60
+        # 주문 실패 추적: 일정 시간 동안 실패한 종목은 제외
+        ORDER_FAILURE_EXCLUDE_MINUTES = SchedulerConfig.ORDER_FAILURE_EXCLUDE_MINUTES
+        order_failure_exclude_seconds = ORDER_FAILURE_EXCLUDE_MINUTES * 60
+        
+        async with semaphore:
+            try:
+                ticker = candidate["ticker"]
+                stock_name = candidate["stock_name"]
+                exchange_code = candidate["exchange_code"]
+                quantity = candidate["quantity"]
+                
+                # 매도 근거
+                sell_reasons = candidate.get("sell_reasons", [])
+                
+                # 거래소 코드 변환 (API 요청에 맞게 변환)
+                api_exchange_code = get_exchange_code_for_api(exchange_code)
+                
+                now = time.monotonic()
+                
+                # 이전에 실패한 적이 있는 종목인지 확인
+                if ticker in self.price_fetch_failures:
+                    failure_count, last_failure_time = self.price_fetch_failures[ticker]
+                    time_since_last_failure = now - last_failure_time
                     
-                    # API 호출 자체가 실패한 경우
-                    if not price_result or price_result.get("rt_cd") != "0":
-                        error_msg = price_result.get('msg1', '알 수 없는 오류') if price_result else 'API 호출 실패'
-                        logger.error(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 실패 (모든 거래소): {error_msg}")
-                        # 실패 횟수 증가
-                        if ticker not in self.price_fetch_failures:
-                            self.price_fetch_failures[ticker] = (1, now)
+                    # 실패 횟수가 최대치를 초과하고, 제외 시간이 지나지 않았으면 스킵
+                    if failure_count >= MAX_PRICE_FETCH_FAILURES:
+                        if time_since_last_failure < price_fetch_exclude_seconds:
+                            logger.debug(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 실패로 인해 일시적으로 제외됨 (실패 {failure_count}회, {int((price_fetch_exclude_seconds - time_since_last_failure) / 60)}분 후 재시도 가능)")
+                            return
                         else:
-                            failure_count, _ = self.price_fetch_failures[ticker]
-                            self.price_fetch_failures[ticker] = (failure_count + 1, now)
-                        
-                        # API 속도 제한에 도달했을 때 더 오래 대기
-                        if price_result and "초당" in error_msg:
-                            await asyncio.sleep(SchedulerConfig.PRICE_FETCH_RATE_LIMIT_SLEEP_SECONDS)
-                        continue
-                    
-                    # 현재가 추출 (안전하게 처리) - last 우선, 없으면 base(전일 종가) 사용
-                    output = price_result.get("output", {})
-                    last_price = output.get("last", "") or ""
-                    base_price = output.get("base", "") or ""
-                    
-                    try:
-                        current_price = None
-                        
-                        # 1순위: 실시간 현재가 (last)
-                        if last_price and last_price != "":
-                            try:
-                                current_price = float(last_price)
-                                if current_price > 0:
-                                    if is_leverage:
-                                        logger.info(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커 - 본주 {price_check_ticker}의 실시간 현재가 사용: {current_price}")
-                                    else:
-                                        logger.debug(f"[{function_name}] {stock_name}({ticker}) 실시간 현재가 사용: {current_price}")
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # 2순위: 전일 종가 (base) - 레버리지 ETF 등 특수 종목 대응
-                        if (current_price is None or current_price <= 0) and base_price and base_price != "":
-                            try:
-                                current_price = float(base_price)
-                                if current_price > 0:
-                                    if is_leverage:
-                                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커 - 본주 {price_check_ticker}의 실시간 현재가 없음, 전일 종가 사용: {current_price}")
-                                    else:
-                                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 실시간 현재가 없음, 전일 종가 사용: {current_price}")
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # 현재가를 찾지 못한 경우
-                        if current_price is None or current_price <= 0:
-                            logger.error(f"[{function_name}] {stock_name}({ticker}) 현재가가 비어있거나 유효하지 않습니다 (last: '{last_price}', base: '{base_price}'). 실패 횟수를 기록합니다.")
-                            # 실패 횟수 증가
-                            if ticker not in self.price_fetch_failures:
-                                self.price_fetch_failures[ticker] = (1, now)
-                            else:
-                                failure_count, _ = self.price_fetch_failures[ticker]
-                                self.price_fetch_failures[ticker] = (failure_count + 1, now)
-                            
-                            if self.price_fetch_failures[ticker][0] >= MAX_PRICE_FETCH_FAILURES:
-                                logger.warning(f"[{function_name}] {stock_name}({ticker}) 현재가 조회가 {MAX_PRICE_FETCH_FAILURES}회 연속 실패했습니다. {PRICE_FETCH_EXCLUDE_MINUTES}분 동안 제외합니다.")
-                            else:
-                                logger.info(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 실패 ({self.price_fetch_failures[ticker][0]}/{MAX_PRICE_FETCH_FAILURES}회). 다음 스케줄러 실행에서 다시 시도합니다.")
-                            
-                            await asyncio.sleep(2)  # 잠시 기다렸다가 넘어감
-                            raise Exception("현재가 조회 실패 - continue 처리")  # except 블록에서 continue 처리
-                        
-                        # 현재가 조회 성공: 실패 카운터 리셋 (있었다면)
-                        if ticker in self.price_fetch_failures:
+                            # 제외 시간이 지났으면 카운터 리셋
+                            logger.info(f"[{function_name}] {stock_name}({ticker}) 제외 시간이 경과하여 다시 시도합니다.")
                             del self.price_fetch_failures[ticker]
-                            logger.debug(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 성공. 실패 카운터를 리셋했습니다.")
-                    
-                    except Exception as ve:
-                        if "현재가 조회 실패 - continue 처리" in str(ve):
-                            continue
-                        logger.error(f"[{function_name}] {stock_name}({ticker}) 현재가 변환 오류: {str(ve)}, last: '{last_price}', base: '{base_price}'")
-                        continue
-                    
-                    # 매도 주문 실행
-                    # 레버리지 티커인 경우: 본주 가격으로 조건 확인했지만, 실제 주문은 레버리지 티커의 현재가 사용
-                    # (본주 가격으로 주문하면 레버리지 티커의 시장 가격과 다를 수 있으므로)
-                    order_price = current_price  # 기본값은 조회한 가격 (본주 가격)
+                
+                # 레버리지 티커인지 확인하고, 본주 티커 가격으로 매도 조건 체크
+                is_leverage = ticker in leverage_map
+                base_ticker = leverage_map.get(ticker)  # 본주 티커 (레버리지 티커인 경우)
+                if is_leverage:
+                    logger.info(f"[{function_name}] {stock_name}({ticker})는 레버리지 티커입니다. 본주 {base_ticker}의 가격으로 매도 조건을 확인합니다.")
+                
+                # 매도 조건 체크용 가격 조회 (레버리지 티커인 경우 본주 가격, 아니면 원래 티커)
+                price_check_ticker = base_ticker if is_leverage else ticker
+                
+                # 현재가 조회 (매도 조건 체크용)
+                # 기본 거래소를 맨 앞으로 (미리 계산된 순서 사용)
+                exchanges = _EXCHANGES_BY_DEFAULT.get(api_exchange_code, _PRICE_EXCHANGES)
+                
+                # 여러 거래소에서 현재가를 동시에 조회 (본주 티커로 - 레버리지인 경우)
+                # 레버리지 티커는 주문 가격용 레버리지 티커 현재가도 같은 요청 묶음으로 함께 조회
+                if is_leverage:
+                    price_results, leverage_price_results = await asyncio.gather(
+                        _fetch_price_results(price_check_ticker, exchanges, price_probes),
+                        _fetch_price_results(ticker, exchanges, price_probes)
+                    )
+                else:
+                    price_results = await _fetch_price_results(price_check_ticker, exchanges, price_probes)
+                
+                found_exchange, price_result = _select_price_result(exchanges, price_results)
+                if found_exchange is not None and found_exchange != api_exchange_code:
+                    logger.info(f"[{function_name}] {stock_name}({ticker}) 거래소 변경 발견: {api_exchange_code} -> {found_exchange}")
+                
+                # API 호출 자체가 실패한 경우
+                if not price_result or price_result.get("rt_cd") != "0":
+                    error_msg = price_result.get('msg1', '알 수 없는 오류') if price_result else 'API 호출 실패'
+                    logger.error(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 실패 (모든 거래소): {error_msg}")
+                    # 실패 횟수 증가
+                    if ticker not in self.price_fetch_failures:
+                        self.price_fetch_failures[ticker] = (1, now)
+                    else:
+                        failure_count, _ = self.price_fetch_failures[ticker]
+                        self.price_fetch_failures[ticker] = (failure_count + 1, now)
                     
-                    # 레버리지 티커인 경우 레버리지 티커의 실제 현재가도 조회 시도 (주문 가격으로 사용)
+                    # API 속도 제한에 도달했을 때 더 오래 대기
+                    if price_result and "초당" in error_msg:
+                        await asyncio.sleep(SchedulerConfig.PRICE_FETCH_RATE_LIMIT_SLEEP_SECONDS)
+                    return
+                
+                # 현재가 추출 (안전하게 처리) - last 우선, 없으면 base(전일 종가) 사용
+                output = price_result.get("output") or _EMPTY_OUTPUT
+                last_price = output.get("last", "") or ""
+                base_price = output.get("base", "") or ""
+                
+                # 1순위: 실시간 현재가 (last)
+                current_price = _parse_price(last_price)
+                if current_price is not None:
                     if is_leverage:
-                        try:
-                            leverage_price_result = None
-                            for exchange in exchanges:
-                                leverage_price_params = {
-                                    "AUTH": "",
-                                    "EXCD": exchange,
-                                    "SYMB": ticker  # 레버리지 티커로 조회
-                                }
-                                leverage_temp_result = get_current_price(leverage_price_params)
-                                output = leverage_temp_result.get("output", {})
-                                if leverage_temp_result.get("rt_cd") == "0" and (output.get("last") or output.get("base")):
-                                    leverage_price_result = leverage_temp_result
-                                    break
-                            
-                            if leverage_price_result and leverage_price_result.get("rt_cd") == "0":
-                                leverage_output = leverage_price_result.get("output", {})
-                                leverage_last = leverage_output.get("last", "") or ""
-                                leverage_base = leverage_output.get("base", "") or ""
-                                
-                                if leverage_last and leverage_last != "":
-                                    try:
-                                        order_price = float(leverage_last)
-                                        if order_price > 0:
-                                            logger.info(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커의 현재가 조회 성공: {order_price} (본주 {base_ticker} 가격: {current_price})")
-                                    except (ValueError, TypeError):
-                                        pass
-                                elif leverage_base and leverage_base != "":
-                                    try:
-                                        order_price = float(leverage_base)
-                                        if order_price > 0:
-                                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커의 현재가 없음, 전일 종가 사용: {order_price} (본주 {base_ticker} 가격: {current_price})")
-                                    except (ValueError, TypeError):
-                                        pass
-                            else:
-                                logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커의 현재가 조회 실패, 본주 가격({current_price})으로 주문 진행")
-                        except Exception as e:
-                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커 가격 조회 중 오류: {str(e)}, 본주 가격({current_price})으로 주문 진행")
-                    
-                    # 주문 가격 검증
-                    if order_price is None or order_price <= 0:
-                        logger.error(f"[{function_name}] {stock_name}({ticker}) 주문 가격이 유효하지 않습니다: {order_price}")
-                        continue
-                    
-                    # 주문 데이터 준비
-                    # 거래소 코드는 원래 값 사용 (NASD, NYSE, AMEX 등)
-                    # order_overseas_stock 함수 내부에서 필요시 변환됨
-                    order_data = {
-                        "CANO": settings.KIS_CANO,
-                        "ACNT_PRDT_CD": settings.KIS_ACNT_PRDT_CD,
-                        "OVRS_EXCG_CD": exchange_code,  # 원래 거래소 코드 사용 (NASD, NYSE, AMEX 등)
-                        "PDNO": ticker,  # 레버리지 티커로 주문
-                        "ORD_DVSN": OrderType.LIMIT.value,  # 지정가
-                        "ORD_QTY": str(quantity),
-                        "OVRS_ORD_UNPR": f"{order_price:.2f}",  # 소수점 2자리로 포맷팅
-                        "is_buy": False,  # 매도
-                        "stock_name": stock_name  # 종목명 추가
-                    }
+                        logger.info(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커 - 본주 {price_check_ticker}의 실시간 현재가 사용: {current_price}")
+                    else:
+                        logger.debug(f"[{function_name}] {stock_name}({ticker}) 실시간 현재가 사용: {current_price}")
+                else:
+                    # 2순위: 전일 종가 (base) - 레버리지 ETF 등 특수 종목 대응
+                    current_price = _parse_price(base_price)
+                    if current_price is not None:
+                        if is_leverage:
+                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커 - 본주 {price_check_ticker}의 실시간 현재가 없음, 전일 종가 사용: {current_price}")
+                        else:
+                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 실시간 현재가 없음, 전일 종가 사용: {current_price}")
+                
+                # 현재가를 찾지 못한 경우
+                if current_price is None:
+                    logger.error(f"[{function_name}] {stock_name}({ticker}) 현재가가 비어있거나 유효하지 않습니다 (last: '{last_price}', base: '{base_price}'). 실패 횟수를 기록합니다.")
+                    # 실패 횟수 증가
+                    if ticker not in self.price_fetch_failures:
+                        self.price_fetch_failures[ticker] = (1, now)
+                    else:
+                        failure_count, _ = self.price_fetch_failures[ticker]
+                        self.price_fetch_failures[ticker] = (failure_count + 1, now)
                     
-                    # 주문 실패 추적: 일정 시간 동안 실패한 종목은 제외
-                    ORDER_FAILURE_EXCLUDE_MINUTES = SchedulerConfig.ORDER_FAILURE_EXCLUDE_MINUTES
-                    now = datetime.now()
+                    if self.price_fetch_failures[ticker][0] >= MAX_PRICE_FETCH_FAILURES:
+                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 현재가 조회가 {MAX_PRICE_FETCH_FAILURES}회 연속 실패했습니다. {PRICE_FETCH_EXCLUDE_MINUTES}분 동안 제외합니다.")
+                    else:
+                        logger.info(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 실패 ({self.price_fetch_failures[ticker][0]}/{MAX_PRICE_FETCH_FAILURES}회). 다음 스케줄러 실행에서 다시 시도합니다.")
                     
-                    # 이전에 주문 실패한 적이 있는 종목인지 확인
+                    await asyncio.sleep(2)  # 잠시 기다렸다가 넘어감
+                    return
+                
+                # 현재가 조회 성공: 실패 카운터 리셋 (있었다면)
+                if ticker in self.price_fetch_failures:
+                    del self.price_fetch_failures[ticker]
+                    logger.debug(f"[{function_name}] {stock_name}({ticker}) 현재가 조회 성공. 실패 카운터를 리셋했습니다.")
+                
+                # 매도 주문 실행
+                # 레버리지 티커인 경우: 본주 가격으로 조건 확인했지만, 실제 주문은 레버리지 티커의 현재가 사용
+                # (본주 가격으로 주문하면 레버리지 티커의 시장 가격과 다를 수 있으므로)
+                order_price = current_price  # 기본값은 조회한 가격 (본주 가격)
+                
+                # 레버리지 티커인 경우 레버리지 티커의 실제 현재가도 조회 시도 (주문 가격으로 사용)
+                if is_leverage:
+                    try:
+                        leverage_exchange, leverage_price_result = _select_price_result(exchanges, leverage_price_results)
+                        if leverage_exchange is not None:
+                            leverage_output = leverage_price_result.get("output") or _EMPTY_OUTPUT
+                            leverage_last = leverage_output.get("last", "") or ""
+                            leverage_base = leverage_output.get("base", "") or ""
+                            
+                            if leverage_last and leverage_last != "":
+                                try:
+                                    order_price = float(leverage_last)
+                                    if order_price > 0:
+                                        logger.info(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커의 현재가 조회 성공: {order_price} (본주 {base_ticker} 가격: {current_price})")
+                                except (ValueError, TypeError):
+                                    pass
+                            elif leverage_base and leverage_base != "":
+                                try:
+                                    order_price = float(leverage_base)
+                                    if order_price > 0:
+                                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커의 현재가 없음, 전일 종가 사용: {order_price} (본주 {base_ticker} 가격: {current_price})")
+                                except (ValueError, TypeError):
+                                    pass
+                        else:
+                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커의 현재가 조회 실패, 본주 가격({current_price})으로 주문 진행")
+                    except Exception as e:
+                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 레버리지 티커 가격 조회 중 오류: {str(e)}, 본주 가격({current_price})으로 주문 진행")
+                
+                # 주문 가격 검증
+                if order_price is None or order_price <= 0:
+                    logger.error(f"[{function_name}] {stock_name}({ticker}) 주문 가격이 유효하지 않습니다: {order_price}")
+                    return
+                
+                # 주문 데이터 준비
+                # 거래소 코드는 원래 값 사용 (NASD, NYSE, AMEX 등)
+                # order_overseas_stock 함수 내부에서 필요시 변환됨
+                order_data = {
+                    **self._sell_order_template,  # 계좌 정보, 지정가, 매도 구분
+                    "OVRS_EXCG_CD": exchange_code,  # 원래 거래소 코드 사용 (NASD, NYSE, AMEX 등)
+                    "PDNO": ticker,  # 레버리지 티커로 주문
+                    "ORD_QTY": str(quantity),
+                    "OVRS_ORD_UNPR": format(order_price, ".2f"),  # 소수점 2자리로 포맷팅
+                    "stock_name": stock_name  # 종목명 추가
+                }
+                
+                # 이전에 주문 실패한 적이 있는 종목인지 확인 (종목 처리 시작 시 기록한 now 재사용)
+                if ticker in self.order_failures:
+                    time_since_last_failure = now - self.order_failures[ticker]
+                    if time_since_last_failure < order_failure_exclude_seconds:
+                        logger.info(f"[{function_name}] {stock_name}({ticker}) 이전 주문 실패로 인해 일시적으로 제외됨 ({int((order_failure_exclude_seconds - time_since_last_failure) / 60)}분 후 재시도 가능)")
+                        return
+                    else:
+                        # 제외 시간이 지났으면 제거
+                        del self.order_failures[ticker]
+                
+                # 부분 익절이면 주문 전 보유 종목 정보 확보 (짧은 TTL 동안 다른 종목과 조회 결과 공유)
+                # 같은 실행에서 종목은 한 번만 매도되므로 캐시된 잔고도 이 종목에 대해서는 항상 매도 전 수량
+                holding_before_sell = None
+                if candidate.get("sell_type") == "partial_profit":
+                    try:
+                        holding_before_sell = (await asyncio.to_thread(self._get_holdings_cached)).get(ticker)
+                    except Exception as e:
+                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 부분 매도 전 보유 수량 조회 실패: {str(e)}")
+                
+                # 주간거래 시간이고 미국 주식인 경우 주간주문 API 사용
+                if is_daytime_trading and exchange_code in ["NASD", "NYSE", "AMEX"]:
+                    logger.info(f"[{function_name}] {stock_name}({ticker}) 주간거래 시간(10:00~18:00)이므로 주간주문 API를 사용합니다.")
+                    order_result = await asyncio.to_thread(order_overseas_stock_daytime, order_data)
+                else:
+                    # 일반 주문 API 사용
+                    order_result = await asyncio.to_thread(order_overseas_stock, order_data)
+                
+                # 우선순위 통계 업데이트
+                priority_stats[priority]["count"] += 1
+                
+                if order_result.get("rt_cd") == "0":
+                    # 주문 성공: 실패 기록 제거 (있었다면)
                     if ticker in self.order_failures:
-                        time_since_last_failure = now - self.order_failures[ticker]
-                        if time_since_last_failure < timedelta(minutes=ORDER_FAILURE_EXCLUDE_MINUTES):
-                            logger.info(f"[{function_name}] {stock_name}({ticker}) 이전 주문 실패로 인해 일시적으로 제외됨 ({int((ORDER_FAILURE_EXCLUDE_MINUTES * 60 - time_since_last_failure.total_seconds()) / 60)}분 후 재시도 가능)")
-                            continue
-                        else:
-                            # 제외 시간이 지났으면 제거
-                            del self.order_failures[ticker]
+                        del self.order_failures[ticker]
                     
-                    # 주간거래 시간 체크 (10:00 ~ 18:00 한국시간)
-                    now_in_korea = datetime.now(pytz.timezone('Asia/Seoul'))
-                    korea_hour = now_in_korea.hour
-                    is_daytime_trading = SchedulerConfig.DAYTIME_TRADING_START_HOUR <= korea_hour < SchedulerConfig.DAYTIME_TRADING_END_HOUR
+                    # 우선순위별 성공 통계 업데이트
+                    priority_stats[priority]["success"] += 1
                     
-                    # 주간거래 시간이고 미국 주식인 경우 주간주문 API 사용
-                    if is_daytime_trading and exchange_code in ["NASD", "NYSE", "AMEX"]:
-                        logger.info(f"[{function_name}] {stock_name}({ticker}) 주간거래 시간(10:00~18:00)이므로 주간주문 API를 사용합니다.")
-                        order_result = order_overseas_stock_daytime(order_data)
-                    else:
-                        # 일반 주문 API 사용
-                        order_result = order_overseas_stock(order_data)
+                    order_type = "시장가" if order_data["ORD_DVSN"] == OrderType.MARKET.value else "지정가"
+                    sell_type_name = candidate.get("sell_type", "unknown")
+                    logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 매도 주문 성공 ({order_type}, {sell_type_name}): {order_result.get('msg1', '주문이 접수되었습니다.')}")
                     
-                    # 우선순위 통계 업데이트
-                    priority_stats[priority]["count"] += 1
+                    # 매도 성공 기록을 MongoDB에 저장 (워커 스레드에서 실행하여 다른 종목 처리를 막지 않음)
+                    save_success = await asyncio.to_thread(
+                        self._save_trading_log,
+                        order_type="sell",
+                        ticker=ticker,
+                        stock_name=stock_name,
+                        price=order_price,
+                        quantity=quantity,
+                        status=OrderStatus.EXECUTED.value,  # 매도 성공은 executed로 처리
+                        price_change_percent=candidate.get("price_change_percent"),
+                        sell_reasons=sell_reasons,
+                        order_result=order_result,
+                        exchange_code=exchange_code
+                    )
                     
-                    if order_result.get("rt_cd") == "0":
-                        # 주문 성공: 실패 기록 제거 (있었다면)
-                        if ticker in self.order_failures:
-                            del self.order_failures[ticker]
-                        
-                        # 우선순위별 성공 통계 업데이트
-                        priority_stats[priority]["success"] += 1
-                        
-                        order_type = "시장가" if order_data["ORD_DVSN"] == OrderType.MARKET.value else "지정가"
-                        sell_type_name = candidate.get("sell_type", "unknown")
-                        logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 매도 주문 성공 ({order_type}, {sell_type_name}): {order_result.get('msg1', '주문이 접수되었습니다.')}")
-                        
-                        # 매도 성공 기록을 MongoDB에 저장
-                        save_success = self._save_trading_log(
-                            order_type="sell",
-                            ticker=ticker,
-                            stock_name=stock_name,
-                            price=order_price,
-                            quantity=quantity,
-                            status=OrderStatus.EXECUTED.value,  # 매도 성공은 executed로 처리
-                            price_change_percent=candidate.get("price_change_percent"),
-                            sell_reasons=sell_reasons,
-                            order_result=order_result,
-                            exchange_code=exchange_code
-                        )
-                        
-                        if not save_success:
-                            logger.warning(f"[{function_name}] ⚠️ {stock_name}({ticker}) 매도 주문은 성공했으나 기록 저장에 실패했습니다. 수동으로 확인이 필요합니다.")
-                        
-                        # 부분 익절 히스토리 업데이트 (부분 매도인 경우)
-                        sell_type = candidate.get("sell_type", "")
-                        if sell_type == "partial_profit":
-                            try:
-                                from app.db.mongodb import get_db
-                                db = get_db()
-                                if db is not None:
-                                    partial_profit_info = candidate.get("partial_profit_info")
-                                    if partial_profit_info:
-                                        stage = partial_profit_info.get("stage")
-                                        stage_profit = partial_profit_info.get("profit_percent")
-                                        sell_qty = partial_profit_info.get("sell_quantity")
-                                        
-                                        from app.utils.user_context import get_current_user_id
-                                        user_id = get_current_user_id()
-                                        
-                                        # 부분 익절 히스토리 조회 또는 생성
-                                        history = db.partial_sell_history.find_one({
-                                            "user_id": user_id,
-                                            "ticker": ticker
-                                        })
-                                        
-                                        # 현재 보유 수량 확인 (부분 매도 후 남은 수량)
-                                        # 잔고 조회를 통해 정확한 남은 수량 확인
-                                        remaining_quantity = 0
+                    if not save_success:
+                        logger.warning(f"[{function_name}] ⚠️ {stock_name}({ticker}) 매도 주문은 성공했으나 기록 저장에 실패했습니다. 수동으로 확인이 필요합니다.")
+                    
+                    # 부분 익절 히스토리 업데이트 (부분 매도인 경우)
+                    sell_type = candidate.get("sell_type", "")
+                    if sell_type == "partial_profit":
+                        try:
+                            db = get_db()
+                            if db is not None:
+                                partial_profit_info = candidate.get("partial_profit_info")
+                                if partial_profit_info:
+                                    stage = partial_profit_info.get("stage")
+                                    stage_profit = partial_profit_info.get("profit_percent")
+                                    sell_qty = partial_profit_info.get("sell_quantity")
+                                    
+                                    user_id = get_current_user_id()
+                                    
+                                    # 부분 매도 후 남은 수량 = 주문 전 보유 수량 - 매도 수량
+                                    # (주문 직후 잔고는 체결 전일 수 있으므로 주문 전 수량을 기준으로 계산)
+                                    holding = holding_before_sell
+                                    held_quantity = 0
+                                    try:
+                                        if holding:
+                                            held_quantity = int(holding.get("ovrs_cblc_qty", 0))
+                                    except (ValueError, TypeError) as e:
+                                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 부분 매도 전 보유 수량 확인 실패: {str(e)}")
+                                    remaining_quantity = max(held_quantity - sell_qty, 0)
+                                    
+                                    # 구매 평균단가 조회
+                                    purchase_price = candidate.get("purchase_price", 0)
+                                    if purchase_price <= 0:
+                                        # candidate에 없으면 위에서 조회한 잔고에서 확인
                                         try:
-                                            balance_result = get_overseas_balance()
-                                            if balance_result.get("rt_cd") == "0":
-                                                holdings = balance_result.get("output1", [])
-                                                for item in holdings:
-                                                    if item.get("ovrs_pdno") == ticker:
-                                                        remaining_quantity = int(item.get("ovrs_cblc_qty", 0))
-                                                        break
+                                            if holding:
+                                                purchase_price = float(holding.get("pchs_avg_pric", 0))
                                         except Exception as e:
-                                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 부분 매도 후 남은 수량 조회 실패: {str(e)}")
-                                        
-                                        # 구매 평균단가 조회
-                                        purchase_price = candidate.get("purchase_price", 0)
-                                        if purchase_price <= 0:
-                                            # candidate에 없으면 잔고에서 조회
-                                            try:
-                                                balance_result = get_overseas_balance()
-                                                if balance_result.get("rt_cd") == "0":
-                                                    holdings = balance_result.get("output1", [])
-                                                    for item in holdings:
-                                                        if item.get("ovrs_pdno") == ticker:
-                                                            purchase_price = float(item.get("pchs_avg_pric", 0))
-                                                            break
-                                            except Exception as e:
-                                                logger.warning(f"[{function_name}] {stock_name}({ticker}) 구매 평균단가 조회 실패: {str(e)}")
-                                        
-                                        # 부분 매도 기록 생성
-                                        partial_sell_record = {
-                                            "stage": stage,
-                                            "profit_percent": stage_profit,
-                                            "sell_quantity": sell_qty,
-                                            "sell_price": order_price,
-                                            "sell_date": datetime.utcnow(),
-                                            "remaining_quantity": remaining_quantity
-                                        }
-                                        
-                                        if history:
-                                            # 기존 히스토리 업데이트
-                                            partial_sells = history.get("partial_sells", [])
-                                            partial_sells.append(partial_sell_record)
-                                            
-                                            # 초기 수량이 없으면 현재 수량 + 매도 수량으로 설정
-                                            initial_quantity = history.get("initial_quantity")
-                                            if not initial_quantity:
-                                                initial_quantity = remaining_quantity + sell_qty
-                                            
-                                            # 모든 단계가 완료되었는지 확인 (3단계 모두 완료)
-                                            completed_stages = {sell.get("stage") for sell in partial_sells}
-                                            is_completed = len(completed_stages) >= 3
-                                            
-                                            db.partial_sell_history.update_one(
-                                                {"user_id": user_id, "ticker": ticker},
-                                                {
-                                                    "$set": {
-                                                        "partial_sells": partial_sells,
-                                                        "is_completed": is_completed,
-                                                        "last_updated": datetime.utcnow()
-                                                    }
-                                                }
-                                            )
-                                            
-                                            logger.info(
-                                                f"[{function_name}] 📝 {stock_name}({ticker}) 부분 익절 {stage}단계 히스토리 업데이트 완료 "
-                                                f"(매도: {sell_qty}주 @ ${order_price:.2f}, 남은 수량: {remaining_quantity}주)"
-                                            )
-                                        else:
-                                            # 새로운 히스토리 생성
-                                            initial_quantity = remaining_quantity + sell_qty
-                                            is_completed = stage >= 3  # 3단계면 완료
-                                            
-                                            new_history = {
-                                                "user_id": user_id,
-                                                "ticker": ticker,
-                                                "stock_name": stock_name,
-                                                "purchase_price": purchase_price,
-                                                "initial_quantity": initial_quantity,
-                                                "partial_sells": [partial_sell_record],
-                                                "is_completed": is_completed,
-                                                "last_updated": datetime.utcnow(),
-                                                "created_at": datetime.utcnow()
+                                            logger.warning(f"[{function_name}] {stock_name}({ticker}) 구매 평균단가 조회 실패: {str(e)}")
+                                    
+                                    # 부분 매도 기록 생성 (기록 시각은 한 번만 조회하여 모든 필드에 사용)
+                                    # MongoDB는 밀리초 단위로 저장하므로 저장 값과 비교할 수 있도록 미리 맞춤
+                                    recorded_at = datetime.utcnow()
+                                    recorded_at = recorded_at.replace(microsecond=recorded_at.microsecond // 1000 * 1000)
+                                    partial_sell_record = {
+                                        "stage": stage,
+                                        "profit_percent": stage_profit,
+                                        "sell_quantity": sell_qty,
+                                        "sell_price": order_price,
+                                        "sell_date": recorded_at,
+                                        "remaining_quantity": remaining_quantity
+                                    }
+                                    
+                                    # 히스토리에 부분 매도 기록 추가 또는 새로 생성 (조회 없이 한 번의 원자적 upsert)
+                                    # 완료 여부는 서버에서 계산한 is_completed를 갱신 후 문서로 받아 사용하며
+                                    # (부분 매도 목록은 전송하지 않음), 새로 생성된 경우는 3단계 매도면 완료로 간주
+                                    initial_quantity = held_quantity if held_quantity > 0 else sell_qty
+                                    is_new_history = {"$eq": [{"$type": "$created_at"}, "missing"]}
+                                    updated = await asyncio.to_thread(
+                                        db.partial_sell_history.find_one_and_update,
+                                        {"user_id": user_id, "ticker": ticker},
+                                        [{
+                                            "$set": {
+                                                "partial_sells": {"$concatArrays": [
+                                                    {"$ifNull": ["$partial_sells", []]},
+                                                    {"$literal": [partial_sell_record]}
+                                                ]},
+                                                "is_completed": {"$or": [
+                                                    {"$gte": [{"$size": {"$setUnion": [
+                                                        {"$ifNull": ["$partial_sells.stage", []]}, [stage]
+                                                    ]}}, 3]},
+                                                    {"$and": [is_new_history, stage >= 3]}
+                                                ]},
+                                                "stock_name": {"$ifNull": ["$stock_name", stock_name]},
+                                                "purchase_price": {"$ifNull": ["$purchase_price", purchase_price]},
+                                                # 초기 수량이 없으면 주문 전 보유 수량으로 설정
+                                                "initial_quantity": {"$ifNull": ["$initial_quantity", initial_quantity]},
+                                                "last_updated": recorded_at,
+                                                "created_at": {"$ifNull": ["$created_at", recorded_at]}
                                             }
-                                            
-                                            db.partial_sell_history.insert_one(new_history)
-                                            
-                                            logger.info(
-                                                f"[{function_name}] 📝 {stock_name}({ticker}) 부분 익절 히스토리 생성 완료 "
-                                                f"(초기 수량: {initial_quantity}주, {stage}단계 매도: {sell_qty}주 @ ${order_price:.2f})"
-                                            )
-                                        
-                                        # 3단계 모두 완료되었으면 로그 추가
-                                        if is_completed:
-                                            logger.info(
-                                                f"[{function_name}] ✅ {stock_name}({ticker}) 부분 익절 전략 완료 "
-                                                f"(1단계: +5%, 2단계: +8%, 3단계: +12% 모두 매도 완료). "
-                                                f"나머지는 트레일링 스톱으로 관리됩니다."
-                                            )
-                            except Exception as e:
-                                logger.warning(f"[{function_name}] 부분 익절 히스토리 업데이트 중 오류 (무시): {str(e)}", exc_info=True)
-                        
-                        # 트레일링 스톱 비활성화 (전체 매도인 경우만, 부분 매도는 유지)
-                        try:
-                            from app.services.trailing_stop_service import TrailingStopService
-                            trailing_stop_service = TrailingStopService()
-                            
-                            # 부분 익절이 아닌 경우에만 트레일링 스톱 비활성화
-                            if sell_type != "partial_profit":
-                                trailing_stop_service.deactivate_trailing_stop(ticker)
-                            
-                            # 트레일링 스톱 매도인 경우 상세 정보 로깅
-                            if sell_type == "trailing_stop":
-                                trailing_info = trailing_stop_service.get_trailing_stop_info(ticker)
-                                if trailing_info:
-                                    logger.info(f"[{function_name}] 📊 {stock_name}({ticker}) 트레일링 스톱 매도 상세:")
-                                    logger.info(f"    최고가: ${trailing_info.get('highest_price', 0):.2f}")
-                                    logger.info(f"    동적 익절가: ${trailing_info.get('dynamic_stop_price', 0):.2f}")
-                                    logger.info(f"    매도가: ${order_price:.2f}")
-                                    purchase_price = trailing_info.get('purchase_price', 0)
-                                    if purchase_price > 0:
-                                        profit_percent = ((order_price - purchase_price) / purchase_price) * 100
-                                        logger.info(f"    수익률: {profit_percent:.2f}%")
+                                        }],
+                                        projection={"_id": 0, "is_completed": 1, "created_at": 1},
+                                        upsert=True,
+                                        return_document=ReturnDocument.AFTER
+                                    )
+                                    
+                                    is_completed = bool(updated.get("is_completed"))
+                                    # 이번 upsert로 생성된 문서만 created_at이 이번 기록 시각과 같음
+                                    if updated.get("created_at") != recorded_at:
+                                        logger.info(
+                                            f"[{function_name}] 📝 {stock_name}({ticker}) 부분 익절 {stage}단계 히스토리 업데이트 완료 "
+                                            f"(매도: {sell_qty}주 @ ${order_price:.2f}, 남은 수량: {remaining_quantity}주)"
+                                        )
+                                    else:
+                                        logger.info(
+                                            f"[{function_name}] 📝 {stock_name}({ticker}) 부분 익절 히스토리 생성 완료 "
+                                            f"(초기 수량: {initial_quantity}주, {stage}단계 매도: {sell_qty}주 @ ${order_price:.2f})"
+                                        )
+                                    
+                                    # 3단계 모두 완료되었으면 로그 추가
+                                    if is_completed:
+                                        logger.info(
+                                            f"[{function_name}] ✅ {stock_name}({ticker}) 부분 익절 전략 완료 "
+                                            f"(1단계: +5%, 2단계: +8%, 3단계: +12% 모두 매도 완료). "
+                                            f"나머지는 트레일링 스톱으로 관리됩니다."
+                                        )
                         except Exception as e:
-                            logger.warning(f"[{function_name}] 트레일링 스톱 비활성화 중 오류 (무시): {str(e)}")
-                        
-                        # Slack 알림 전송 (성공 시에만)
-                        slack_notifier.send_sell_notification(
-                            stock_name=stock_name,
-                            ticker=ticker,
-                            quantity=quantity,
-                            price=order_price if order_data["ORD_DVSN"] == OrderType.LIMIT.value else None,  # 시장가는 가격 없음
-                            exchange_code=exchange_code,
-                            sell_reasons=sell_reasons,
-                            success=True
-                        )
-                    else:
-                        error_msg = order_result.get('msg1', '알 수 없는 오류')
-                        error_code = order_result.get('msg_cd', '')
+                            logger.warning(f"[{function_name}] 부분 익절 히스토리 업데이트 중 오류 (무시): {str(e)}", exc_info=True)
+                    
+                    # 트레일링 스톱 비활성화 (전체 매도인 경우만, 부분 매도는 유지)
+                    try:
+                        trailing_stop_service = self._get_trailing_stop_service(get_current_user_id())
                         
-                        # 장외거래시간 에러인 경우: 실패 기록하지 않고 조용히 건너뜀 (로그 레벨을 INFO로 변경)
-                        if "장운영시간" in error_msg or "APBK0918" in error_code:
-                            logger.info(f"[{function_name}] {stock_name}({ticker}) 장외거래시간 주문 불가: {error_msg}. 다음 스케줄러 실행에서 다시 시도합니다.")
-                            continue  # 실패 기록 없이 다음 종목으로 (재시도 안 함)
+                        # 부분 익절이 아닌 경우에만 트레일링 스톱 비활성화
+                        if sell_type != "partial_profit":
+                            await asyncio.to_thread(trailing_stop_service.deactivate_trailing_stop, ticker)
                         
-                        # 다른 에러인 경우: 실패 기록
-                        priority_stats[priority]["failed"] += 1
-                        sell_type_name = candidate.get("sell_type", "unknown")
-                        logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 매도 주문 실패 ({sell_type_name}): {error_msg}")
-                        self.order_failures[ticker] = now
-                        logger.warning(f"[{function_name}] {stock_name}({ticker}) 주문 실패로 {ORDER_FAILURE_EXCLUDE_MINUTES}분 동안 제외합니다.")
+                        # 트레일링 스톱 매도인 경우 상세 정보 로깅
+                        if sell_type == "trailing_stop":
+                            trailing_info = await asyncio.to_thread(trailing_stop_service.get_trailing_stop_info, ticker)
+                            if trailing_info:
+                                logger.info(f"[{function_name}] 📊 {stock_name}({ticker}) 트레일링 스톱 매도 상세:")
+                                logger.info(f"    최고가: ${trailing_info.get('highest_price', 0):.2f}")
+                                logger.info(f"    동적 익절가: ${trailing_info.get('dynamic_stop_price', 0):.2f}")
+                                logger.info(f"    매도가: ${order_price:.2f}")
+                                purchase_price = trailing_info.get('purchase_price', 0)
+                                if purchase_price > 0:
+                                    profit_percent = ((order_price - purchase_price) / purchase_price) * 100
+                                    logger.info(f"    수익률: {profit_percent:.2f}%")
+                    except Exception as e:
+                        logger.warning(f"[{function_name}] 트레일링 스톱 비활성화 중 오류 (무시): {str(e)}")
                     
-                    # 요청 간 지연 (API 요청 제한 방지)
-                    await asyncio.sleep(SchedulerConfig.ORDER_DELAY_SECONDS)
+                    # Slack 알림 대상에 추가 (성공 시에만, 우선순위 처리가 끝나면 한 번에 전송)
+                    priority_stats[priority]["sold"].append({
+                        "stock_name": stock_name,
+                        "ticker": ticker,
+                        "quantity": quantity,
+                        "price": order_price if order_data["ORD_DVSN"] == OrderType.LIMIT.value else None,  # 시장가는 가격 없음
+                        "exchange_code": exchange_code,
+                        "sell_reasons": sell_reasons,
+                    })
+                else:
+                    error_msg = order_result.get('msg1', '알 수 없는 오류')
+                    error_code = order_result.get('msg_cd', '')
                     
-                except Exception as e:
+                    # 장외거래시간 에러인 경우: 실패 기록하지 않고 조용히 건너뜀 (로그 레벨을 INFO로 변경)
+                    if "장운영시간" in error_msg or "APBK0918" in error_code:
+                        logger.info(f"[{function_name}] {stock_name}({ticker}) 장외거래시간 주문 불가: {error_msg}. 다음 스케줄러 실행에서 다시 시도합니다.")
+                        return  # 실패 기록 없이 다음 종목으로 (재시도 안 함)
+                    
+                    # 다른 에러인 경우: 실패 기록
                     priority_stats[priority]["failed"] += 1
-                    logger.error(f"[{function_name}] ❌ {candidate['stock_name']}({candidate['ticker']}) 매도 처리 중 오류: {str(e)}", exc_info=True)
-                    await asyncio.sleep(1)  # 오류 발생 시에도 잠시 대기
-            
-            # 우선순위별 처리 완료 로깅
-            stats = priority_stats[priority]
-            if stats["count"] > 0:
-                logger.info(f"[{function_name}] {priority_name} 처리 완료: 총 {stats['count']}개, 성공 {stats['success']}개, 실패 {stats['failed']}개")
-        
-        # 전체 매도 작업 요약 로깅
-        total_count = sum(s["count"] for s in priority_stats.values())
-        total_success = sum(s["success"] for s in priority_stats.values())
-        total_failed = sum(s["failed"] for s in priority_stats.values())
-        
-        logger.info("=" * 80)
-        logger.info(f"[{function_name}] 📊 매도 작업 요약")
-        logger.info(f"  총 매도 대상: {total_count}개")
-        logger.info(f"  ✅ 주문 성공: {total_success}개")
-        logger.info(f"  ❌ 주문 실패: {total_failed}개")
-        logger.info("")
-        logger.info("  우선순위별 상세:")
-        for priority in [SellPriority.STOP_LOSS, SellPriority.TAKE_PROFIT, SellPriority.TECHNICAL]:
-            stats = priority_stats[priority]
-            if stats["count"] > 0:
-                logger.info(f"    {stats['name']}: {stats['count']}개 (성공: {stats['success']}개, 실패: {stats['failed']}개)")
-        logger.info("=" * 80)
+                    sell_type_name = candidate.get("sell_type", "unknown")
+                    logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 매도 주문 실패 ({sell_type_name}): {error_msg}")
+                    self.order_failures[ticker] = now
+                    logger.warning(f"[{function_name}] {stock_name}({ticker}) 주문 실패로 {ORDER_FAILURE_EXCLUDE_MINUTES}분 동안 제외합니다.")
+                
+                # 요청 간 지연 (API 요청 제한 방지)
+                await asyncio.sleep(SchedulerConfig.ORDER_DELAY_SECONDS)
+                
+            except Exception as e:
+                priority_stats[priority]["failed"] += 1
+                logger.error(f"[{function_name}] ❌ {candidate['stock_name']}({candidate['ticker']}) 매도 처리 중 오류: {str(e)}", exc_info=True)
+                await asyncio.sleep(1)  # 오류 발생 시에도 잠시 대기
     
     async def _execute_auto_buy(self, send_slack_notification: bool = True):
         """
@@ -1488,7 +1693,6 @@ class StockScheduler:
         logger.info(f"[{function_name}] 함수 실행 시작")
         
         # 활성 사용자 목록 조회
-        from app.utils.user_context import get_active_users
         active_users = get_active_users()
         logger.info(f"[{function_name}] 활성 사용자 {len(active_users)}명: {active_users}")
         
@@ -1511,7 +1715,6 @@ class StockScheduler:
         logger.info(f"[{function_name}] 사용자 {user_id} 매수 작업 시작")
         
         # 사용자별 컨텍스트 설정
-        from app.utils.user_context import set_global_user_context
         set_global_user_context(user_id)
         
         # 사용자별 설정 조회
@@ -1523,10 +1726,9 @@ class StockScheduler:
             return
         
         # 현재 시간이 미국 장 시간인지 확인 (서머타임 고려)
-        now_in_korea = datetime.now(pytz.timezone('Asia/Seoul'))
-        now_in_ny = datetime.now(pytz.timezone('America/New_York'))
-        ny_hour = now_in_ny.hour
-        ny_minute = now_in_ny.minute
+        now_in_korea = datetime.now(KST)
+        now_in_ny = datetime.now(NEW_YORK_TZ)
+        ny_minute_of_day = now_in_ny.hour * 60 + now_in_ny.minute  # 자정 기준 경과 분
         ny_weekday = now_in_ny.weekday()  # 0=월요일, 6=일요일
         
         # 주말 체크
@@ -1544,11 +1746,7 @@ class StockScheduler:
         
         # 미국 주식 시장은 평일(월-금) 9:30 AM - 4:00 PM ET
         is_weekday = 0 <= ny_weekday <= 4  # 월요일에서 금요일까지
-        is_market_open_time = (
-            (ny_hour == 9 and ny_minute >= 30) or
-            (10 <= ny_hour < 16) or
-            (ny_hour == 16 and ny_minute == 0)
-        )
+        is_market_open_time = 9 * 60 + 30 <= ny_minute_of_day <= 16 * 60  # 9:30 ~ 16:00 (마감 시각 포함)
         
         is_market_hours = is_weekday and is_market_open_time
         
@@ -1567,8 +1765,12 @@ class StockScheduler:
         
         # 보유 종목 및 잔고 조회
         try:
-            # 1. 모든 거래소의 보유 종목 조회
-            balance_result = get_all_overseas_balances()
+            # 1. 모든 거래소의 보유 종목 조회와 2. 체결기준현재잔고 조회를 워커 스레드에서 동시에 실행
+            # (거래소별 잔고 조회가 1초 이상 걸리므로 이벤트 루프를 막지 않고 두 조회의 대기 시간을 겹침)
+            balance_result, present_balance_result = await asyncio.gather(
+                asyncio.to_thread(get_all_overseas_balances),
+                asyncio.to_thread(get_overseas_present_balance),
+            )
             if balance_result.get("rt_cd") != "0":
                 logger.error(f"[{function_name}] 보유 종목 조회 실패: {balance_result.get('msg1', '알 수 없는 오류')}")
                 if send_slack_notification:
@@ -1581,34 +1783,25 @@ class StockScheduler:
             
             # 보유 종목 티커 추출 및 보유 수량 저장 (체결 확인용)
             holdings = balance_result.get("output1", [])
-            holding_tickers = set()
-            holding_quantities = {}  # ticker -> quantity (체결 확인용)
-            holding_values = {}  # ticker -> current_value (포트폴리오 비중 계산용)
-            portfolio_total_value = 0.0  # 포트폴리오 총 가치
-            
-            for item in holdings:
-                ticker = item.get("ovrs_pdno")
-                if ticker:
-                    holding_tickers.add(ticker)
-                    quantity = int(item.get("ovrs_cblc_qty", 0))
-                    holding_quantities[ticker] = quantity
-                    
-                    # 평가 금액 계산 (포트폴리오 비중 계산용)
-                    try:
-                        current_price = float(item.get("now_pric2", "0") or "0")
-                        if current_price > 0 and quantity > 0:
-                            current_value = quantity * current_price
-                            holding_values[ticker] = current_value
-                            portfolio_total_value += current_value
-                    except (ValueError, TypeError):
-                        # 가격 정보가 없거나 변환 실패 시 0으로 처리
-                        holding_values[ticker] = 0.0
+            # (티커, 보유 수량, 현재가) 한 번에 추출 - 현재가가 없거나 변환 실패 시 0으로 처리
+            positions = [
+                (item["ovrs_pdno"], int(item.get("ovrs_cblc_qty", 0)), _parse_price(item.get("now_pric2")) or 0.0)
+                for item in holdings if item.get("ovrs_pdno")
+            ]
+            holding_tickers = {ticker for ticker, _, _ in positions}
+            holding_quantities = {ticker: quantity for ticker, quantity, _ in positions}  # ticker -> quantity (체결 확인용)
+            # ticker -> current_value (포트폴리오 비중 계산용, 평가 금액이 없는 종목은 0으로 간주)
+            holding_values = {
+                ticker: quantity * current_price
+                for ticker, quantity, current_price in positions
+                if quantity > 0 and current_price > 0
+            }
+            portfolio_total_value = math.fsum(holding_values.values())  # 포트폴리오 총 가치
             
             logger.info(f"[{function_name}] 현재 보유 중인 종목 수: {len(holding_tickers)}")
             logger.info(f"[{function_name}] 📊 포트폴리오 총 가치: ${portfolio_total_value:,.2f}")
             
             # 2. 잔고 조회 - 체결기준현재잔고 API 사용 (외화사용가능금액 포함)
-            present_balance_result = get_overseas_present_balance()
             available_cash = 0.0
             
             if present_balance_result.get("rt_cd") == "0":
@@ -1681,28 +1874,24 @@ class StockScheduler:
         logger.info(f"[{function_name}] 추천 종목 수 (중복 제거 전): {len(raw_candidates)}개")
         
         # MongoDB에서 현재 사용자의 레버리지 설정 조회
-        user_leverage_map = {}  # ticker -> use_leverage (leverage_ticker는 stocks 컬렉션에서 조회)
+        user_leverage_map = {}  # ticker -> use_leverage 여부 (leverage_ticker는 stocks 컬렉션에서 조회)
         db = None
         try:
-            from app.infrastructure.database.mongodb_client import get_mongodb_database
-            db = get_mongodb_database()
+            db = get_db()
             
             if db is not None:
                 # 현재 사용자만 조회
-                from app.utils.user_context import get_current_user_id
                 current_user_id = get_current_user_id()
-                user = db.users.find_one({"user_id": current_user_id})
+                user = db.users.find_one(
+                    {"user_id": current_user_id},
+                    {"_id": 0, "stocks.ticker": 1, "stocks.use_leverage": 1}
+                )
                 
                 if user and user.get("stocks"):
                     for stock in user.get("stocks", []):
                         ticker = stock.get("ticker")
-                        use_leverage = stock.get("use_leverage", False)
-                        
                         if ticker:
-                            user_leverage_map[ticker] = {
-                                "use_leverage": use_leverage
-                                # leverage_ticker는 stocks 컬렉션에서 조회
-                            }
+                            user_leverage_map[ticker] = stock.get("use_leverage", False)
                     
                     logger.info(f"[{function_name}] 사용자 {current_user_id}의 레버리지 설정 로드 완료: {len(user_leverage_map)}개 종목")
                 else:
@@ -1730,13 +1919,14 @@ class StockScheduler:
                 continue
             seen_tickers.add(ticker)
             
-            # use_leverage 필터링: use_leverage가 true인 종목만 매수
-            if ticker not in user_leverage_map:
+            # use_leverage 필터링: use_leverage가 true인 종목만 매수 (설정은 한 번만 조회)
+            use_leverage = user_leverage_map.get(ticker)
+            if use_leverage is None:
                 # 사용자 설정에 없는 종목은 매수하지 않음
                 logger.info(f"[{function_name}] {stock_name}({ticker}) - 사용자 설정에 없어 매수 제외")
                 continue
             
-            if not user_leverage_map[ticker]["use_leverage"]:
+            if not use_leverage:
                 # use_leverage가 false인 종목은 매수하지 않음
                 logger.info(f"[{function_name}] {stock_name}({ticker}) - use_leverage가 false여서 매수 제외")
                 continue
@@ -1745,6 +1935,20 @@ class StockScheduler:
         
         logger.info(f"[{function_name}] 매수 후보 종목 수 (중복 제거 및 use_leverage 필터링 후): {len(buy_candidates)}개")
         
+        # 레버리지 티커를 한 번의 $in 쿼리로 조회 (매수 후보는 모두 use_leverage가 true)
+        leverage_tickers = {}  # 본주 티커 -> 레버리지 티커
+        if buy_candidates and db is not None:
+            try:
+                leverage_tickers = {
+                    doc["ticker"]: doc["leverage_ticker"]
+                    for doc in db.stocks.find(
+                        {"ticker": {"$in": [c["ticker"] for c in buy_candidates]}, "leverage_ticker": {"$nin": [None, ""]}},
+                        {"_id": 0, "ticker": 1, "leverage_ticker": 1}
+                    )
+                }
+            except Exception as e:
+                logger.warning(f"[{function_name}] 레버리지 티커 조회 중 오류 (일반 티커로 매수): {str(e)}")
+        
         if not buy_candidates:
             logger.info(f"[{function_name}] 매수 조건을 만족하는 종목이 없습니다.")
             if send_slack_notification:
@@ -1778,6 +1982,29 @@ class StockScheduler:
         # 체결 확인 태스크 추적 (요약 로그 출력 전 모든 체결 확인 완료 대기용)
         execution_tasks = []
         
+        # 매수 주문 속도 제한 (고정 지연 대신 초당 한도를 넘을 때만 대기, 실행마다 새로 생성)
+        order_limiter = _AsyncRateLimiter(SchedulerConfig.BUY_ORDERS_PER_SECOND)
+        # 체결 확인 fallback이 같은 잔고 조회를 공유하도록 실행마다 새로 생성 (다른 실행과 공유하지 않음)
+        fill_check_holdings = _FillCheckHoldings()
+        planned_orders = []  # 매수 판단을 통과한 주문 (종합 점수 순)
+        
+        # 보유 평가 금액 -> 비중(%) 환산 계수 (총 가치가 바뀌는 매수 주문 예정 시에만 다시 계산)
+        weight_scale = 100.0 / portfolio_total_value if portfolio_total_value > 0 else 0.0
+        
+        # 매수 후보 현재가를 동시에 미리 조회하여 캐시 (보유/비중 조건으로 건너뛸 종목은 제외)
+        # 주문은 아래에서 순서대로 실행하며, 캐시 유효 시간이 지난 종목은 주문 직전에 다시 조회
+        price_targets = set()
+        for candidate in buy_candidates:
+            ticker = candidate["ticker"]
+            actual_ticker = leverage_tickers.get(ticker, ticker) if user_leverage_map.get(ticker) else ticker
+            _, pure_ticker, api_exchange_code = _buy_order_target(actual_ticker)
+            if not allow_buy_existing_stocks and pure_ticker in holding_tickers:
+                continue
+            if holding_values.get(pure_ticker, 0.0) * weight_scale >= max_portfolio_weight:
+                continue
+            price_targets.add((api_exchange_code, pure_ticker))
+        await self._prefetch_current_prices(price_targets)
+        
         # 각 종목에 대해 API 호출하여 현재 체결가 조회 및 매수 주문
         # buy_candidates는 이미 composite_score 순으로 정렬되어 있음
         for candidate in buy_candidates:
@@ -1788,26 +2015,18 @@ class StockScheduler:
                 # 사용자의 레버리지 설정 확인 (leverage_ticker는 stocks 컬렉션에서 조회)
                 # 레버리지 매수는 use_leverage가 True이고 leverage_ticker가 있을 때만 수행
                 actual_ticker = ticker  # 기본값은 원래 티커
-                if ticker in user_leverage_map and user_leverage_map[ticker]["use_leverage"]:
-                    # stocks 컬렉션에서 레버리지 티커 조회
-                    stock_doc = db.stocks.find_one({"ticker": ticker}) if db is not None else None
-                    if stock_doc and stock_doc.get("leverage_ticker"):
-                        actual_ticker = stock_doc["leverage_ticker"]
+                if user_leverage_map.get(ticker):
+                    # 루프 전에 일괄 조회한 레버리지 티커 사용
+                    if ticker in leverage_tickers:
+                        actual_ticker = leverage_tickers[ticker]
                         logger.info(f"[{function_name}] {stock_name}({ticker}) - 레버리지 활성화, {actual_ticker}로 매수")
                     else:
                         # use_leverage가 True인데 leverage_ticker가 없으면 일반 티커로 매수
                         logger.info(f"[{function_name}] {stock_name}({ticker}) - 레버리지 설정 활성화되었으나 leverage_ticker가 없어 일반 티커로 매수")
                 else:
                     logger.info(f"[{function_name}] {stock_name}({ticker}) - 일반 티커로 매수")                
-                # 거래소 코드 결정 (미국 주식 기준)
-                if actual_ticker.endswith(".X") or actual_ticker.endswith(".N"):
-                    # 거래소 구분이 티커에 포함된 경우
-                    exchange_code = "NYSE" if actual_ticker.endswith(".N") else "NASD"
-                    pure_ticker = actual_ticker.split(".")[0]
-                else:
-                    # 기본값 NASDAQ으로 설정
-                    exchange_code = "NASD"
-                    pure_ticker = actual_ticker
+                # 거래소 코드 결정 (미국 주식 기준, 현재가 조회용 거래소 코드 포함)
+                exchange_code, pure_ticker, api_exchange_code = _buy_order_target(actual_ticker)
                 
                 # 이미 보유 중인 종목인지 확인 (옵션에 따라)
                 if not allow_buy_existing_stocks and pure_ticker in holding_tickers:
@@ -1817,10 +2036,13 @@ class StockScheduler:
                 elif allow_buy_existing_stocks and pure_ticker in holding_tickers:
                     logger.info(f"[{function_name}] ℹ️ {stock_name}({ticker}) - 이미 보유 중이지만 매수 허용 옵션이 활성화되어 있어 매수합니다.")
                 
-                # 거래소 코드 변환 (API 요청에 맞게 변환)
-                api_exchange_code = "NAS"
-                if exchange_code == "NYSE":
-                    api_exchange_code = "NYS"
+                # 포트폴리오 비중 체크 (현재 보유 비중이 이미 최대 비중 이상이면 현재가 조회 없이 건너뜀)
+                current_holding_value = holding_values.get(pure_ticker, 0.0)
+                current_weight = current_holding_value * weight_scale
+                if current_weight >= max_portfolio_weight:
+                    logger.warning(f"[{function_name}] ⏭️ {stock_name}({ticker}) - 현재 보유 비중({current_weight:.2f}%)이 이미 최대 비중({max_portfolio_weight}%)을 초과하여 매수하지 않습니다.")
+                    skipped_portfolio_weight += 1
+                    continue
                 
                 # 현재가 조회
                 price_params = {
@@ -1829,7 +2051,7 @@ class StockScheduler:
                     "SYMB": pure_ticker
                 }
                 
-                price_result = get_current_price(price_params)
+                price_result = await asyncio.to_thread(self._get_current_price_cached, price_params)
                 
                 if price_result.get("rt_cd") != "0":
                     error_msg = price_result.get('msg1', '알 수 없는 오류')
@@ -1838,7 +2060,7 @@ class StockScheduler:
                     continue
                 
                 # 현재가 추출
-                last_price = price_result.get("output", {}).get("last", 0) or 0
+                last_price = (price_result.get("output") or _EMPTY_OUTPUT).get("last", 0) or 0
                 try:
                     current_price = float(last_price)
                 except (ValueError, TypeError) as e:
@@ -1851,40 +2073,29 @@ class StockScheduler:
                     skipped_invalid_price += 1
                     continue
                 
-                # 포트폴리오 비중 체크
-                current_holding_value = holding_values.get(pure_ticker, 0.0)
-                current_weight = (current_holding_value / portfolio_total_value * 100) if portfolio_total_value > 0 else 0.0
-                
                 # 매수 예정 금액 (1주 기준)
                 buy_amount = current_price
                 new_total_value = portfolio_total_value + buy_amount
                 new_holding_value = current_holding_value + buy_amount
                 new_weight = (new_holding_value / new_total_value * 100) if new_total_value > 0 else 0.0
                 
-                # 최대 비중 초과 체크
+                # 최대 비중 초과 체크 (현재 비중은 최대 비중 미만이므로 초과하지 않도록 매수 금액 조정)
                 if new_weight > max_portfolio_weight:
-                    # 현재 보유 비중이 이미 최대 비중을 초과하는 경우
-                    if current_weight >= max_portfolio_weight:
-                        logger.warning(f"[{function_name}] ⏭️ {stock_name}({ticker}) - 현재 보유 비중({current_weight:.2f}%)이 이미 최대 비중({max_portfolio_weight}%)을 초과하여 매수하지 않습니다.")
+                    max_allowed_value = (new_total_value * max_portfolio_weight / 100) - current_holding_value
+                    if max_allowed_value <= 0:
+                        logger.warning(f"[{function_name}] ⏭️ {stock_name}({ticker}) - 최대 비중 제한으로 인해 추가 매수 불가. 현재 비중: {current_weight:.2f}%, 최대 비중: {max_portfolio_weight}%")
                         skipped_portfolio_weight += 1
                         continue
-                    else:
-                        # 최대 비중을 초과하지 않도록 매수 금액 조정
-                        max_allowed_value = (new_total_value * max_portfolio_weight / 100) - current_holding_value
-                        if max_allowed_value <= 0:
-                            logger.warning(f"[{function_name}] ⏭️ {stock_name}({ticker}) - 최대 비중 제한으로 인해 추가 매수 불가. 현재 비중: {current_weight:.2f}%, 최대 비중: {max_portfolio_weight}%")
-                            skipped_portfolio_weight += 1
-                            continue
-                        
-                        # 조정된 매수 금액으로 수량 재계산
-                        adjusted_quantity = max(1, int(max_allowed_value / current_price))
-                        buy_amount = adjusted_quantity * current_price
-                        new_holding_value = current_holding_value + buy_amount
-                        new_total_value = portfolio_total_value + buy_amount
-                        new_weight = (new_holding_value / new_total_value * 100) if new_total_value > 0 else 0.0
-                        
-                        logger.info(f"[{function_name}] ⚖️ {stock_name}({ticker}) - 포트폴리오 비중 제한 적용: 최대 비중({max_portfolio_weight}%)을 초과하지 않도록 매수 금액 조정")
-                        logger.info(f"[{function_name}]    현재 비중: {current_weight:.2f}% → 예상 비중: {new_weight:.2f}% (매수 금액: ${buy_amount:.2f})")
+                    
+                    # 조정된 매수 금액으로 수량 재계산
+                    adjusted_quantity = max(1, int(max_allowed_value / current_price))
+                    buy_amount = adjusted_quantity * current_price
+                    new_holding_value = current_holding_value + buy_amount
+                    new_total_value = portfolio_total_value + buy_amount
+                    new_weight = (new_holding_value / new_total_value * 100) if new_total_value > 0 else 0.0
+                    
+                    logger.info(f"[{function_name}] ⚖️ {stock_name}({ticker}) - 포트폴리오 비중 제한 적용: 최대 비중({max_portfolio_weight}%)을 초과하지 않도록 매수 금액 조정")
+                    logger.info(f"[{function_name}]    현재 비중: {current_weight:.2f}% → 예상 비중: {new_weight:.2f}% (매수 금액: ${buy_amount:.2f})")
                 
                 # 매수 가능 여부 확인 (조정된 금액 기준)
                 if available_cash < buy_amount:
@@ -1911,144 +2122,92 @@ class StockScheduler:
                     "stock_name": stock_name  # 종목명 추가
                 }
                 
-                logger.info(f"[{function_name}] 📤 {stock_name}({actual_ticker}) 매수 주문 실행: 수량 {quantity}주, 가격 ${current_price:.2f} (지정가)")
-                order_result = order_overseas_stock(order_data)
+                # 주문 대상에 추가하고 포트폴리오 가치와 잔고에 미리 반영 (다음 종목 비중/잔고 판단을 위해)
+                # 주문은 매수 판단이 모두 끝난 뒤 속도 제한 안에서 동시에 전송, 실패한 주문의 금액은 잔고에 되돌림
+                planned_orders.append({
+                    "candidate": candidate,
+                    "ticker": ticker,
+                    "stock_name": stock_name,
+                    "actual_ticker": actual_ticker,
+                    "pure_ticker": pure_ticker,
+                    "exchange_code": exchange_code,
+                    "quantity": quantity,
+                    "current_price": current_price,
+                    "order_data": order_data,
+                    "before_quantity": holding_quantities.get(pure_ticker, 0),  # 주문 접수 전 보유 수량 (체결 확인용)
+                })
+                planned_buy_amount = quantity * current_price
+                available_cash -= planned_buy_amount
+                portfolio_total_value += planned_buy_amount
+                weight_scale = 100.0 / portfolio_total_value
+                holding_values[pure_ticker] = holding_values.get(pure_ticker, 0.0) + planned_buy_amount
                 
-                # 주문 결과 상세 정보 추출
-                order_output = order_result.get("output", {})
-                order_no = order_output.get("ODNO", "N/A")  # 주문번호
-                order_gno_brno = order_output.get("KRX_FWDG_ORD_ORGNO", "")  # 주문점번호
-                order_tmd = order_output.get("ORD_TMD", "")  # 주문시각
-                order_msg = order_result.get('msg1', '주문이 접수되었습니다.')
-
-                # 주문일자 (오늘 날짜, YYYYMMDD 형식)
-                order_dt = datetime.now().strftime("%Y%m%d")
-
-                if order_result.get("rt_cd") == "0":
-                    logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 매수 주문 접수 성공: {order_msg}")
-                    logger.info(f"[{function_name}]    주문번호: {order_no}, 가격: ${current_price:.2f}, 수량: {quantity}주")
-
-                    # 주문 접수 성공 시 즉시 저장 (status: "accepted")
-                    save_success = self._save_trading_log(
-                        order_type="buy",
-                        ticker=ticker,  # 원본 티커 (표시용)
-                        stock_name=stock_name,
-                        price=current_price,
-                        quantity=quantity,
-                        status=OrderStatus.ACCEPTED.value,  # 주문 접수 상태
-                        composite_score=candidate.get("composite_score"),
-                        order_result=order_result,
-                        exchange_code=exchange_code,
-                        order_no=order_no if order_no and order_no != "N/A" else None,
-                        order_ticker=pure_ticker,  # 실제 주문에 사용된 티커 (체결 조회용)
-                        order_dt=order_dt,  # 주문일자 (체결 조회용)
-                        order_gno_brno=order_gno_brno if order_gno_brno else None,  # 주문점번호 (체결 조회용)
-                        order_tmd=order_tmd if order_tmd else None  # 주문시각
-                    )
-                    
-                    if save_success:
-                        logger.info(f"[{function_name}] 📝 {stock_name}({ticker}) 주문 접수 기록 저장 완료")
-                        
-                        # 주문번호가 유효한 경우 체결 확인 (백그라운드)
-                        if order_no and order_no != "N/A":
-                            logger.info(f"[{function_name}]    ⏳ 체결 여부 확인 중... (5초 후 확인)")
-                            
-                            # 비동기로 체결 확인 (다음 종목 매수를 막지 않음)
-                            # 주문 접수 전 보유 수량 전달 (체결 확인용)
-                            before_quantity = holding_quantities.get(pure_ticker, 0)
-                            task = asyncio.create_task(self._check_and_update_execution(
-                                order_no=order_no,
-                                ticker=ticker,
-                                stock_name=stock_name,
-                                function_name=function_name,
-                                before_quantity=before_quantity,
-                                order_quantity=quantity
-                            ))
-                            execution_tasks.append(task)
-                        else:
-                            logger.warning(f"[{function_name}] ⚠️ 주문번호를 확인할 수 없어 체결 확인을 건너뜁니다.")
-                    else:
-                        logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 주문 접수 기록 저장 실패")
-                    
+            except Exception as e:
+                logger.error(f"[{function_name}] ❌ {candidate['stock_name']}({candidate['ticker']}) 매수 처리 중 오류: {str(e)}", exc_info=True)
+                failed_orders += 1
+        
+        # 매수 주문 동시 전송 (속도 제한기가 진입 순서대로 통과시키므로 종합 점수 높은 종목이 먼저 전송됨)
+        if planned_orders:
+            # 주문은 수 초 안에 모두 전송되므로 주문일자는 전송 직전에 한 번만 계산
+            order_dt = datetime.now().strftime("%Y%m%d")
+            for order in planned_orders:
+                order["order_dt"] = order_dt
+            order_results = await asyncio.gather(
+                *(self._submit_buy_order(order, order_limiter, function_name, fill_check_holdings) for order in planned_orders),
+                return_exceptions=True
+            )
+            for order, result in zip(planned_orders, order_results):
+                if isinstance(result, Exception):
+                    logger.error(f"[{function_name}] ❌ {order['stock_name']}({order['ticker']}) 매수 주문 처리 중 오류: {str(result)}", exc_info=result)
+                    success, execution_task = False, None
+                else:
+                    success, execution_task = result
+                if success:
                     # 주문 접수 성공으로 카운트 (체결은 별도로 확인)
                     successful_purchases += 1
-                    
-                    # 포트폴리오 총 가치 업데이트 (다음 종목 비중 계산을 위해)
-                    actual_buy_amount = quantity * current_price
-                    portfolio_total_value += actual_buy_amount
-                    holding_values[pure_ticker] = holding_values.get(pure_ticker, 0.0) + actual_buy_amount
                 else:
-                    error_msg = order_result.get('msg1', '알 수 없는 오류')
-                    error_code = order_result.get('msg_cd', 'N/A')
-                    logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 매수 주문 실패: {error_msg} (오류코드: {error_code})")
-                    
-                    # 주문 실패 시 Slack 알림 전송
-                    slack_notifier.send_buy_notification(
-                        stock_name=stock_name,
-                        ticker=ticker,
-                        quantity=quantity,
-                        price=current_price,
-                        exchange_code=exchange_code,
-                        success=False,
-                        error_message=f"{error_msg} (오류코드: {error_code})"
-                    )
-                    logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 주문 실패 Slack 알림 전송 완료")
-                    
                     failed_orders += 1
-                
-                # 요청 간 지연 (API 요청 제한 방지 및 다음 종목 조회 전 텀 확보)
-                await asyncio.sleep(3)
-                
-            except Exception as e:
-                logger.error(f"[{function_name}] ❌ {candidate['stock_name']}({candidate['ticker']}) 매수 처리 중 오류: {str(e)}", exc_info=True)
-                failed_orders += 1
+                    available_cash += order["quantity"] * order["current_price"]
+                if execution_task is not None:
+                    execution_tasks.append(execution_task)
+        
+        executed_count = 0  # 체결 완료된 종목 수
         
         # 체결 확인 태스크들이 모두 완료될 때까지 대기
+        # 각 태스크는 주문 시점부터 EXECUTION_CHECK_TIMEOUT_SECONDS 안에 끝나거나 취소되므로 전체 대기에는 제한 시간을 두지 않음
         if execution_tasks:
-            logger.info(f"[{function_name}] ⏳ 체결 확인 완료를 기다리는 중... (최대 60초, {len(execution_tasks)}개 주문)")
-            try:
-                # 모든 체결 확인 태스크가 완료될 때까지 대기
-                await asyncio.wait_for(
-                    asyncio.gather(*execution_tasks, return_exceptions=True),
-                    timeout=SchedulerConfig.EXECUTION_CHECK_TIMEOUT_SECONDS
-                )
+            logger.info(f"[{function_name}] ⏳ 체결 확인 완료를 기다리는 중... (주문별 최대 {SchedulerConfig.EXECUTION_CHECK_TIMEOUT_SECONDS}초, {len(execution_tasks)}개 주문)")
+            execution_results = await asyncio.gather(*execution_tasks, return_exceptions=True)
+            # 체결 완료 종목 수는 각 체결 확인 결과로 집계 (별도 DB 조회 없음)
+            executed_count = sum(1 for result in execution_results if result is True)
+            timed_out = sum(1 for result in execution_results if isinstance(result, asyncio.TimeoutError))
+            if timed_out:
+                logger.warning(f"[{function_name}] ⚠️ 체결 확인 대기 시간 초과 {timed_out}건 ({SchedulerConfig.EXECUTION_CHECK_TIMEOUT_SECONDS}초), 해당 주문의 체결 확인이 완료되지 않았을 수 있습니다.")
+            else:
                 logger.info(f"[{function_name}] ✅ 모든 체결 확인 완료")
-            except asyncio.TimeoutError:
-                logger.warning(f"[{function_name}] ⚠️ 체결 확인 대기 시간 초과 ({SchedulerConfig.EXECUTION_CHECK_TIMEOUT_SECONDS}초), 일부 체결 확인이 완료되지 않았을 수 있습니다.")
-        
-        # 체결 완료된 종목 수 확인
-        executed_count = 0
-        if execution_tasks:
-            try:
-                db = get_db()
-                if db is not None:
-                    # 최근 5분 이내에 체결 완료된 매수 주문 수 확인
-                    five_minutes_ago = datetime.now() - timedelta(minutes=5)
-                    executed_count = db.trading_logs.count_documents({
-                        "order_type": "buy",
-                        "status": "executed",
-                        "created_at": {"$gte": five_minutes_ago}
-                    })
-            except Exception as e:
-                logger.warning(f"[{function_name}] 체결 완료 종목 수 확인 중 오류: {str(e)}")
         
         # 매수 작업 요약 정보 로깅 (체결 확인 완료 후)
         total_candidates = len(buy_candidates)
-        logger.info("=" * 80)
-        logger.info(f"[{function_name}] 📊 매수 작업 요약")
-        logger.info(f"  총 추천 종목: {total_candidates}개")
-        logger.info(f"  ✅ 주문 접수 성공: {successful_purchases}개")
+        summary_lines = [
+            _SUMMARY_BANNER,
+            f"[{function_name}] 📊 매수 작업 요약",
+            f"  총 추천 종목: {total_candidates}개",
+            f"  ✅ 주문 접수 성공: {successful_purchases}개",
+        ]
         if executed_count > 0:
-            logger.info(f"  ✅ 체결 완료: {executed_count}개")
-        logger.info(f"  ❌ 주문 실패: {failed_orders}개")
-        logger.info(f"  ⏭️  건너뛴 종목: {total_candidates - successful_purchases - failed_orders}개")
-        logger.info(f"    - 이미 보유 중: {skipped_already_holding}개")
-        logger.info(f"    - 현재가 조회 실패: {skipped_price_fetch_failed}개")
-        logger.info(f"    - 유효하지 않은 가격: {skipped_invalid_price}개")
-        logger.info(f"    - 잔고 부족: {skipped_no_cash}개")
-        logger.info(f"    - 포트폴리오 비중 초과: {skipped_portfolio_weight}개")
-        logger.info(f"  💰 남은 잔고: ${available_cash:,.2f}")
-        logger.info("=" * 80)
+            summary_lines.append(f"  ✅ 체결 완료: {executed_count}개")
+        summary_lines.extend([
+            f"  ❌ 주문 실패: {failed_orders}개",
+            f"  ⏭️  건너뛴 종목: {total_candidates - successful_purchases - failed_orders}개",
+            f"    - 이미 보유 중: {skipped_already_holding}개",
+            f"    - 현재가 조회 실패: {skipped_price_fetch_failed}개",
+            f"    - 유효하지 않은 가격: {skipped_invalid_price}개",
+            f"    - 잔고 부족: {skipped_no_cash}개",
+            f"    - 포트폴리오 비중 초과: {skipped_portfolio_weight}개",
+            f"  💰 남은 잔고: ${available_cash:,.2f}",
+            _SUMMARY_BANNER,
+        ])
+        logger.info("\n".join(summary_lines))
         
         # Slack 알림 전송 (요약 정보)
         if send_slack_notification:
@@ -2072,7 +2231,7 @@ class StockScheduler:
                 if skipped_portfolio_weight > 0:
                     summary_msg += f"  - 포트폴리오 비중 초과: {skipped_portfolio_weight}개\n"
             summary_msg += f"• 남은 잔고: ${available_cash:,.2f}"
-            send_scheduler_slack_notification(summary_msg)
+            await _notify_slack(summary_msg)
     
     async def _check_and_update_execution(
         self,
@@ -2081,7 +2240,8 @@ class StockScheduler:
         stock_name: str,
         function_name: str = "_execute_auto_buy",
         before_quantity: int = 0,
-        order_quantity: int = 0
+        order_quantity: int = 0,
+        fill_check_holdings: Optional[_FillCheckHoldings] = None
     ):
         """
         주문 체결 여부를 확인하고, 상태를 업데이트
@@ -2093,6 +2253,10 @@ class StockScheduler:
             function_name: 함수명 (로깅용)
             before_quantity: 주문 접수 전 보유 수량
             order_quantity: 주문 수량
+            fill_check_holdings: 같은 매수 실행의 체결 확인과 공유하는 잔고 스냅샷 (없으면 이 확인에서만 사용)
+        
+        Returns:
+            bool: 이번 확인으로 체결 완료 상태로 업데이트했으면 True
         """
         try:
             # 체결 확인 대기 (주문 접수 후 체결까지 시간 필요)
@@ -2104,7 +2268,7 @@ class StockScheduler:
             db = get_db()
             if db is None:
                 logger.error(f"[{function_name}] ❌ MongoDB 연결 실패 - 체결 상태 업데이트 불가")
-                return
+                return False
             
             # 주문번호로 기록 찾기 (최근 것부터) - 매수/매도 모두 처리
             log_record = db.trading_logs.find_one(
@@ -2120,7 +2284,7 @@ class StockScheduler:
             
             if not log_record:
                 logger.warning(f"[{function_name}] ⚠️ 주문번호 {order_no}에 해당하는 기록을 찾을 수 없습니다.")
-                return
+                return False
             
             # 거래소 코드 및 주문 정보 가져오기
             exchange_code = log_record.get("exchange_code", "NASD")
@@ -2129,7 +2293,8 @@ class StockScheduler:
             order_gno_brno = log_record.get("order_gno_brno")  # 주문점번호
 
             # 체결 여부 확인 (order_ticker 사용)
-            execution_result = check_order_execution(
+            execution_result = await asyncio.to_thread(
+                check_order_execution,
                 order_no=order_no,
                 exchange_code=exchange_code,
                 ticker=order_ticker,  # 실제 주문 티커로 조회
@@ -2147,129 +2312,134 @@ class StockScheduler:
                 try:
                     # 주문 접수 전 보유 수량 확인 (이미 알고 있는 값 사용)
                     # 주문 접수 후 일정 시간(10초) 대기 후 잔고 확인
-                    await asyncio.sleep(10)
+                    # 대기가 끝날 무렵 이후에 조회된 잔고는 동시에 진행 중인 다른 체결 확인과 공유
+                    not_before = time.monotonic() + SchedulerConfig.EXECUTION_FALLBACK_WAIT_SECONDS - SchedulerConfig.EXECUTION_FALLBACK_SHARE_SECONDS
+                    await asyncio.sleep(SchedulerConfig.EXECUTION_FALLBACK_WAIT_SECONDS)
                     
-                    balance_result = get_all_overseas_balances()
-                    if balance_result.get("rt_cd") == "0":
-                        holdings = balance_result.get("output1", [])
-                        for item in holdings:
-                            if item.get("ovrs_pdno") == order_ticker:  # 실제 주문 티커로 잔고 확인
-                                # 해당 종목을 보유하고 있으면 체결된 것으로 간주
-                                # 현재 보유 수량
-                                current_qty = int(item.get("ovrs_cblc_qty", 0))
+                    if fill_check_holdings is None:
+                        fill_check_holdings = _FillCheckHoldings()
+                    holdings = await fill_check_holdings.get(not_before)
+                    if holdings is not None:
+                        item = holdings.get(order_ticker)  # 실제 주문 티커로 잔고 확인
+                        if item:
+                            # 해당 종목을 보유하고 있으면 체결된 것으로 간주
+                            # 현재 보유 수량
+                            current_qty = int(item.get("ovrs_cblc_qty", 0))
                                 
-                                # 주문 접수 전 보유 수량과 비교하여 증가했는지 확인
-                                if current_qty > before_quantity:
-                                    # 보유 수량이 증가했으면 체결된 것으로 간주
-                                    executed_qty = current_qty - before_quantity
-                                    logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 잔고 조회로 체결 확인: 보유 수량 증가 ({before_quantity}주 → {current_qty}주, 체결: {executed_qty}주)")
+                            # 주문 접수 전 보유 수량과 비교하여 증가했는지 확인
+                            if current_qty > before_quantity:
+                                # 보유 수량이 증가했으면 체결된 것으로 간주
+                                executed_qty = current_qty - before_quantity
+                                logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 잔고 조회로 체결 확인: 보유 수량 증가 ({before_quantity}주 → {current_qty}주, 체결: {executed_qty}주)")
                                     
-                                    # 상태 업데이트 (executed) - 잔고 조회로 확인한 경우
-                                    update_result = db.trading_logs.update_one(
-                                        {"_id": log_record["_id"]},
-                                        {
-                                            "$set": {
-                                                "status": "executed",
-                                                "quantity": executed_qty,
-                                                "executed_at": datetime.now(),
-                                                "execution_check_method": "balance_check",  # 체결 확인 방법 기록
-                                                "execution_result": {
-                                                    "method": "balance_check",
-                                                    "before_quantity": before_quantity,
-                                                    "current_quantity": current_qty,
-                                                    "executed_quantity": executed_qty
-                                                }
+                                # 상태 업데이트 (executed) - 잔고 조회로 확인한 경우
+                                update_result = db.trading_logs.update_one(
+                                    {"_id": log_record["_id"]},
+                                    {
+                                        "$set": {
+                                            "status": "executed",
+                                            "quantity": executed_qty,
+                                            "executed_at": datetime.now(),
+                                            "execution_check_method": "balance_check",  # 체결 확인 방법 기록
+                                            "execution_result": {
+                                                "method": "balance_check",
+                                                "before_quantity": before_quantity,
+                                                "current_quantity": current_qty,
+                                                "executed_quantity": executed_qty
                                             }
                                         }
-                                    )
+                                    }
+                                )
                                     
-                                    if update_result.modified_count > 0:
-                                        logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 체결 상태 업데이트 완료 (잔고 조회)")
+                                if update_result.modified_count > 0:
+                                    logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 체결 상태 업데이트 완료 (잔고 조회)")
                                         
-                                        # 트레일링 스톱 초기화 (체결 완료 시)
-                                        self._initialize_trailing_stop_after_buy(
-                                            ticker=order_ticker,  # 실제 주문 티커 사용
-                                            stock_name=stock_name,
-                                            purchase_price=log_record.get("price", 0),
-                                            function_name=function_name
-                                        )
+                                    # 트레일링 스톱 초기화 (체결 완료 시)
+                                    self._initialize_trailing_stop_after_buy(
+                                        ticker=order_ticker,  # 실제 주문 티커 사용
+                                        stock_name=stock_name,
+                                        purchase_price=log_record.get("price", 0),
+                                        function_name=function_name
+                                    )
                                         
-                                        # 부분 익절 히스토리 초기화 (체결 완료 시)
-                                        self._initialize_partial_profit_history_after_buy(
-                                            ticker=order_ticker,  # 실제 주문 티커 사용
-                                            stock_name=stock_name,
-                                            purchase_price=log_record.get("price", 0),
-                                            initial_quantity=current_qty,  # 체결 후 현재 보유 수량
-                                            function_name=function_name
-                                        )
+                                    # 부분 익절 히스토리 초기화 (체결 완료 시)
+                                    self._initialize_partial_profit_history_after_buy(
+                                        ticker=order_ticker,  # 실제 주문 티커 사용
+                                        stock_name=stock_name,
+                                        purchase_price=log_record.get("price", 0),
+                                        initial_quantity=current_qty,  # 체결 후 현재 보유 수량
+                                        function_name=function_name
+                                    )
                                         
-                                        # Slack 알림 전송 (체결 완료)
-                                        slack_notifier.send_buy_notification(
-                                            stock_name=stock_name,
-                                            ticker=ticker,
-                                            quantity=executed_qty,
-                                            price=log_record.get("price", 0),
-                                            exchange_code=exchange_code,
-                                            success=True
-                                        )
-                                        logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 체결 완료 Slack 알림 전송 완료")
-                                        return
-                                elif current_qty == before_quantity and current_qty > 0:
-                                    # 보유 수량이 같지만 이미 보유 중이었던 경우 (추가 매수)
-                                    # 주문 수량만큼 체결된 것으로 간주
-                                    logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 잔고 조회로 체결 확인: 이미 보유 중이었으나 추가 매수로 간주 (체결: {order_quantity}주)")
+                                    # Slack 알림 전송 (체결 완료)
+                                    await asyncio.to_thread(
+                                        slack_notifier.send_buy_notification,
+                                        stock_name=stock_name,
+                                        ticker=ticker,
+                                        quantity=executed_qty,
+                                        price=log_record.get("price", 0),
+                                        exchange_code=exchange_code,
+                                        success=True
+                                    )
+                                    logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 체결 완료 Slack 알림 전송 완료")
+                                    return True
+                            elif current_qty == before_quantity and current_qty > 0:
+                                # 보유 수량이 같지만 이미 보유 중이었던 경우 (추가 매수)
+                                # 주문 수량만큼 체결된 것으로 간주
+                                logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 잔고 조회로 체결 확인: 이미 보유 중이었으나 추가 매수로 간주 (체결: {order_quantity}주)")
                                     
-                                    # 상태 업데이트 (executed) - 잔고 조회로 확인한 경우 (추가 매수로 간주)
-                                    update_result = db.trading_logs.update_one(
-                                        {"_id": log_record["_id"]},
-                                        {
-                                            "$set": {
-                                                "status": "executed",
-                                                "quantity": order_quantity,
-                                                "executed_at": datetime.now(),
-                                                "execution_check_method": "balance_check_assumed",  # 체결 확인 방법 기록
-                                                "execution_result": {
-                                                    "method": "balance_check_assumed",
-                                                    "before_quantity": before_quantity,
-                                                    "current_quantity": current_qty,
-                                                    "executed_quantity": order_quantity,
-                                                    "note": "이미 보유 중이었으나 추가 매수로 간주"
-                                                }
+                                # 상태 업데이트 (executed) - 잔고 조회로 확인한 경우 (추가 매수로 간주)
+                                update_result = db.trading_logs.update_one(
+                                    {"_id": log_record["_id"]},
+                                    {
+                                        "$set": {
+                                            "status": "executed",
+                                            "quantity": order_quantity,
+                                            "executed_at": datetime.now(),
+                                            "execution_check_method": "balance_check_assumed",  # 체결 확인 방법 기록
+                                            "execution_result": {
+                                                "method": "balance_check_assumed",
+                                                "before_quantity": before_quantity,
+                                                "current_quantity": current_qty,
+                                                "executed_quantity": order_quantity,
+                                                "note": "이미 보유 중이었으나 추가 매수로 간주"
                                             }
                                         }
-                                    )
+                                    }
+                                )
                                     
-                                    if update_result.modified_count > 0:
-                                        logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 체결 상태 업데이트 완료 (잔고 조회, 추가 매수로 간주)")
+                                if update_result.modified_count > 0:
+                                    logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 체결 상태 업데이트 완료 (잔고 조회, 추가 매수로 간주)")
                                         
-                                        # 트레일링 스톱 초기화 (체결 완료 시)
-                                        self._initialize_trailing_stop_after_buy(
-                                            ticker=order_ticker,  # 실제 주문 티커 사용
-                                            stock_name=stock_name,
-                                            purchase_price=log_record.get("price", 0),
-                                            function_name=function_name
-                                        )
+                                    # 트레일링 스톱 초기화 (체결 완료 시)
+                                    self._initialize_trailing_stop_after_buy(
+                                        ticker=order_ticker,  # 실제 주문 티커 사용
+                                        stock_name=stock_name,
+                                        purchase_price=log_record.get("price", 0),
+                                        function_name=function_name
+                                    )
                                         
-                                        # 부분 익절 히스토리 초기화 (체결 완료 시)
-                                        self._initialize_partial_profit_history_after_buy(
-                                            ticker=order_ticker,  # 실제 주문 티커 사용
-                                            stock_name=stock_name,
-                                            purchase_price=log_record.get("price", 0),
-                                            initial_quantity=current_qty,  # 체결 후 현재 보유 수량
-                                            function_name=function_name
-                                        )
+                                    # 부분 익절 히스토리 초기화 (체결 완료 시)
+                                    self._initialize_partial_profit_history_after_buy(
+                                        ticker=order_ticker,  # 실제 주문 티커 사용
+                                        stock_name=stock_name,
+                                        purchase_price=log_record.get("price", 0),
+                                        initial_quantity=current_qty,  # 체결 후 현재 보유 수량
+                                        function_name=function_name
+                                    )
                                         
-                                        # Slack 알림 전송 (체결 완료)
-                                        slack_notifier.send_buy_notification(
-                                            stock_name=stock_name,
-                                            ticker=ticker,
-                                            quantity=order_quantity,
-                                            price=log_record.get("price", 0),
-                                            exchange_code=exchange_code,
-                                            success=True
-                                        )
-                                        logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 체결 완료 Slack 알림 전송 완료")
-                                        return
+                                    # Slack 알림 전송 (체결 완료)
+                                    await asyncio.to_thread(
+                                        slack_notifier.send_buy_notification,
+                                        stock_name=stock_name,
+                                        ticker=ticker,
+                                        quantity=order_quantity,
+                                        price=log_record.get("price", 0),
+                                        exchange_code=exchange_code,
+                                        success=True
+                                    )
+                                    logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 체결 완료 Slack 알림 전송 완료")
+                                    return True
                     
                     # 잔고에 없거나 증가하지 않았으면 미체결로 간주
                     logger.warning(f"[{function_name}] ⏳ {stock_name}({ticker}) 잔고에 변화가 없어 미체결로 간주 (이전: {before_quantity}주)")
@@ -2278,7 +2448,8 @@ class StockScheduler:
                     logger.error(f"[{function_name}] ❌ 잔고 조회 중 오류: {str(e)}")
                 
                 # 체결 확인 실패 시 상태는 "accepted"로 유지하고 실패 알림 전송
-                slack_notifier.send_buy_notification(
+                await asyncio.to_thread(
+                    slack_notifier.send_buy_notification,
                     stock_name=stock_name,
                     ticker=ticker,
                     quantity=log_record.get("quantity", 0),
@@ -2288,7 +2459,7 @@ class StockScheduler:
                     error_message="체결 확인 실패 (주문 조회 불가, 잔고 확인도 실패)"
                 )
                 logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 체결 확인 실패 Slack 알림 전송 완료")
-                return
+                return False
             
             if execution_result.get("executed"):
                 # 체결 성공
@@ -2323,9 +2494,8 @@ class StockScheduler:
                     # 매도 체결 시 종목별 실현 수익률 업데이트
                     if order_type == "sell":
                         try:
-                            from app.utils.user_context import get_current_user_id
                             user_id = log_record.get("user_id") or get_current_user_id()
-                            update_result_profit = update_ticker_realized_profit(user_id=user_id, ticker=ticker)
+                            update_result_profit = await asyncio.to_thread(update_ticker_realized_profit, user_id=user_id, ticker=ticker)
                             if update_result_profit.get("success"):
                                 profit_percent = update_result_profit.get("realized_profit_percent", 0.0)
                                 logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 종목별 실현 수익률 업데이트 완료: {profit_percent:.2f}%")
@@ -2345,16 +2515,14 @@ class StockScheduler:
                         # 부분 익절 히스토리 초기화 (매수 체결 시)
                         # 현재 보유 수량 조회
                         try:
-                            from app.services.balance_service import get_overseas_balance
-                            balance_result = get_overseas_balance()
+                            balance_result = await asyncio.to_thread(get_overseas_balance)
                             current_qty = executed_qty  # 기본값은 체결 수량
                             
                             if balance_result.get("rt_cd") == "0":
-                                holdings = balance_result.get("output1", [])
-                                for item in holdings:
-                                    if item.get("ovrs_pdno") == ticker or item.get("ovrs_pdno") == order_ticker:
-                                        current_qty = int(item.get("ovrs_cblc_qty", executed_qty))
-                                        break
+                                holdings = _index_holdings(balance_result.get("output1", []))
+                                item = holdings.get(order_ticker) or holdings.get(ticker)
+                                if item:
+                                    current_qty = int(item.get("ovrs_cblc_qty", executed_qty))
                             
                             self._initialize_partial_profit_history_after_buy(
                                 ticker=order_ticker,  # 실제 주문 티커 사용
@@ -2368,7 +2536,8 @@ class StockScheduler:
                     
                     # Slack 알림 전송 (체결 완료)
                     if order_type == "sell":
-                        slack_notifier.send_sell_notification(
+                        await asyncio.to_thread(
+                            slack_notifier.send_sell_notification,
                             stock_name=stock_name,
                             ticker=ticker,
                             quantity=executed_qty,
@@ -2377,7 +2546,8 @@ class StockScheduler:
                             success=True
                         )
                     else:
-                        slack_notifier.send_buy_notification(
+                        await asyncio.to_thread(
+                            slack_notifier.send_buy_notification,
                             stock_name=stock_name,
                             ticker=ticker,
                             quantity=executed_qty,
@@ -2386,6 +2556,7 @@ class StockScheduler:
                             success=True
                         )
                     logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 체결 완료 Slack 알림 전송 완료")
+                    return True
                 else:
                     logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 체결 상태 업데이트 실패")
             else:
@@ -2412,7 +2583,8 @@ class StockScheduler:
                     logger.info(f"[{function_name}] 📝 {stock_name}({ticker}) 미체결 상태 업데이트 완료")
                     
                     # 미체결 알림 전송 (실패로 처리)
-                    slack_notifier.send_buy_notification(
+                    await asyncio.to_thread(
+                        slack_notifier.send_buy_notification,
                         stock_name=stock_name,
                         ticker=ticker,
                         quantity=log_record.get("quantity", 0),
@@ -2425,20 +2597,19 @@ class StockScheduler:
                 
         except Exception as e:
             logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 체결 확인 중 오류: {str(e)}", exc_info=True)
+        return False
     
     def _cleanup_pending_orders(self, send_slack_notification: bool = True):
         """장 마감 후 어제 주문한 주식 체결 확인 및 미체결 주문 재주문"""
         function_name = "_cleanup_pending_orders"
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        logger.info(f"[{function_name}] 함수 실행 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} KST)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[{function_name}] 함수 실행 시작 ({_time_diagnostics()})")
         
         try:
             # 현재 시간 확인 (뉴욕 시간 기준)
-            now_in_ny = datetime.now(pytz.timezone('America/New_York'))
-            now_in_korea = datetime.now(pytz.timezone('Asia/Seoul'))
+            now_in_ny = datetime.now(NEW_YORK_TZ)
+            now_in_korea = datetime.now(KST)
             ny_hour = now_in_ny.hour
             ny_weekday = now_in_ny.weekday()
             
@@ -2635,7 +2806,7 @@ class StockScheduler:
                                 "EXCD": exchange_code,
                                 "SYMB": order_ticker
                             }
-                            current_price_result = get_current_price(current_price_params)
+                            current_price_result = self._get_current_price_cached(current_price_params)
                             
                             if current_price_result.get("rt_cd") != "0":
                                 error_msg = current_price_result.get("msg1", "현재가 조회 실패")
@@ -2650,7 +2821,7 @@ class StockScheduler:
                                 })
                                 continue
                             
-                            output = current_price_result.get("output", {})
+                            output = current_price_result.get("output") or _EMPTY_OUTPUT
                             current_price = float(output.get("last", "0") or "0")
                             
                             if current_price <= 0:
@@ -2705,7 +2876,8 @@ class StockScheduler:
                                 
                                 logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 재주문 성공! (주문번호: {new_order_no})")
                                 
-                                # 새 주문 레코드 저장
+                                # 새 주문 레코드 저장 (재주문 시각은 한 번만 조회하여 새 기록과 기존 기록에 함께 사용)
+                                retried_at = datetime.now()
                                 new_order_log = {
                                     "order_type": "buy",
                                     "ticker": ticker,
@@ -2720,8 +2892,8 @@ class StockScheduler:
                                     "order_gno_brno": output.get("ORD_GNO_BRNO", ""),
                                     "original_order_id": str(order["_id"]),
                                     "retry_count": retry_count + 1,
-                                    "retry_at": datetime.now(),
-                                    "created_at": datetime.now()
+                                    "retry_at": retried_at,
+                                    "created_at": retried_at
                                 }
                                 db.trading_logs.insert_one(new_order_log)
                                 
@@ -2731,7 +2903,7 @@ class StockScheduler:
                                     {
                                         "$set": {
                                             "status": OrderStatus.RETRY.value,
-                                            "retry_at": datetime.now(),
+                                            "retry_at": retried_at,
                                             "retry_count": retry_count + 1,
                                             "retry_order_id": str(new_order_log.get("_id", ""))
                                         }
@@ -2795,14 +2967,16 @@ class StockScheduler:
                     logger.error(f"[{function_name}] ❌ 주문 {order.get('_id')} 처리 중 오류: {str(e)}", exc_info=True)
             
             # 요약 로깅
-            logger.info("=" * 80)
-            logger.info(f"[{function_name}] 📊 어제 주문 체결 확인 및 재주문 요약")
-            logger.info(f"  어제 주문 수: {len(yesterday_orders)}개")
-            logger.info(f"  ✅ 체결 완료: {executed_count}개")
-            logger.info(f"  ⚠️ 미체결 주문: {pending_count}개")
-            logger.info(f"    - 재주문 성공: {retry_success_count}개")
-            logger.info(f"    - 재주문 실패: {retry_failed_count}개")
-            logger.info("=" * 80)
+            logger.info(
+                "%s\n[%s] 📊 어제 주문 체결 확인 및 재주문 요약\n"
+                "  어제 주문 수: %d개\n"
+                "  ✅ 체결 완료: %d개\n"
+                "  ⚠️ 미체결 주문: %d개\n"
+                "    - 재주문 성공: %d개\n"
+                "    - 재주문 실패: %d개\n%s",
+                _SUMMARY_BANNER, function_name, len(yesterday_orders), executed_count,
+                pending_count, retry_success_count, retry_failed_count, _SUMMARY_BANNER,
+            )
             
             # 요약 Slack 알림
             if send_slack_notification:
@@ -2840,10 +3014,8 @@ class StockScheduler:
         """계좌 수익율 리포트 전송"""
         function_name = "_run_portfolio_profit_report"
         # 시간 진단 로깅
-        korea_tz = pytz.timezone('Asia/Seoul')
-        now_korea = datetime.now(korea_tz)
-        now_local = datetime.now()
-        logger.info(f"[{function_name}] 함수 실행 시작 (시스템 시간: {now_local.strftime('%Y-%m-%d %H:%M:%S')}, 한국 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} KST)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[{function_name}] 함수 실행 시작 ({_time_diagnostics()})")
         
         if send_slack_notification:
             send_scheduler_slack_notification(f"📊 *계좌 수익율 리포트 생성 중*\n계좌 잔고를 조회하고 수익율을 계산합니다.")
@@ -2872,7 +3044,6 @@ class StockScheduler:
             logger.info(f"  - 총 수익: ${total_profit:+,.2f} ({total_profit_percent:+.2f}%)")
             
             # 추가 수익률 및 계좌 정보 조회
-            from app.utils.user_context import get_current_user_id
             user_id = get_current_user_id()
             account_info = {}
             total_return_info = {}
@@ -2935,7 +3106,7 @@ class StockScheduler:
                 # 계좌 정보 조회 (MongoDB에서)
                 db = get_db()
                 if db is not None:
-                    user = db.users.find_one({"user_id": user_id})
+                    user = db.users.find_one({"user_id": user_id}, {"_id": 0, "account_balance": 1})
                     if user and "account_balance" in user:
                         balance = user["account_balance"]
                         account_info = {
@@ -2973,7 +3144,7 @@ class StockScheduler:
         except Exception as e:
             logger.error(f"[{function_name}] ❌ 계좌 수익율 리포트 중 오류 발생: {str(e)}", exc_info=True)
             if send_slack_notification:
-                send_scheduler_slack_notification(f"❌ *계좌 수익율 리포트 오류*\n오류 발생: {str(e)}")
+                send_scheduler_slack_notification(SLACK_TASK_ERROR.format(title="계좌 수익율 리포트", error=e))
             return False
         
     def _initialize_trailing_stop_after_buy(
@@ -2993,11 +3164,9 @@ class StockScheduler:
             function_name: 함수명 (로깅용)
         """
         try:
-            from app.utils.user_context import get_current_user_id
             user_id = get_current_user_id()
             
-            from app.services.trailing_stop_service import TrailingStopService
-            trailing_stop_service = TrailingStopService(user_id=user_id)
+            trailing_stop_service = self._get_trailing_stop_service(user_id)
             
             # 설정 확인
             config = self.auto_trading_service.get_auto_trading_config(user_id=user_id)
@@ -3011,7 +3180,7 @@ class StockScheduler:
             if db is not None:
                 try:
                     # MongoDB에서 레버리지 티커인지 확인
-                    base_stock = db.stocks.find_one({"leverage_ticker": ticker})
+                    base_stock = db.stocks.find_one({"leverage_ticker": ticker}, {"_id": 1})
                     if base_stock:
                         is_leveraged = True
                         logger.debug(f"[{function_name}] {stock_name}({ticker})는 레버리지 티커로 확인됨")
@@ -3058,14 +3227,13 @@ class StockScheduler:
             function_name: 함수명 (로깅용)
         """
         try:
-            from app.db.mongodb import get_db
             db = get_db()
             if db is None:
                 logger.warning(f"[{function_name}] MongoDB 연결 실패 - 부분 익절 히스토리 초기화 불가")
                 return
             
-            from app.utils.user_context import get_current_user_id
             user_id = get_current_user_id()
+            recorded_at = datetime.utcnow()  # 기록 시각은 한 번만 조회하여 모든 필드에 사용
             
             # 이미 히스토리가 있는지 확인
             existing_history = db.partial_sell_history.find_one({
@@ -3083,7 +3251,7 @@ class StockScheduler:
                             "$set": {
                                 "initial_quantity": initial_quantity,
                                 "purchase_price": purchase_price,
-                                "last_updated": datetime.utcnow()
+                                "last_updated": recorded_at
                             }
                         }
                     )
@@ -3098,8 +3266,8 @@ class StockScheduler:
                     "initial_quantity": initial_quantity,
                     "partial_sells": [],
                     "is_completed": False,
-                    "last_updated": datetime.utcnow(),
-                    "created_at": datetime.utcnow()
+                    "last_updated": recorded_at,
+                    "created_at": recorded_at
                 }
                 
                 db.partial_sell_history.insert_one(new_history)
@@ -3108,6 +3276,184 @@ class StockScheduler:
         except Exception as e:
             logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 부분 익절 히스토리 초기화 중 오류: {str(e)}", exc_info=True)
     
+    async def _submit_buy_order(self, order: dict, limiter: _AsyncRateLimiter, function_name: str, fill_check_holdings: Optional[_FillCheckHoldings] = None) -> Tuple[bool, Optional[asyncio.Task]]:
+        """
+        매수 판단을 통과한 주문 1건 전송 및 결과 처리 (접수 기록 저장, 체결 확인 태스크 생성, 실패 알림)
+        
+        Returns:
+            (주문 접수 성공 여부, 체결 확인 태스크 또는 None)
+        """
+        candidate = order["candidate"]
+        ticker = order["ticker"]
+        stock_name = order["stock_name"]
+        pure_ticker = order["pure_ticker"]
+        exchange_code = order["exchange_code"]
+        quantity = order["quantity"]
+        current_price = order["current_price"]
+        
+        logger.info(f"[{function_name}] 📤 {stock_name}({order['actual_ticker']}) 매수 주문 실행: 수량 {quantity}주, 가격 ${current_price:.2f} (지정가)")
+        order_result = await self._place_order_rate_limited(order["order_data"], limiter)
+        
+        # 주문 결과 상세 정보 추출
+        order_output = order_result.get("output", {})
+        order_no = order_output.get("ODNO", "N/A")  # 주문번호
+        order_gno_brno = order_output.get("KRX_FWDG_ORD_ORGNO", "")  # 주문점번호
+        order_tmd = order_output.get("ORD_TMD", "")  # 주문시각
+        order_msg = order_result.get('msg1', '주문이 접수되었습니다.')
+
+        # 주문일자 (YYYYMMDD 형식, 주문 전송 시작 시점에 실행당 한 번 계산)
+        order_dt = order["order_dt"]
+
+        if order_result.get("rt_cd") == "0":
+            logger.info(f"[{function_name}] ✅ {stock_name}({ticker}) 매수 주문 접수 성공: {order_msg}")
+            logger.info(f"[{function_name}]    주문번호: {order_no}, 가격: ${current_price:.2f}, 수량: {quantity}주")
+
+            # 주문 접수 성공 시 즉시 저장 (status: "accepted")
+            save_success = await asyncio.to_thread(
+                self._save_trading_log,
+                order_type="buy",
+                ticker=ticker,  # 원본 티커 (표시용)
+                stock_name=stock_name,
+                price=current_price,
+                quantity=quantity,
+                status=OrderStatus.ACCEPTED.value,  # 주문 접수 상태
+                composite_score=candidate.get("composite_score"),
+                order_result=order_result,
+                exchange_code=exchange_code,
+                order_no=order_no if order_no and order_no != "N/A" else None,
+                order_ticker=pure_ticker,  # 실제 주문에 사용된 티커 (체결 조회용)
+                order_dt=order_dt,  # 주문일자 (체결 조회용)
+                order_gno_brno=order_gno_brno if order_gno_brno else None,  # 주문점번호 (체결 조회용)
+                order_tmd=order_tmd if order_tmd else None  # 주문시각
+            )
+            
+            execution_task = None
+            if save_success:
+                logger.info(f"[{function_name}] 📝 {stock_name}({ticker}) 주문 접수 기록 저장 완료")
+                
+                # 주문번호가 유효한 경우 체결 확인 (백그라운드)
+                if order_no and order_no != "N/A":
+                    logger.info(f"[{function_name}]    ⏳ 체결 여부 확인 중... (5초 후 확인)")
+                    
+                    # 비동기로 체결 확인 (다음 종목 매수를 막지 않음)
+                    # 주문 접수 전 보유 수량 전달 (체결 확인용)
+                    # 체결 확인마다 제한 시간을 따로 적용 (시간 초과 시 해당 확인만 취소)
+                    execution_task = asyncio.create_task(asyncio.wait_for(
+                        self._check_and_update_execution(
+                            order_no=order_no,
+                            ticker=ticker,
+                            stock_name=stock_name,
+                            function_name=function_name,
+                            before_quantity=order["before_quantity"],
+                            order_quantity=quantity,
+                            fill_check_holdings=fill_check_holdings
+                        ),
+                        timeout=SchedulerConfig.EXECUTION_CHECK_TIMEOUT_SECONDS
+                    ))
+                else:
+                    logger.warning(f"[{function_name}] ⚠️ 주문번호를 확인할 수 없어 체결 확인을 건너뜁니다.")
+            else:
+                logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 주문 접수 기록 저장 실패")
+            
+            return True, execution_task
+        else:
+            error_msg = order_result.get('msg1', '알 수 없는 오류')
+            error_code = order_result.get('msg_cd', 'N/A')
+            logger.error(f"[{function_name}] ❌ {stock_name}({ticker}) 매수 주문 실패: {error_msg} (오류코드: {error_code})")
+            
+            # 주문 실패 시 Slack 알림 전송
+            await asyncio.to_thread(
+                slack_notifier.send_buy_notification,
+                stock_name=stock_name,
+                ticker=ticker,
+                quantity=quantity,
+                price=current_price,
+                exchange_code=exchange_code,
+                success=False,
+                error_message=f"{error_msg} (오류코드: {error_code})"
+            )
+            logger.info(f"[{function_name}] 📨 {stock_name}({ticker}) 주문 실패 Slack 알림 전송 완료")
+            
+            return False, None
+
+    async def _place_order_rate_limited(self, order_data: dict, limiter: _AsyncRateLimiter) -> dict:
+        """
+        속도 제한 안에서 해외주식 주문 실행 (워커 스레드에서 실행)
+        
+        주문이 Rate limiting 에러(EGW00201)로 거부된 경우에만 지수 백오프 후 다시 주문합니다.
+        (거부된 주문은 접수되지 않으므로 재주문해도 중복 주문이 되지 않음)
+        """
+        max_retries = SchedulerConfig.ORDER_RATE_LIMIT_MAX_RETRIES
+        for attempt in range(max_retries + 1):
+            async with limiter:
+                order_result = await asyncio.to_thread(order_overseas_stock, order_data)
+            if order_result.get("msg_cd") != KIS_RATE_LIMIT_MSG_CD or attempt == max_retries:
+                return order_result
+            delay = SchedulerConfig.ORDER_RATE_LIMIT_BACKOFF_SECONDS * (2 ** attempt)
+            logger.warning(f"[_place_order_rate_limited] {order_data.get('PDNO')} 주문 Rate limiting 에러, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+        return order_result
+
+    async def _prefetch_current_prices(self, targets):
+        """
+        (현재가 조회용 거래소 코드, 티커) 목록의 현재가를 동시에 조회하여 현재가 캐시에 저장
+        
+        MAX_CONCURRENT_PRICE_FETCHES로 동시 호출 수를 제한하며, 조회 실패는 무시합니다.
+        (실패한 종목은 매수 루프에서 다시 조회하여 기존과 같이 처리)
+        """
+        semaphore = asyncio.Semaphore(SchedulerConfig.MAX_CONCURRENT_PRICE_FETCHES)
+        
+        async def prefetch(exchange: str, ticker: str):
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self._get_current_price_cached, {"AUTH": "", "EXCD": exchange, "SYMB": ticker})
+                except Exception as e:
+                    logger.debug(f"[_prefetch_current_prices] {ticker}({exchange}) 현재가 선조회 실패 (무시): {str(e)}")
+        
+        await asyncio.gather(*(prefetch(exchange, ticker) for exchange, ticker in targets))
+
+    def _get_current_price_cached(self, price_params: dict) -> dict:
+        """
+        현재가 조회 (같은 거래소/티커 조회를 PRICE_CACHE_TTL_SECONDS 동안 재사용)
+        
+        매수와 미체결 재주문 경로에서 같은 종목을 연달아 조회할 때 KIS API 호출을 줄입니다.
+        조회 실패 응답은 캐시하지 않습니다. (매도 경로는 매 실행마다 새로 조회)
+        """
+        key = (price_params["EXCD"], price_params["SYMB"])
+        now = time.monotonic()
+        cached = self._price_cache.get(key)
+        if cached is not None and now - cached[0] < SchedulerConfig.PRICE_CACHE_TTL_SECONDS:
+            return cached[1]
+        result = get_current_price(price_params)
+        if result.get("rt_cd") == "0":
+            self._price_cache[key] = (now, result)
+        return result
+
+    def _get_trailing_stop_service(self, user_id: str) -> TrailingStopService:
+        """사용자별 트레일링 스톱 서비스 반환 (최초 요청 시 생성 후 재사용)"""
+        service = self._trailing_stop_services.get(user_id)
+        if service is None:
+            service = self._trailing_stop_services.setdefault(user_id, TrailingStopService(user_id=user_id))
+        return service
+
+    def _get_holdings_cached(self) -> Dict[str, dict]:
+        """
+        해외 잔고를 조회하여 티커별 보유 종목 반환 (짧은 TTL 동안 조회 결과 재사용)
+        
+        매도 실행 중 트레일링 스톱 갱신과 여러 부분 익절 종목이 같은 잔고를 다시 조회하지 않도록
+        BALANCE_CACHE_TTL_SECONDS 동안 결과를 재사용합니다. 조회 실패 결과는 캐시하지 않습니다.
+        """
+        holdings, loaded_at = self._holdings_cache
+        now = time.monotonic()
+        if holdings is not None and now - loaded_at < SchedulerConfig.BALANCE_CACHE_TTL_SECONDS:
+            return holdings
+        balance_result = get_overseas_balance()
+        if balance_result.get("rt_cd") != "0":
+            return {}
+        holdings = _index_holdings(balance_result.get("output1", []))
+        self._holdings_cache = (holdings, now)
+        return holdings
+
     def _save_trading_log(
         self,
         order_type: str,
@@ -3135,7 +3481,6 @@ class StockScheduler:
                 return False
 
             # 현재 사용자 ID 가져오기
-            from app.utils.user_context import get_current_user_id
             current_user_id = get_current_user_id()
             
             log_data = {
@@ -3225,31 +3570,24 @@ def get_scheduler_status():
 
 def run_auto_buy_now():
     """즉시 매수 실행 함수 (테스트용) - 슬랙 알림 없음"""
-    import asyncio
+    coro = stock_scheduler._execute_auto_buy(send_slack_notification=False)
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # 이미 실행 중인 루프가 있으면 create_task 사용
-            asyncio.create_task(stock_scheduler._execute_auto_buy(send_slack_notification=False))
-        else:
-            # 실행 중인 루프가 없으면 asyncio.run 사용
-            asyncio.run(stock_scheduler._execute_auto_buy(send_slack_notification=False))
+        asyncio.get_running_loop()
     except RuntimeError:
-        # RuntimeError 발생 시 새 스레드에서 실행
-        import threading
-        def run_in_thread():
-            asyncio.run(stock_scheduler._execute_auto_buy(send_slack_notification=False))
-        thread = threading.Thread(target=run_in_thread)
-        thread.start()
-        thread.join()
+        # 실행 중인 루프가 없는 동기 호출: 스케줄러 루프 또는 asyncio.run으로 완료까지 실행
+        return stock_scheduler._run_coroutine_sync(coro)
+    # 비동기 핸들러에서 호출된 경우: 현재 루프에 태스크로 등록하고 바로 반환
+    asyncio.create_task(coro)
     
 def run_auto_sell_now():
     """즉시 매도 실행 함수 (테스트용)"""
-    stock_scheduler._run_auto_sell()
+    return stock_scheduler._run_coroutine_sync(stock_scheduler._run_auto_sell())
 
 def run_vertex_ai_prediction_now(send_slack_notification: bool = False):
     """즉시 Vertex AI 주가 예측 작업 실행 함수 (API 호출용)"""
-    return stock_scheduler._run_vertex_ai_prediction(send_slack_notification=send_slack_notification)
+    return stock_scheduler._run_coroutine_sync(
+        stock_scheduler._run_vertex_ai_prediction(send_slack_notification=send_slack_notification)
+    )
 
 def run_analysis_now(send_slack_notification: bool = False):
     """즉시 분석 실행 함수 (API 호출용)"""
@@ -3258,7 +3596,9 @@ def run_analysis_now(send_slack_notification: bool = False):
 
 def run_economic_data_update_now():
     """즉시 경제 데이터 업데이트 실행 함수 (테스트용) - 슬랙 알림 없음"""
-    return stock_scheduler._run_economic_data_update(send_slack_notification=False)
+    return stock_scheduler._run_coroutine_sync(
+        stock_scheduler._run_economic_data_update(send_slack_notification=False)
+    )
 
 # 타임아웃 방지를 위한 커스텀 StreamHandler
 class SafeStreamHandler(logging.StreamHandler):
@@ -3303,8 +3643,7 @@ def send_scheduler_slack_notification(message: str) -> bool:
             if "실행 시간:" in message or "시작:" in message or "완료:" in message:
                 formatted_message = f"📅 *스케줄러 알림*\n{message}"
             else:
-                now_korea = datetime.now(pytz.timezone('Asia/Seoul'))
-                formatted_message = f"📅 *스케줄러 알림*\n{message}\n\n🕒 알림 전송 시간: {now_korea.strftime('%Y-%m-%d %H:%M:%S')} (KST)"
+                formatted_message = f"📅 *스케줄러 알림*\n{message}\n\n🕒 알림 전송 시간: {_korea_now_str()} (KST)"
             
             payload = {"text": formatted_message}
             with httpx.Client(timeout=10.0) as client:
@@ -3327,4 +3666,14 @@ def send_scheduler_slack_notification(message: str) -> bool:
                 return False
     
     return False
+
+
+async def _notify_slack(message: str) -> bool:
+    """
+    스케줄러 Slack 알림을 워커 스레드에서 전송 (비동기 작업용)
+    
+    send_scheduler_slack_notification은 HTTP 요청과 재시도 대기(time.sleep)를 포함하므로
+    이벤트 루프에서 직접 호출하면 같은 루프의 매도 작업 등 다른 작업이 멈춥니다.
+    """
+    return await asyncio.to_thread(send_scheduler_slack_notification, message)
  
\ No newline at end of file
@@ -410,6 +410,77 @@ class SlackNotifier:
         
         return self.send_message(text, blocks, webhook_type='trading')
     
+    def send_sell_batch_notification(self, sells: list) -> bool:
+        """
+        여러 건의 매도 체결을 하나의 메시지로 전송합니다.
+        
+        Args:
+            sells: 매도 정보 목록 (각 항목은 send_sell_notification의 인자와 같은 키를 가진 dict)
+        
+        Returns:
+            bool: 전송 성공 여부 (1건이면 단건 매도 알림으로 전송)
+        """
+        if not self.trading_enabled or not sells:
+            return False
+        
+        if len(sells) == 1:
+            return self.send_sell_notification(**sells[0])
+        
+        total_amount = 0.0
+        sell_blocks = []
+        for sell in sells:
+            price = sell.get("price") or 0.0
+            amount = sell["quantity"] * price
+            total_amount += amount
+            reasons_text = ", ".join(sell.get("sell_reasons") or []) or "정보 없음"
+            sell_blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": (
+                        f"*{sell['stock_name']}* ({sell['ticker']}, {sell['exchange_code']})\n"
+                        f"{sell['quantity']}주 @ ${price:,.2f} = ${amount:,.2f}\n"
+                        f"*매도 이유:* {reasons_text}"
+                    )
+                }
+            })
+        
+        title = f"💰 주식 매도 체결 ({len(sells)}건)"
+        blocks = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": title,
+                    "emoji": True
+                }
+            },
+            # Slack 메시지 블록은 최대 50개이므로 헤더/요약/시각 블록을 제외한 나머지만 종목별로 표시
+            *sell_blocks[:45],
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*총 매도 금액:* ${total_amount:,.2f}"
+                    + (f" (외 {len(sell_blocks) - 45}건 생략)" if len(sell_blocks) > 45 else "")
+                }
+            },
+            {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"🕒 시각: {self._get_current_time()}"
+                    }
+                ]
+            }
+        ]
+        
+        # 간단한 텍스트 메시지 (알림용)
+        text = f"{title}: " + ", ".join(f"{sell['stock_name']}({sell['ticker']}) {sell['quantity']}주" for sell in sells)
+        
+        return self.send_message(text, blocks, webhook_type='trading')
+    
     def send_analysis_notification(
         self,
         analysis_type: str,
@@ -8,6 +8,7 @@ ContextVar를 사용하여 요청별로 격리된 사용자 컨텍스트를 관
 """
 
 import logging
+import sys
 from typing import Optional, List
 from contextvars import ContextVar
 import pymongo.errors
@@ -32,7 +33,7 @@ def get_default_user_id() -> str:
     """
     # settings 객체에서 가져오기 (환경변수는 Pydantic이 자동으로 로드)
     if settings.DEFAULT_USER_ID:
-        return settings.DEFAULT_USER_ID
+        return sys.intern(settings.DEFAULT_USER_ID)
     
     # 기본값 (하위 호환성)
     return "lian"
@@ -44,6 +45,7 @@ def get_current_user_id() -> str:
     
     ContextVar에서 현재 요청의 user_id를 가져옵니다.
     설정되어 있지 않으면 기본 사용자 ID를 반환합니다.
+    반환되는 user_id는 intern된 문자열이므로 동일 사용자 비교 시 `is` 검사가 가능합니다.
     
     Returns:
         현재 사용자 ID (ContextVar가 None이면 기본 사용자 ID 반환)
@@ -72,7 +74,8 @@ def set_global_user_context(user_id: Optional[str] = None):
         user_id = get_default_user_id()
         logger.debug(f"user_id가 None이므로 기본 사용자 ID 사용: {user_id}")
     
-    _user_context_var.set(user_id)
+    # 설정 시점에 intern하여 get_current_user_id()가 항상 같은 객체를 반환하도록 함
+    _user_context_var.set(sys.intern(user_id))
     logger.debug(f"ContextVar에 user_id 설정 완료: {user_id}")
 
 
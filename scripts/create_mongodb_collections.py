@@ -418,7 +418,8 @@ def create_collections(clear_first=False):
             "stock_analysis",
             "sentiment_analysis",
             "trading_configs",
-            "trading_logs"
+            "trading_logs",
+            "trailing_stops"
         ]
         
         logger.info("\n" + "=" * 60)
@@ -437,7 +438,7 @@ def create_collections(clear_first=False):
         logger.info("=" * 60)
         
         # 기존 인덱스 정리 및 재생성
-        def create_index_safe(collection, index_spec, unique=False, name=None, sparse=False):
+        def create_index_safe(collection, index_spec, unique=False, name=None, sparse=False, partial_filter_expression=None):
             """인덱스 생성 (기존 인덱스가 있으면 삭제 후 재생성)"""
             try:
                 # 기존 인덱스 삭제
@@ -475,6 +476,8 @@ def create_collections(clear_first=False):
                 index_options = {"unique": unique, "name": name}
                 if sparse:
                     index_options["sparse"] = True
+                if partial_filter_expression:
+                    index_options["partialFilterExpression"] = partial_filter_expression
                 
                 collection.create_index(list(index_spec.items()), **index_options)
                 return True
@@ -487,6 +490,10 @@ def create_collections(clear_first=False):
         create_index_safe(db.stocks, {"ticker": 1}, unique=True, name="ticker_unique")
         create_index_safe(db.stocks, {"stock_name": 1}, unique=True, name="stock_name_unique")
         create_index_safe(db.stocks, {"is_active": 1}, unique=False, name="is_active_idx")
+        # 활성 종목 ticker/stock_name 조회용 커버드 인덱스
+        create_index_safe(db.stocks, {"is_active": 1, "is_etf": 1, "ticker": 1, "stock_name": 1}, unique=False, name="active_etf_ticker_name_idx")
+        # 레버리지 티커 -> 본주 티커 역매핑 조회용 (레버리지 티커가 있는 종목만 인덱싱)
+        create_index_safe(db.stocks, {"leverage_ticker": 1}, unique=False, name="leverage_ticker_idx", sparse=True)
         logger.info("✓ stocks 인덱스 생성 완료")
         
         # 2. users collection
@@ -513,6 +520,11 @@ def create_collections(clear_first=False):
         create_index_safe(db.daily_stock_data, {"recommendations": 1}, unique=False, name="recommendations_exists_idx", sparse=True)
         # 날짜 범위 조회 최적화 (recommendations 필드가 있는 문서만)
         create_index_safe(db.daily_stock_data, {"date": 1, "recommendations": 1}, unique=False, name="date_recommendations_idx")
+        # recommendations가 있는 문서만 담는 날짜 부분 인덱스 (존재 조건을 인덱스가 보장)
+        create_index_safe(
+            db.daily_stock_data, {"date": 1}, unique=False, name="date_with_recs",
+            partial_filter_expression={"recommendations": {"$exists": True}}
+        )
         # sentiment 필드 존재 여부로 필터링하는 쿼리를 위한 인덱스
         create_index_safe(db.daily_stock_data, {"sentiment": 1}, unique=False, name="sentiment_exists_idx", sparse=True)
         # 날짜 범위 조회 최적화 (sentiment 필드가 있는 문서만)
@@ -553,8 +565,12 @@ def create_collections(clear_first=False):
         create_index_safe(db.stock_recommendations, {"ticker": 1, "date": 1}, unique=True, name="ticker_date_unique")
         # 사용자별 날짜 역순 조회
         create_index_safe(db.stock_recommendations, {"user_id": 1, "date": -1}, unique=False, name="user_date_idx")
+        # 사용자+날짜별 ticker 조회 (동기화 확인용 커버드 인덱스)
+        create_index_safe(db.stock_recommendations, {"user_id": 1, "date": 1, "ticker": 1}, unique=False, name="user_date_ticker_idx")
         # 종목별 날짜 역순 조회 (시계열 분석용)
         create_index_safe(db.stock_recommendations, {"ticker": 1, "date": -1}, unique=False, name="ticker_date_idx")
+        # 사용자별 종목 추천 이력 조회 (ticker + user_id 일치, date 범위/정렬)
+        create_index_safe(db.stock_recommendations, {"ticker": 1, "user_id": 1, "date": 1}, unique=False, name="ticker_user_date_idx")
         # 날짜별 조회 최적화
         create_index_safe(db.stock_recommendations, {"date": -1}, unique=False, name="date_idx")
         # 추천 여부 필터링용 인덱스
@@ -601,6 +617,14 @@ def create_collections(clear_first=False):
         create_index_safe(db.trading_logs, {"order_type": 1, "created_at": -1}, unique=False, name="order_type_created_idx")
         logger.info("✓ trading_logs 인덱스 생성 완료")
         
+        # 14. trailing_stops collection
+        logger.info("trailing_stops collection 인덱스 생성 중...")
+        # 사용자+종목 기준 unique 인덱스 (upsert 및 단건 조회 최적화)
+        create_index_safe(db.trailing_stops, {"user_id": 1, "ticker": 1}, unique=True, name="user_ticker_unique")
+        # 활성 트레일링 스톱 ticker 목록 조회용 커버드 인덱스
+        create_index_safe(db.trailing_stops, {"user_id": 1, "is_active": 1, "ticker": 1}, unique=False, name="user_active_ticker_idx")
+        logger.info("✓ trailing_stops 인덱스 생성 완료")
+        
         logger.info("\n✅ 모든 컬렉션과 인덱스 생성 완료!")
         
         # 3단계: 기본 데이터 세팅
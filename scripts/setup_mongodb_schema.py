@@ -30,6 +30,13 @@ def create_indexes():
         db.stocks.create_index([("ticker", 1)], unique=True, name="ticker_unique")
         db.stocks.create_index([("stock_name", 1)], unique=True, name="stock_name_unique")
         db.stocks.create_index([("is_active", 1)], name="is_active_idx")
+        # 활성 종목 ticker/stock_name 조회용 커버드 인덱스
+        db.stocks.create_index(
+            [("is_active", 1), ("is_etf", 1), ("ticker", 1), ("stock_name", 1)],
+            name="active_etf_ticker_name_idx"
+        )
+        # 레버리지 티커 -> 본주 티커 역매핑 조회용 (레버리지 티커가 있는 종목만 인덱싱)
+        db.stocks.create_index([("leverage_ticker", 1)], name="leverage_ticker_idx", sparse=True)
         logger.info("✓ stocks 인덱스 생성 완료")
         
         # 2. users collection
@@ -60,6 +67,12 @@ def create_indexes():
         db.daily_stock_data.create_index([("recommendations", 1)], name="recommendations_exists_idx", sparse=True)
         # 날짜 범위 조회 최적화 (recommendations 필드가 있는 문서만)
         db.daily_stock_data.create_index([("date", 1), ("recommendations", 1)], name="date_recommendations_idx")
+        # recommendations가 있는 문서만 담는 날짜 부분 인덱스 (존재 조건을 인덱스가 보장)
+        db.daily_stock_data.create_index(
+            [("date", 1)],
+            name="date_with_recs",
+            partialFilterExpression={"recommendations": {"$exists": True}}
+        )
         # sentiment 필드 존재 여부로 필터링하는 쿼리를 위한 인덱스
         db.daily_stock_data.create_index([("sentiment", 1)], name="sentiment_exists_idx", sparse=True)
         # 날짜 범위 조회 최적화 (sentiment 필드가 있는 문서만)
@@ -104,8 +117,18 @@ def create_indexes():
         )
         # 사용자별 날짜 역순 조회
         db.stock_recommendations.create_index([("user_id", 1), ("date", -1)], name="user_date_idx")
+        # 사용자+날짜별 ticker 조회 (동기화 확인용 커버드 인덱스)
+        db.stock_recommendations.create_index(
+            [("user_id", 1), ("date", 1), ("ticker", 1)],
+            name="user_date_ticker_idx"
+        )
         # 종목별 날짜 역순 조회 (시계열 분석용)
         db.stock_recommendations.create_index([("ticker", 1), ("date", -1)], name="ticker_date_idx")
+        # 사용자별 종목 추천 이력 조회 (ticker + user_id 일치, date 범위/정렬)
+        db.stock_recommendations.create_index(
+            [("ticker", 1), ("user_id", 1), ("date", 1)],
+            name="ticker_user_date_idx"
+        )
         # 날짜별 조회 최적화
         db.stock_recommendations.create_index([("date", -1)], name="date_idx")
         # 추천 여부 필터링용 인덱스
@@ -162,6 +185,17 @@ def create_indexes():
         db.trading_logs.create_index([("order_type", 1), ("created_at", -1)], name="order_type_created_idx")
         logger.info("✓ trading_logs 인덱스 생성 완료")
         
+        # 14. trailing_stops collection
+        logger.info("trailing_stops collection 인덱스 생성 중...")
+        # 사용자+종목 기준 unique 인덱스 (upsert 및 단건 조회 최적화)
+        db.trailing_stops.create_index([("user_id", 1), ("ticker", 1)], unique=True, name="user_ticker_unique")
+        # 활성 트레일링 스톱 ticker 목록 조회용 커버드 인덱스
+        db.trailing_stops.create_index(
+            [("user_id", 1), ("is_active", 1), ("ticker", 1)],
+            name="user_active_ticker_idx"
+        )
+        logger.info("✓ trailing_stops 인덱스 생성 완료")
+        
         logger.info("\n✅ 모든 인덱스 생성 완료!")
         
         # 인덱스 목록 출력
@@ -169,7 +203,8 @@ def create_indexes():
         collections = [
             "stocks", "users", "user_stocks", "economic_data", "daily_stock_data",
             "fred_indicators", "yfinance_indicators", "stock_recommendations",
-            "stock_analysis", "stock_predictions", "sentiment_analysis", "trading_configs", "trading_logs"
+            "stock_analysis", "stock_predictions", "sentiment_analysis", "trading_configs", "trading_logs",
+            "trailing_stops"
         ]
         
         for collection_name in collections:
@@ -0,0 +1,57 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# 프로젝트 루트 디렉토리를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils import auth
+
+
+class TestVerifyUserExists(unittest.TestCase):
+    """사용자 존재 확인 캐시 테스트"""
+
+    def setUp(self):
+        auth.invalidate_user_exists_cache()
+
+    def tearDown(self):
+        auth.invalidate_user_exists_cache()
+
+    @patch('app.utils.auth.get_db')
+    def test_existing_user_is_cached(self, mock_get_db):
+        mock_db = MagicMock()
+        mock_db.users.find_one.return_value = {"user_id": "lian"}
+        mock_get_db.return_value = mock_db
+
+        self.assertTrue(auth.verify_user_exists("lian"))
+        self.assertTrue(auth.verify_user_exists("lian"))
+
+        mock_db.users.find_one.assert_called_once_with({"user_id": "lian"}, {"_id": 0, "user_id": 1})
+
+    @patch('app.utils.auth.get_db')
+    def test_missing_user_is_not_cached(self, mock_get_db):
+        mock_db = MagicMock()
+        mock_db.users.find_one.return_value = None
+        mock_get_db.return_value = mock_db
+
+        self.assertFalse(auth.verify_user_exists("ghost"))
+        self.assertFalse(auth.verify_user_exists("ghost"))
+
+        self.assertEqual(mock_db.users.find_one.call_count, 2)
+
+    @patch('app.utils.auth.get_db')
+    def test_invalidate_forces_lookup(self, mock_get_db):
+        mock_db = MagicMock()
+        mock_db.users.find_one.return_value = {"user_id": "lian"}
+        mock_get_db.return_value = mock_db
+
+        auth.verify_user_exists("lian")
+        auth.invalidate_user_exists_cache("lian")
+        mock_db.users.find_one.return_value = None
+
+        self.assertFalse(auth.verify_user_exists("lian"))
+
+
+if __name__ == '__main__':
+    unittest.main()
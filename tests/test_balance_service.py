@@ -0,0 +1,59 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+# 프로젝트 루트 디렉토리를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import balance_service
+
+
+def _response(result):
+    response = MagicMock()
+    response.json.return_value = result
+    return response
+
+
+@patch('app.services.balance_service.time.sleep')
+class TestRequestWithRetry(unittest.TestCase):
+    """KIS API 재시도 테스트"""
+
+    def test_success_is_not_retried(self, mock_sleep):
+        send = MagicMock(return_value=_response({"rt_cd": "0"}))
+
+        self.assertEqual(balance_service._request_with_retry(send), {"rt_cd": "0"})
+        send.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_transient_errors_are_retried_with_backoff(self, mock_sleep):
+        send = MagicMock(side_effect=[
+            requests.ConnectionError("reset"),
+            _response({"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}),
+            _response({"rt_cd": "0"}),
+        ])
+
+        self.assertEqual(balance_service._request_with_retry(send, base_delay=0.5), {"rt_cd": "0"})
+        self.assertEqual(send.call_count, 3)
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertTrue(0.5 <= delays[0] < 0.7 and 1.0 <= delays[1] < 1.2)
+
+    def test_business_errors_are_returned_immediately(self, mock_sleep):
+        result = {"rt_cd": "1", "msg_cd": "APBK0918", "msg1": "장운영시간이 아닙니다."}
+        send = MagicMock(return_value=_response(result))
+
+        self.assertEqual(balance_service._request_with_retry(send), result)
+        send.assert_called_once()
+
+    def test_last_exception_is_raised(self, mock_sleep):
+        send = MagicMock(side_effect=requests.Timeout("timeout"))
+
+        with self.assertRaises(requests.Timeout):
+            balance_service._request_with_retry(send, max_retries=2)
+        self.assertEqual(send.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -273,7 +273,7 @@ class TestPartialProfitHistoryIntegration(unittest.TestCase):
         self.initial_quantity = 100
         self.user_id = "lian"
     
-    @patch('app.db.mongodb.get_db')
+    @patch('app.utils.scheduler.get_db')
     def test_initialize_partial_profit_history_after_buy(self, mock_get_db):
         """매수 후 부분 익절 히스토리 초기화 테스트"""
         from app.utils.scheduler import StockScheduler
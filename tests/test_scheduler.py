@@ -0,0 +1,445 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pytz
+
+# 프로젝트 루트 디렉토리를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils import scheduler
+from app.utils.scheduler import StockScheduler
+
+
+class TestNextDailyRun(unittest.TestCase):
+    """다음 실행 시각 계산 테스트"""
+
+    def setUp(self):
+        self.korea_tz = pytz.timezone('Asia/Seoul')
+
+    def test_later_today(self):
+        now = self.korea_tz.localize(datetime(2025, 1, 10, 22, 0, 0))
+        expected = self.korea_tz.localize(datetime(2025, 1, 10, 23, 5, 0))
+        self.assertEqual(scheduler._next_daily_run_timestamp("23:05", now), expected.timestamp())
+
+    def test_passed_time_runs_tomorrow(self):
+        now = self.korea_tz.localize(datetime(2025, 1, 10, 23, 5, 0))
+        expected = self.korea_tz.localize(datetime(2025, 1, 11, 23, 5, 0))
+        self.assertEqual(scheduler._next_daily_run_timestamp("23:05", now), expected.timestamp())
+
+
+class TestFailureTracking(unittest.TestCase):
+    """실패 추적 dict 만료 정리 테스트"""
+
+    def test_expired_entries_evicted_when_over_capacity(self):
+        failures = scheduler._TTLDict(ttl_seconds=60, max_size=2, timestamp_of=lambda value: value[1])
+        now = time.monotonic()
+        failures["OLD"] = (3, now - 120)
+        failures["RECENT"] = (1, now)
+        self.assertEqual(len(failures), 2)
+
+        failures["NEW"] = (1, now)
+
+        self.assertNotIn("OLD", failures)
+        self.assertEqual(set(failures), {"RECENT", "NEW"})
+
+
+class TestSlackMessages(unittest.TestCase):
+    """Slack 메시지 템플릿 테스트"""
+
+    def test_technical_done_message(self):
+        tech_result = {"data": [
+            {"날짜": "2025-01-10", "추천_여부": True},
+            {"날짜": "2025-01-10", "추천_여부": False},
+        ]}
+        self.assertEqual(
+            scheduler._technical_done_message(tech_result),
+            "📊 *기술적 지표 분석 완료*\n날짜: 2025-01-10\n분석 종목: 2개\n추천 종목: 1개"
+        )
+
+    def test_output_preview_keeps_tail(self):
+        limit = scheduler.SchedulerConfig.SLACK_OUTPUT_PREVIEW_CHARS
+        short = "ok"
+        self.assertIs(scheduler._output_preview(short), short)
+        self.assertEqual(scheduler._output_preview("a" + "b" * limit), "b" * limit)
+
+
+class TestPriceProbe(unittest.TestCase):
+    """거래소별 현재가 조회 결과 선택 테스트"""
+
+    def test_first_valid_exchange_in_priority_order(self):
+        results = [
+            {"rt_cd": "0", "output": {"last": "", "base": ""}},
+            RuntimeError("timeout"),
+            {"rt_cd": "0", "output": {"last": "101.5"}},
+        ]
+        self.assertEqual(
+            scheduler._select_price_result(["NAS", "AMS", "NYS"], results),
+            ("NYS", results[2])
+        )
+
+    def test_no_valid_result_returns_last_response(self):
+        results = [RuntimeError("timeout"), {"rt_cd": "1", "msg1": "초당 거래건수를 초과하였습니다."}]
+        self.assertEqual(scheduler._select_price_result(["NAS", "NYS"], results), (None, results[1]))
+
+    def test_parse_price(self):
+        self.assertEqual(scheduler._parse_price("101.5"), 101.5)
+        for value in ("", None, "0", "-1", "N/A"):
+            self.assertIsNone(scheduler._parse_price(value), value)
+
+    def test_default_exchange_probed_first(self):
+        self.assertEqual(scheduler._EXCHANGES_BY_DEFAULT["NYS"], ("NYS", "NAS", "AMS"))
+        self.assertEqual(scheduler._EXCHANGES_BY_DEFAULT["NAS"], scheduler._PRICE_EXCHANGES)
+
+    def test_probe_results_keep_exchange_order(self):
+        with patch('app.utils.scheduler.get_current_price', side_effect=lambda params: {"rt_cd": "0", "EXCD": params["EXCD"]}) as mock_price:
+            results = asyncio.run(scheduler._fetch_price_results("AAPL", ["NAS", "AMS", "NYS"]))
+
+        self.assertEqual([r["EXCD"] for r in results], ["NAS", "AMS", "NYS"])
+        self.assertEqual(mock_price.call_count, 3)
+
+    def test_shared_probes_reuse_same_exchange_lookup(self):
+        async def probe_twice():
+            probes = {}
+            first = await scheduler._fetch_price_results("AAPL", ["NAS", "AMS"], probes)
+            second = await scheduler._fetch_price_results("AAPL", ["AMS", "NAS"], probes)
+            return first, second
+
+        with patch('app.utils.scheduler.get_current_price', side_effect=lambda params: {"rt_cd": "0", "EXCD": params["EXCD"]}) as mock_price:
+            first, second = asyncio.run(probe_twice())
+
+        self.assertEqual([r["EXCD"] for r in second], ["AMS", "NAS"])
+        self.assertEqual(first[::-1], second)
+        self.assertEqual(mock_price.call_count, 2)
+
+
+class TestAutoSell(unittest.TestCase):
+    """자동 매도 처리 테스트"""
+
+    def setUp(self):
+        self.scheduler = StockScheduler()
+
+    def test_holdings_cached_within_ttl(self):
+        balance = {"rt_cd": "0", "output1": [{"ovrs_pdno": "AAPL", "ovrs_cblc_qty": "10"}]}
+        with patch('app.utils.scheduler.get_overseas_balance', return_value=balance) as mock_balance:
+            first = self.scheduler._get_holdings_cached()
+            second = self.scheduler._get_holdings_cached()
+            self.assertEqual(first["AAPL"]["ovrs_cblc_qty"], "10")
+            self.assertIs(first, second)
+            mock_balance.assert_called_once()
+
+            # TTL 만료 후 재조회
+            holdings, loaded_at = self.scheduler._holdings_cache
+            self.scheduler._holdings_cache = (holdings, loaded_at - scheduler.SchedulerConfig.BALANCE_CACHE_TTL_SECONDS)
+            self.scheduler._get_holdings_cached()
+            self.assertEqual(mock_balance.call_count, 2)
+
+    def test_current_price_cached_per_exchange_and_ticker(self):
+        params = {"AUTH": "", "EXCD": "NAS", "SYMB": "AAPL"}
+        with patch('app.utils.scheduler.get_current_price', return_value={"rt_cd": "0", "output": {"last": "100"}}) as mock_price:
+            self.scheduler._get_current_price_cached(params)
+            self.scheduler._get_current_price_cached(dict(params))
+            self.scheduler._get_current_price_cached({**params, "EXCD": "NYS"})
+
+        self.assertEqual(mock_price.call_count, 2)
+
+    def test_prefetched_prices_are_reused_by_buy_lookups(self):
+        with patch('app.utils.scheduler.get_current_price', return_value={"rt_cd": "0", "output": {"last": "100"}}) as mock_price:
+            asyncio.run(self.scheduler._prefetch_current_prices({("NAS", "AAPL"), ("NYS", "KO")}))
+            self.scheduler._get_current_price_cached({"AUTH": "", "EXCD": "NAS", "SYMB": "AAPL"})
+            self.scheduler._get_current_price_cached({"AUTH": "", "EXCD": "NYS", "SYMB": "KO"})
+
+        self.assertEqual(mock_price.call_count, 2)
+
+    def test_rate_limiter_allows_burst_then_paces(self):
+        async def run():
+            limiter = scheduler._AsyncRateLimiter(20)
+            started = time.monotonic()
+            for _ in range(22):
+                async with limiter:
+                    pass
+            return time.monotonic() - started
+
+        # 20개는 바로 통과, 이후 2개는 토큰이 채워질 때까지(약 0.1초) 대기
+        elapsed = asyncio.run(run())
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
+    def test_order_retried_only_on_rate_limit(self):
+        results = [{"rt_cd": "1", "msg_cd": "EGW00201"}, {"rt_cd": "0", "msg_cd": "APBK0013"}]
+        with patch('app.utils.scheduler.order_overseas_stock', side_effect=results) as mock_order, \
+                patch.object(scheduler.SchedulerConfig, 'ORDER_RATE_LIMIT_BACKOFF_SECONDS', 0):
+            result = asyncio.run(self.scheduler._place_order_rate_limited({"PDNO": "AAPL"}, scheduler._AsyncRateLimiter(10)))
+
+        self.assertEqual(result["rt_cd"], "0")
+        self.assertEqual(mock_order.call_count, 2)
+
+    def test_submit_buy_order_reports_result(self):
+        order = {
+            "candidate": {"composite_score": 1.0}, "ticker": "AAPL", "stock_name": "애플", "actual_ticker": "AAPL",
+            "pure_ticker": "AAPL", "exchange_code": "NASD", "quantity": 2, "current_price": 100.0,
+            "order_data": {"PDNO": "AAPL"}, "before_quantity": 0, "order_dt": "20250110",
+        }
+
+        async def check_execution(**kwargs):
+            return kwargs
+
+        async def run(order_result):
+            with patch('app.utils.scheduler.order_overseas_stock', return_value=order_result), \
+                    patch('app.utils.scheduler.slack_notifier'), \
+                    patch.object(self.scheduler, '_save_trading_log', return_value=True), \
+                    patch.object(self.scheduler, '_check_and_update_execution', side_effect=check_execution):
+                success, task = await self.scheduler._submit_buy_order(order, scheduler._AsyncRateLimiter(10), "test")
+                return success, (await task) if task else None
+
+        success, execution = asyncio.run(run({"rt_cd": "0", "output": {"ODNO": "0001"}}))
+        self.assertTrue(success)
+        self.assertEqual(execution["order_no"], "0001")
+        self.assertEqual(execution["order_quantity"], 2)
+
+        self.assertEqual(asyncio.run(run({"rt_cd": "1", "msg1": "잔고 부족"})), (False, None))
+
+    def test_buy_order_target(self):
+        self.assertEqual(scheduler._buy_order_target("KO.N"), ("NYSE", "KO", "NYS"))
+        self.assertEqual(scheduler._buy_order_target("AAPL.X"), ("NASD", "AAPL", "NAS"))
+        self.assertEqual(scheduler._buy_order_target("TQQQ"), ("NASD", "TQQQ", "NAS"))
+
+    def test_failed_balance_is_not_cached(self):
+        with patch('app.utils.scheduler.get_overseas_balance', return_value={"rt_cd": "1"}) as mock_balance:
+            self.assertEqual(self.scheduler._get_holdings_cached(), {})
+            self.assertEqual(self.scheduler._get_holdings_cached(), {})
+        self.assertEqual(mock_balance.call_count, 2)
+
+    def test_fill_check_holdings_shared_between_concurrent_checks(self):
+        balance = {"rt_cd": "0", "output1": [{"ovrs_pdno": "AAPL", "ovrs_cblc_qty": "3"}]}
+
+        async def run():
+            fill_check_holdings = scheduler._FillCheckHoldings()
+            not_before = time.monotonic()
+            first, second = await asyncio.gather(
+                fill_check_holdings.get(not_before),
+                fill_check_holdings.get(not_before),
+            )
+            # 대기 시작 이후에 조회된 스냅샷이 아니면 다시 조회
+            third = await fill_check_holdings.get(time.monotonic() + 1)
+            # 다른 매수 실행의 스냅샷은 공유하지 않음
+            other_run = await scheduler._FillCheckHoldings().get(not_before)
+            return first, second, third, other_run
+
+        with patch('app.utils.scheduler.get_all_overseas_balances', return_value=balance) as mock_balance:
+            first, second, third, other_run = asyncio.run(run())
+        self.assertEqual(first["AAPL"]["ovrs_cblc_qty"], "3")
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertIsNot(third, other_run)
+        self.assertEqual(mock_balance.call_count, 3)
+
+    def test_partial_sell_uses_pre_order_quantity_from_warm_cache(self):
+        # 매도 실행 시작 시 조회한 잔고(매도 전 10주)가 캐시에 남아 있는 상태
+        self.scheduler._holdings_cache = (
+            {"AAPL": {"ovrs_pdno": "AAPL", "ovrs_cblc_qty": "10", "pchs_avg_pric": "100"}},
+            time.monotonic()
+        )
+        candidate = {
+            "ticker": "AAPL",
+            "stock_name": "애플",
+            "exchange_code": "NASD",
+            "quantity": 3,
+            "sell_type": "partial_profit",
+            "partial_profit_info": {"stage": 1, "profit_percent": 5.0, "sell_quantity": 3},
+        }
+        priority_stats = {2: {"count": 0, "success": 0, "failed": 0, "name": "P2", "sold": []}}
+
+        async def run():
+            await self.scheduler._process_sell_candidate(
+                candidate, 2, priority_stats, asyncio.Semaphore(1), {}, False, {}
+            )
+
+        with patch('app.utils.scheduler._fetch_price_results', return_value=[]), \
+                patch('app.utils.scheduler._select_price_result', return_value=("NAS", {"rt_cd": "0", "output": {"last": "110"}})), \
+                patch('app.utils.scheduler.order_overseas_stock', return_value={"rt_cd": "0"}), \
+                patch('app.utils.scheduler.get_overseas_balance') as mock_balance, \
+                patch('app.utils.scheduler.get_current_user_id', return_value="lian"), \
+                patch('app.utils.scheduler.get_db') as mock_get_db, \
+                patch.object(self.scheduler, '_save_trading_log', return_value=True):
+            mock_get_db.return_value.partial_sell_history.find_one_and_update.return_value = {"is_completed": False}
+            asyncio.run(run())
+
+        mock_balance.assert_not_called()
+        pipeline = mock_get_db.return_value.partial_sell_history.find_one_and_update.call_args[0][1]
+        fields = pipeline[0]["$set"]
+        # 초기 수량은 주문 전 보유 수량, 남은 수량은 매도 수량을 뺀 값
+        self.assertEqual(fields["initial_quantity"], {"$ifNull": ["$initial_quantity", 10]})
+        self.assertEqual(fields["partial_sells"]["$concatArrays"][1]["$literal"][0]["remaining_quantity"], 7)
+        self.assertEqual(priority_stats[2]["success"], 1)
+
+    def test_candidates_processed_by_priority_with_bounded_concurrency(self):
+        candidates = [
+            {"ticker": "T1", "priority": 4},
+            {"ticker": "T2", "priority": 4},
+            {"ticker": "S1", "priority": 1},
+            {"ticker": "S2", "priority": 1},
+        ]
+        events = []
+        active = {"now": 0, "max": 0}
+
+        async def process(candidate, priority, priority_stats, semaphore, leverage_map, is_daytime_trading, price_probes):
+            self.assertEqual(leverage_map, {"T1": "BASE"})
+            priority_stats[priority]["sold"].append({"ticker": candidate["ticker"]})
+            async with semaphore:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+                events.append(("start", candidate["ticker"]))
+                await asyncio.sleep(0.01)
+                events.append(("end", candidate["ticker"]))
+                active["now"] -= 1
+
+        self.scheduler.auto_trading_service.get_auto_trading_config = lambda user_id: {"auto_trading_enabled": True}
+        self.scheduler.recommendation_service.get_stocks_to_sell = lambda: {"sell_candidates": candidates}
+        with patch.object(self.scheduler, '_process_sell_candidate', side_effect=process), \
+                patch('app.utils.scheduler.set_global_user_context'), \
+                patch('app.utils.scheduler.get_db') as mock_get_db, \
+                patch('app.utils.scheduler.slack_notifier') as mock_slack, \
+                patch.object(scheduler.SchedulerConfig, 'MAX_CONCURRENT_SELL', 1):
+            mock_get_db.return_value.stocks.find.return_value = [{"ticker": "BASE", "leverage_ticker": "T1"}]
+            asyncio.run(self.scheduler._execute_auto_sell_for_user("lian"))
+
+        # 레버리지 티커는 한 번의 $in 쿼리로 조회
+        mock_get_db.return_value.stocks.find.assert_called_once_with(
+            {"leverage_ticker": {"$in": ["T1", "T2", "S1", "S2"]}},
+            {"_id": 0, "ticker": 1, "leverage_ticker": 1}
+        )
+        started = [ticker for kind, ticker in events if kind == "start"]
+        self.assertEqual(set(started[:2]), {"S1", "S2"})
+        self.assertEqual(active["max"], 1)
+        # 매도 알림은 우선순위별로 한 번씩 모아서 전송
+        batches = [call.args[0] for call in mock_slack.send_sell_batch_notification.call_args_list]
+        self.assertEqual([sorted(sell["ticker"] for sell in batch) for batch in batches], [["S1", "S2"], ["T1", "T2"]])
+
+
+class TestStockSchedulerLoop(unittest.TestCase):
+    """스케줄러 이벤트 루프 테스트"""
+
+    def setUp(self):
+        self.scheduler = StockScheduler()
+
+    def test_daily_job_table_methods_exist(self):
+        for time_str, method_name, _ in StockScheduler.DAILY_JOBS:
+            self.assertTrue(callable(getattr(self.scheduler, method_name)), method_name)
+            self.assertRegex(time_str, r"^\d{2}:\d{2}$")
+
+    def test_daily_jobs_run_in_order_when_due(self):
+        calls = []
+
+        async def run_until_two_jobs():
+            done = asyncio.Event()
+
+            def first_job():
+                calls.append("first")
+
+            async def second_job():
+                calls.append("second")
+                done.set()
+
+            task = asyncio.create_task(self.scheduler._run_daily_jobs([
+                ("23:00", first_job),
+                ("23:00", second_job),
+            ]))
+            await asyncio.wait_for(done.wait(), timeout=5)
+            task.cancel()
+
+        # 첫 계산은 즉시 실행, 실행 후 다음 실행 시각은 먼 미래로 설정
+        due_times = iter([time.time(), time.time(), time.time() + 3600, time.time() + 3600])
+        with patch('app.utils.scheduler._next_daily_run_timestamp', side_effect=lambda *_: next(due_times)):
+            asyncio.run(run_until_two_jobs())
+
+        self.assertEqual(calls, ["first", "second"])
+
+    def test_23_00_tasks_run_concurrently(self):
+        started = []
+
+        async def economic(send_slack_notification=True):
+            started.append("economic")
+            await asyncio.sleep(0.05)
+            return True
+
+        async def prediction(send_slack_notification=True):
+            started.append("prediction")
+            raise RuntimeError("prediction failed")
+
+        with patch.object(self.scheduler, '_run_economic_data_update', side_effect=economic), \
+                patch.object(self.scheduler, '_run_vertex_ai_prediction', side_effect=prediction):
+            result = self.scheduler._run_coroutine_sync(
+                self.scheduler._run_23_00_tasks(send_slack_notification=False)
+            )
+
+        self.assertFalse(result)
+        self.assertEqual(sorted(started), ["economic", "prediction"])
+
+    def test_parallel_analysis_reports_first_finished_branch_early(self):
+        sentiment_release = threading.Event()
+        notifications = []
+
+        def technical(send_slack_notification=True):
+            return {"message": "tech done", "data": []}
+
+        def sentiment():
+            # 기술적 지표 알림이 먼저 전송되어야 감정 분석이 끝남
+            self.assertTrue(sentiment_release.wait(timeout=5))
+            return {"message": "sentiment done"}
+
+        def notify(message):
+            notifications.append(message)
+            if "기술적 지표 분석 완료" in message:
+                sentiment_release.set()
+            return True
+
+        service = self.scheduler.recommendation_service
+        with patch.object(service, 'generate_technical_recommendations', side_effect=technical), \
+                patch.object(service, 'fetch_and_store_sentiment_independent', side_effect=sentiment), \
+                patch('app.utils.scheduler.send_scheduler_slack_notification', side_effect=notify):
+            result = self.scheduler._run_coroutine_sync(self.scheduler._run_parallel_analysis())
+
+        self.assertTrue(result)
+        self.assertIn("기술적 지표 분석 완료", notifications[1])
+        self.assertIn("sentiment done", notifications[2])
+
+    def test_duplicate_prediction_is_skipped(self):
+        self.scheduler._locks["prediction"].acquire()
+        try:
+            self.assertTrue(self.scheduler.prediction_executing)
+            result = self.scheduler._run_coroutine_sync(
+                self.scheduler._run_vertex_ai_prediction(send_slack_notification=False)
+            )
+        finally:
+            self.scheduler._locks["prediction"].release()
+
+        self.assertFalse(result)
+        self.assertFalse(self.scheduler.prediction_executing)
+
+    def test_run_coroutine_sync_inside_running_loop(self):
+        async def value():
+            return 42
+
+        async def call_from_async_handler():
+            return self.scheduler._run_coroutine_sync(value())
+
+        self.assertEqual(asyncio.run(call_from_async_handler()), 42)
+
+    def test_sell_scheduler_starts_and_stops_loop_thread(self):
+        self.assertTrue(self.scheduler.start_sell_scheduler())
+        self.assertIsNotNone(self.scheduler.scheduler_thread)
+        thread = self.scheduler.scheduler_thread
+
+        self.assertTrue(self.scheduler.stop_sell_scheduler())
+        self.assertIsNone(self.scheduler.scheduler_thread)
+        self.assertFalse(thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# 프로젝트 루트 디렉토리를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import stock_service
+
+
+class TestActiveStocksCache(unittest.TestCase):
+    """활성 종목 캐시 테스트"""
+
+    def setUp(self):
+        stock_service.invalidate_active_stocks_cache()
+        self.stocks = [
+            {"ticker": "AAPL", "stock_name": "애플"},
+            {"ticker": "MSFT", "stock_name": "마이크로소프트"},
+        ]
+
+    def tearDown(self):
+        stock_service.invalidate_active_stocks_cache()
+
+    def _mock_db(self):
+        mock_db = MagicMock()
+        mock_db.stocks.find.return_value.batch_size.return_value = iter(self.stocks)
+        return mock_db
+
+    @patch('app.services.stock_service.get_db')
+    def test_helpers_share_single_query(self, mock_get_db):
+        mock_db = self._mock_db()
+        mock_get_db.return_value = mock_db
+
+        self.assertEqual(stock_service.get_active_tickers(), ["AAPL", "MSFT"])
+        self.assertEqual(stock_service.get_active_stock_names(), ["애플", "마이크로소프트"])
+        self.assertEqual(stock_service.get_ticker_to_stock_mapping(), {"AAPL": "애플", "MSFT": "마이크로소프트"})
+        self.assertEqual(stock_service.get_stock_to_ticker_mapping(), {"애플": "AAPL", "마이크로소프트": "MSFT"})
+
+        # 캐시가 유효한 동안에는 한 번만 조회
+        mock_db.stocks.find.assert_called_once()
+        args, _ = mock_db.stocks.find.call_args
+        self.assertEqual(args[1], {"ticker": 1, "stock_name": 1, "_id": 0})
+
+    @patch('app.services.stock_service.get_db')
+    def test_cache_is_keyed_by_exclude_etf(self, mock_get_db):
+        mock_db = self._mock_db()
+        mock_get_db.return_value = mock_db
+
+        stock_service.get_active_tickers(exclude_etf=False)
+        mock_db.stocks.find.return_value.batch_size.return_value = iter(self.stocks[:1])
+        self.assertEqual(stock_service.get_active_tickers(exclude_etf=True), ["AAPL"])
+
+        self.assertEqual(mock_db.stocks.find.call_count, 2)
+        args, _ = mock_db.stocks.find.call_args
+        self.assertEqual(args[0], {"is_active": True, "is_etf": {"$ne": True}})
+
+    @patch('app.services.stock_service.get_db')
+    def test_invalidate_forces_reload(self, mock_get_db):
+        mock_db = self._mock_db()
+        mock_get_db.return_value = mock_db
+
+        stock_service.get_active_tickers()
+        stock_service.invalidate_active_stocks_cache()
+        mock_db.stocks.find.return_value.batch_size.return_value = iter(self.stocks)
+        stock_service.get_active_tickers()
+
+        self.assertEqual(mock_db.stocks.find.call_count, 2)
+
+    @patch('app.services.stock_service.get_db')
+    def test_db_unavailable_is_not_cached(self, mock_get_db):
+        mock_get_db.return_value = None
+        self.assertEqual(stock_service.get_active_tickers(), [])
+
+        mock_get_db.return_value = self._mock_db()
+        self.assertEqual(stock_service.get_active_tickers(), ["AAPL", "MSFT"])
+
+    @patch('app.services.stock_service.get_db')
+    def test_single_lookups_use_cached_maps(self, mock_get_db):
+        mock_db = self._mock_db()
+        mock_get_db.return_value = mock_db
+
+        self.assertEqual(stock_service.get_ticker_from_stock_name("애플"), "AAPL")
+        self.assertEqual(stock_service.get_stock_name_from_ticker("MSFT"), "마이크로소프트")
+        self.assertIsNone(stock_service.get_stock_name_from_ticker("TSLA"))
+        self.assertTrue(stock_service.is_ticker_active("AAPL"))
+        self.assertFalse(stock_service.is_ticker_active("TSLA"))
+        self.assertTrue(stock_service.is_stock_name_active("마이크로소프트"))
+
+        mock_db.stocks.find.assert_called_once()
+        mock_db.stocks.find_one.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,7 +44,7 @@ class TestTrailingStopService(unittest.TestCase):
         mock_db = MagicMock()
         mock_get_db.return_value = mock_db
         
-        # 기존 데이터 시뮬레이션
+        # 갱신 전 데이터 시뮬레이션 (find_one_and_update는 갱신 전 문서 반환)
         existing_stop = {
             "_id": "mock_id",
             "ticker": self.ticker,
@@ -53,16 +53,24 @@ class TestTrailingStopService(unittest.TestCase):
             "trailing_distance_percent": 5.0,
             "is_active": True
         }
-        mock_db.trailing_stops.find_one.return_value = existing_stop
-        
-        # 1. 가격 상승 -> 갱신 성공
-        self.service.update_highest_price(self.ticker, 110.0)
-        mock_db.trailing_stops.update_one.assert_called()
+        mock_db.trailing_stops.find_one_and_update.return_value = existing_stop
         
-        # 2. 가격 하락 -> 갱신 안 함 (현재 최고가 100.0보다 낮은 95.0으로 시도)
-        mock_db.trailing_stops.update_one.reset_mock()
-        self.service.update_highest_price(self.ticker, 95.0)
+        # 1. 가격 상승 -> 단일 원자적 갱신
+        result = self.service.update_highest_price(self.ticker, 110.0)
+        mock_db.trailing_stops.find_one_and_update.assert_called_once()
+        mock_db.trailing_stops.find_one.assert_not_called()
         mock_db.trailing_stops.update_one.assert_not_called()
+        self.assertEqual(result['highest_price'], 110.0)
+        self.assertAlmostEqual(result['dynamic_stop_price'], 104.5)
+        
+        # 갱신 조건은 서버에서 검사 (최고가 미만 + 동적 익절가 상향)
+        args, kwargs = mock_db.trailing_stops.find_one_and_update.call_args
+        self.assertEqual(args[0]['highest_price'], {"$lt": 110.0})
+        self.assertIn('$expr', args[0])
+        
+        # 2. 가격 하락 -> 조건 불일치로 갱신 안 됨
+        mock_db.trailing_stops.find_one_and_update.return_value = None
+        self.assertIsNone(self.service.update_highest_price(self.ticker, 95.0))
 
     @patch('app.services.trailing_stop_service.get_db')
     @patch('app.services.auto_trading_service.AutoTradingService.get_auto_trading_config')
@@ -130,6 +138,77 @@ class TestTrailingStopService(unittest.TestCase):
         existing_stop["purchase_price"] = 103.0
         self.assertFalse(self.service.check_trailing_stop_triggered(self.ticker, 107.0))
 
+    @patch('app.services.trailing_stop_service.get_db')
+    @patch('app.services.auto_trading_service.AutoTradingService.get_auto_trading_config')
+    def test_bulk_check_triggered(self, mock_get_config, mock_get_db):
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+        mock_get_config.return_value = {
+            "trailing_stop_enabled": True,
+            "trailing_stop_min_profit_percent": 3.0
+        }
+        
+        # 활성 트레일링 스톱 조회 결과 시뮬레이션
+        mock_db.trailing_stops.find.return_value = [
+            {"ticker": "AAPL", "purchase_price": 100.0, "highest_price": 120.0, "dynamic_stop_price": 114.0},
+            {"ticker": "MSFT", "purchase_price": 100.0, "highest_price": 130.0, "dynamic_stop_price": 123.5},
+        ]
+        
+        results = self.service.bulk_check_triggered({"AAPL": 113.0, "MSFT": 130.0, "TSLA": 200.0})
+        
+        # 설정 1회, find 1회 (조회 전용이므로 최고가 갱신 없음)
+        mock_get_config.assert_called_once()
+        mock_db.trailing_stops.find.assert_called_once()
+        mock_db.trailing_stops.find_one.assert_not_called()
+        mock_db.trailing_stops.bulk_write.assert_not_called()
+        mock_db.trailing_stops.update_one.assert_not_called()
+        
+        self.assertTrue(results["AAPL"]["triggered"])
+        self.assertFalse(results["MSFT"]["triggered"])
+        self.assertNotIn("TSLA", results)
+
+    @patch('app.services.trailing_stop_service.get_db')
+    def test_bulk_update_highest_prices(self, mock_get_db):
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+        mock_db.trailing_stops.bulk_write.return_value.modified_count = 1
+        
+        self.assertEqual(self.service.bulk_update_highest_prices({"AAPL": 113.0, "TSLA": 200.0}), 1)
+        
+        # 활성 목록 조회나 갱신 후 조회 없이 bulk_write 1회만 전송
+        mock_db.trailing_stops.bulk_write.assert_called_once()
+        mock_db.trailing_stops.find.assert_not_called()
+        operations = mock_db.trailing_stops.bulk_write.call_args[0][0]
+        self.assertEqual(len(operations), 2)
+        self.assertTrue(all(op._filter["is_active"] for op in operations))
+        
+        self.assertEqual(self.service.bulk_update_highest_prices({}), 0)
+        mock_db.trailing_stops.bulk_write.assert_called_once()
+
+    @patch('app.services.trailing_stop_service.get_db')
+    @patch('app.services.auto_trading_service.AutoTradingService.get_auto_trading_config')
+    def test_bulk_check_triggered_disabled(self, mock_get_config, mock_get_db):
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+        mock_get_config.return_value = {"trailing_stop_enabled": False}
+        
+        self.assertEqual(self.service.bulk_check_triggered({"AAPL": 113.0}), {})
+        mock_db.trailing_stops.find.assert_not_called()
+
+    @patch('app.services.auto_trading_service.AutoTradingService.get_auto_trading_config')
+    def test_config_is_cached(self, mock_get_config):
+        mock_get_config.return_value = {"trailing_stop_enabled": True}
+        
+        self.service._get_config()
+        self.service._get_config()
+        mock_get_config.assert_called_once()
+        
+        # TTL 만료 후 재조회
+        config, loaded_at = self.service._config_cache
+        self.service._config_cache = (config, loaded_at - 10)
+        self.service._get_config()
+        self.assertEqual(mock_get_config.call_count, 2)
+
     @patch('app.services.trailing_stop_service.get_db')
     def test_deactivate_trailing_stop(self, mock_get_db):
         mock_db = MagicMock()